@@ -23,13 +23,12 @@ async def export_topics_for_notebooklm():
     print("🔍 Gathering trending topics for Desi community...")
 
     # Initialize aggregators
-    ranker = ContentRanker(
+    # Get topics
+    async with ContentRanker(
         supabase_url=os.getenv("SUPABASE_URL"),
         supabase_key=os.getenv("SUPABASE_SERVICE_KEY"),
-    )
-
-    # Get topics
-    topics = await ranker.get_ranked_topics(limit=5)
+    ) as ranker:
+        topics = await ranker.get_ranked_topics(limit=5)
     print(f"📊 Found {len(topics)} trending topics")
 
     # Research topics for more depth
@@ -11,13 +11,15 @@ from typing import Optional
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, Response, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv
 
 from src.podcast_engine import PodcastEngine, EpisodeMetadata, create_engine_from_env
 from src.rss_generator import RSSGenerator, PodcastFeedConfig
+from src.utils.cache import InMemoryCache
+from src.utils.cors import cors_options
 
 # Load environment variables
 load_dotenv()
@@ -45,6 +47,8 @@ async def lifespan(app: FastAPI):
     yield
 
     print("👋 Shutting down Desi Podcast Engine...")
+    if engine is not None:
+        await engine.aclose()
 
 
 # Create FastAPI app
@@ -53,20 +57,20 @@ app = FastAPI(
     description="AI-powered daily podcast generator for the South Asian diaspora in the USA",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    **cors_options(),
 )
 
 
 # Request/Response models
 class GenerateRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     topic_count: int = 5
     target_duration_minutes: int = 12
     generate_audio: bool = True
@@ -85,8 +89,10 @@ class GenerationStatus(BaseModel):
     message: str
 
 
-# Background task tracking
-generation_tasks: dict[str, GenerationStatus] = {}
+# Background task tracking. Bounded, and finished entries expire; /status
+# still finds completed episodes on disk after that.
+GENERATION_STATUS_TTL = 24 * 3600
+generation_tasks = InMemoryCache(max_size=1000)
 
 
 # Routes
@@ -148,17 +154,17 @@ async def generate_episode(
     episode_id = f"dd-{date_for_id.strftime('%Y%m%d')}"
 
     # Check if already generating
-    if episode_id in generation_tasks:
-        existing = generation_tasks[episode_id]
-        if existing.status == "generating":
-            return existing
+    existing = generation_tasks.get(episode_id)
+    if existing is not None and existing.status == "generating":
+        return existing
 
     # Start background generation
-    generation_tasks[episode_id] = GenerationStatus(
+    started = GenerationStatus(
         status="generating",
         episode_id=episode_id,
         message="Episode generation started",
     )
+    generation_tasks.set(episode_id, started, ttl=GENERATION_STATUS_TTL)
 
     async def generate_in_background():
         try:
@@ -168,28 +174,29 @@ async def generate_episode(
                 target_duration_minutes=request.target_duration_minutes,
                 generate_audio=request.generate_audio,
             )
-            generation_tasks[episode_id] = GenerationStatus(
+            generation_tasks.set(episode_id, GenerationStatus(
                 status="completed",
                 episode_id=episode_id,
                 message="Episode generated successfully",
-            )
+            ), ttl=GENERATION_STATUS_TTL)
         except Exception as e:
-            generation_tasks[episode_id] = GenerationStatus(
+            generation_tasks.set(episode_id, GenerationStatus(
                 status="failed",
                 episode_id=episode_id,
                 message=f"Generation failed: {str(e)}",
-            )
+            ), ttl=GENERATION_STATUS_TTL)
 
     background_tasks.add_task(generate_in_background)
 
-    return generation_tasks[episode_id]
+    return started
 
 
 @app.get("/status/{episode_id}", response_model=GenerationStatus)
 async def get_generation_status(episode_id: str):
     """Check the status of an episode generation"""
-    if episode_id in generation_tasks:
-        return generation_tasks[episode_id]
+    status = generation_tasks.get(episode_id)
+    if status is not None:
+        return status
 
     # Check if episode exists
     if engine:
@@ -214,7 +221,7 @@ async def list_episodes(limit: int = Query(default=10, le=50)):
     if not engine:
         raise HTTPException(status_code=503, detail="Engine not initialized")
 
-    episodes = engine.list_episodes()
+    episodes = await asyncio.to_thread(engine.list_episodes)
     return {
         "count": len(episodes),
         "episodes": [ep.model_dump() for ep in episodes[:limit]],
@@ -280,12 +287,12 @@ async def get_rss_feed():
     if not engine or not rss_generator:
         raise HTTPException(status_code=503, detail="Engine not initialized")
 
-    episodes = engine.list_episodes()
+    episodes = await asyncio.to_thread(engine.list_episodes)
 
     # Filter to episodes with audio
     episodes_with_audio = [ep for ep in episodes if ep.audio_path]
 
-    feed_xml = rss_generator.generate_feed(episodes_with_audio)
+    feed_xml = await asyncio.to_thread(rss_generator.generate_feed, episodes_with_audio)
 
     return Response(
         content=feed_xml,
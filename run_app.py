@@ -21,6 +21,12 @@ def main():
     parser.add_argument("--host", default=default_host, help="Host")
     parser.add_argument("--port", type=int, default=default_port, help="Port")
     parser.add_argument("--reload", action="store_true", help="Auto-reload")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", 0)) or None,
+        help="Worker processes (default: one per CPU in production, 1 locally)",
+    )
 
     args = parser.parse_args()
 
@@ -35,12 +41,30 @@ def main():
 ╚═══════════════════════════════════════════════════════════════╝
     """)
 
-    uvicorn.run(
-        "src.app.main:app",
-        host=args.host,
-        port=args.port,
-        reload=args.reload if not is_production else False,
-    )
+    if is_production:
+        # One worker per core; uvloop/httptools are picked up automatically
+        # when installed (uvicorn[standard]), and per-request access logging
+        # is left to the proxy. Idle keep-alive outlasts the proxy's own
+        # (typically 60s) so it never reuses a connection uvicorn just closed.
+        uvicorn.run(
+            "src.app.main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers or max(2, os.cpu_count() or 1),
+            loop="auto",
+            http="auto",
+            log_level="warning",
+            access_log=False,
+            timeout_keep_alive=75,
+        )
+    else:
+        uvicorn.run(
+            "src.app.main:app",
+            host=args.host,
+            port=args.port,
+            reload=args.reload,
+            workers=None if args.reload else args.workers,
+        )
 
 
 if __name__ == "__main__":
@@ -16,6 +16,12 @@ from dotenv import load_dotenv
 from src.podcast_engine import create_engine_from_env, PodcastEngine
 from src.rss_generator import RSSGenerator
 
+try:
+    import uvloop
+    run_async = uvloop.run
+except ImportError:  # Optional: stock asyncio event loop
+    run_async = asyncio.run
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -168,7 +174,7 @@ def main():
                         print(f"     • {point[:80]}...")
                 print()
 
-        asyncio.run(preview())
+        run_async(preview())
 
     elif args.notebooklm:
         # Export for NotebookLM
@@ -198,7 +204,7 @@ def main():
             print("6. Download the MP3 and save to output/notebooklm/")
             print("=" * 60)
 
-        asyncio.run(export_notebooklm())
+        run_async(export_notebooklm())
 
     elif args.once:
         if args.enhanced:
@@ -227,7 +233,7 @@ def main():
                     rss_generator.generate_feed(episodes, feed_path)
                     print(f"✅ RSS feed updated: {feed_path}")
 
-            asyncio.run(run_enhanced())
+            run_async(run_enhanced())
 
         elif args.script_only:
             async def script_only():
@@ -237,12 +243,12 @@ def main():
                 print(f"   Title: {script.episode_title}")
                 print(f"   Segments: {len(script.segments)}")
 
-            asyncio.run(script_only())
+            run_async(script_only())
         else:
-            asyncio.run(run_once())
+            run_async(run_once())
 
     else:
-        asyncio.run(run_scheduler())
+        run_async(run_scheduler())
 
 
 if __name__ == "__main__":
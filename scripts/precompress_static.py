@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Precompress web app static assets.
+
+Writes .gz (and .br when brotli is installed) next to each text asset in
+src/app/static, which the /static mount serves to clients that accept them.
+Run as part of the build/deploy step.
+
+Usage:
+    python scripts/precompress_static.py
+    python scripts/precompress_static.py --dir path/to/static
+"""
+
+import argparse
+import gzip
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+STATIC_DIR = Path(__file__).parent.parent / "src" / "app" / "static"
+COMPRESSIBLE = {".html", ".css", ".js", ".json", ".svg", ".xml", ".txt"}
+MIN_SIZE = 1024  # Not worth compressing below this
+
+COMPRESSORS = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+if brotli:
+    COMPRESSORS.append((".br", lambda data: brotli.compress(data, quality=11)))
+
+
+def precompress(directory: Path) -> int:
+    """Write compressed siblings for stale or missing assets; returns count."""
+    written = 0
+    for path in directory.rglob("*"):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE:
+            continue
+        stat = path.stat()
+        if stat.st_size < MIN_SIZE:
+            continue
+
+        data = None
+        for suffix, compress in COMPRESSORS:
+            target = path.with_name(path.name + suffix)
+            if target.exists() and target.stat().st_mtime >= stat.st_mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            target.write_bytes(compress(data))
+            written += 1
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompress static assets")
+    parser.add_argument("--dir", type=Path, default=STATIC_DIR, help="Static directory")
+    args = parser.parse_args()
+
+    if not args.dir.exists():
+        print(f"Nothing to do: {args.dir} does not exist")
+        return
+    print(f"Wrote {precompress(args.dir)} compressed files in {args.dir}")
+
+
+if __name__ == "__main__":
+    main()
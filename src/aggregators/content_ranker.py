@@ -60,6 +60,16 @@ class ContentRanker:
         )
         self.uscis = USCISAggregator()
 
+    async def aclose(self):
+        """Release the aggregators' HTTP clients"""
+        await self.reddit.aclose()
+
+    async def __aenter__(self) -> "ContentRanker":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
     async def gather_all_content(self, subreddits: list[str] = None) -> dict:
         """Gather content from all sources"""
         import asyncio
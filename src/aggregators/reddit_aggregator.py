@@ -3,17 +3,29 @@ Reddit content aggregator for community discussions and trending topics
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import httpx
-from pydantic import BaseModel
+import ijson
+import orjson
 import logging
+import re
+
+from ..utils.cache import InMemoryCache
 
 logger = logging.getLogger(__name__)
 
 
-class RedditPost(BaseModel):
-    """Model for a Reddit post"""
+@dataclass(slots=True)
+class RedditPost:
+    """Model for a Reddit post.
+
+    A slotted dataclass rather than a pydantic model: posts are built in the
+    per-item parse loop and every field is already defaulted by the caller,
+    so validation buys nothing there.
+    """
 
     id: str
     subreddit: str
@@ -22,16 +34,32 @@ class RedditPost(BaseModel):
     score: int
     num_comments: int
     url: str
-    created_utc: datetime
+    created_utc: float  # Unix timestamp, as Reddit returns it
     author: str
     permalink: str
     flair: Optional[str] = None
+    _text_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _created_dt: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def engagement_score(self) -> float:
         """Calculate engagement score based on upvotes and comments"""
         return self.score + (self.num_comments * 2)
 
+    @property
+    def created_dt(self) -> datetime:
+        """created_utc as an aware UTC datetime, converted on first access"""
+        if self._created_dt is None:
+            self._created_dt = datetime.fromtimestamp(self.created_utc, tz=timezone.utc)
+        return self._created_dt
+
+    @property
+    def text_lower(self) -> str:
+        """Lowercased title + selftext, computed once per post"""
+        if self._text_lower is None:
+            self._text_lower = f"{self.title} {self.selftext}".lower()
+        return self._text_lower
+
 
 class RedditAggregator:
     """Aggregates content from relevant subreddits"""
@@ -50,6 +78,32 @@ class RedditAggregator:
         "IndiaSpeaks",  # India news relevant to diaspora
     ]
 
+    # How long a fan-out result is reused before Reddit is hit again
+    POSTS_TTL_SECONDS = 60
+    # Distinct fan-outs (subreddit list, limit, time filter) remembered at once
+    POSTS_CACHE_SIZE = 32
+
+    # Keywords used by categorize_post, matched anywhere in the post text, so
+    # inflected, hyphenated and run-together forms ("invested", "h1b-transfer",
+    # "f1visa") still count
+    CATEGORY_KEYWORDS: dict[str, tuple[str, ...]] = {
+        "immigration": (
+            "visa", "h1b", "green card", "uscis", "i-140", "i-485", "ead", "gcpriority",
+        ),
+        "career": ("job", "layoff", "interview", "salary", "offer", "promotion", "wfh", "rto"),
+        "community": ("temple", "diwali", "wedding", "festival", "racism", "discrimination"),
+        "finance": ("tax", "invest", "401k", "remittance", "mortgage", "credit"),
+        "family": ("parents", "marriage", "arrange", "kids", "school", "elder"),
+        "food": ("restaurant", "recipe", "biryani", "curry", "vegetarian", "grocery"),
+    }
+
+    # One alternation per category: a single regex scan of the text instead
+    # of a substring search per keyword
+    CATEGORY_PATTERNS: dict[str, re.Pattern] = {
+        category: re.compile("|".join(map(re.escape, keywords)))
+        for category, keywords in CATEGORY_KEYWORDS.items()
+    }
+
     def __init__(
         self,
         client_id: Optional[str] = None,
@@ -61,6 +115,35 @@ class RedditAggregator:
         self.user_agent = user_agent
         self.access_token: Optional[str] = None
         self.token_expiry: Optional[datetime] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._http_version_logged = False
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._recent_posts = InMemoryCache(max_size=self.POSTS_CACHE_SIZE)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client so the subreddit fan-out multiplexes one connection"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=90,
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "RedditAggregator":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     async def _get_access_token(self) -> Optional[str]:
         """Get Reddit OAuth access token"""
@@ -68,23 +151,23 @@ class RedditAggregator:
             if self.access_token and self.token_expiry and datetime.now() < self.token_expiry:
                 return self.access_token
 
-            async with httpx.AsyncClient() as client:
-                try:
-                    response = await client.post(
-                        "https://www.reddit.com/api/v1/access_token",
-                        auth=(self.client_id, self.client_secret),
-                        data={"grant_type": "client_credentials"},
-                        headers={"User-Agent": self.user_agent},
+            client = self._get_client()
+            try:
+                response = await client.post(
+                    "https://www.reddit.com/api/v1/access_token",
+                    auth=(self.client_id, self.client_secret),
+                    data={"grant_type": "client_credentials"},
+                    headers={"User-Agent": self.user_agent},
+                )
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    self.access_token = data["access_token"]
+                    self.token_expiry = datetime.now() + timedelta(
+                        seconds=data["expires_in"] - 60
                     )
-                    if response.status_code == 200:
-                        data = response.json()
-                        self.access_token = data["access_token"]
-                        self.token_expiry = datetime.now() + timedelta(
-                            seconds=data["expires_in"] - 60
-                        )
-                        return self.access_token
-                except Exception as e:
-                    logger.error(f"Failed to get Reddit access token: {e}")
+                    return self.access_token
+            except Exception as e:
+                logger.error(f"Failed to get Reddit access token: {e}")
 
         return None
 
@@ -101,57 +184,71 @@ class RedditAggregator:
         # Try authenticated request first, fall back to public API
         token = await self._get_access_token()
 
-        async with httpx.AsyncClient() as client:
-            try:
-                if token:
-                    headers = {
-                        "Authorization": f"Bearer {token}",
-                        "User-Agent": self.user_agent,
-                    }
-                    base_url = "https://oauth.reddit.com"
-                else:
-                    headers = {"User-Agent": self.user_agent}
-                    base_url = "https://www.reddit.com"
-
-                url = f"{base_url}/r/{subreddit}/{sort}.json"
-                params = {"limit": limit, "t": time_filter}
-
-                response = await client.get(url, headers=headers, params=params, timeout=10.0)
+        client = self._get_client()
+        try:
+            if token:
+                headers = {
+                    "Authorization": f"Bearer {token}",
+                    "User-Agent": self.user_agent,
+                }
+                base_url = "https://oauth.reddit.com"
+            else:
+                headers = {"User-Agent": self.user_agent}
+                base_url = "https://www.reddit.com"
+
+            url = f"{base_url}/r/{subreddit}/{sort}.json"
+            params = {"limit": limit, "t": time_filter}
+
+            # Stream-parse the listing so only one raw post dict is alive at a time
+            async with client.stream(
+                "GET", url, headers=headers, params=params, timeout=10.0
+            ) as response:
+                if not self._http_version_logged:
+                    logger.debug(f"Reddit connection negotiated {response.http_version}")
+                    self._http_version_logged = True
 
                 if response.status_code == 200:
-                    data = response.json()
-                    for item in data.get("data", {}).get("children", []):
-                        post_data = item.get("data", {})
-                        try:
-                            post = RedditPost(
-                                id=post_data.get("id", ""),
-                                subreddit=post_data.get("subreddit", subreddit),
-                                title=post_data.get("title", ""),
-                                selftext=post_data.get("selftext", "")[:2000],  # Limit text
-                                score=post_data.get("score", 0),
-                                num_comments=post_data.get("num_comments", 0),
-                                url=post_data.get("url", ""),
-                                created_utc=datetime.fromtimestamp(
-                                    post_data.get("created_utc", 0)
-                                ),
-                                author=post_data.get("author", "[deleted]"),
-                                permalink=f"https://reddit.com{post_data.get('permalink', '')}",
-                                flair=post_data.get("link_flair_text"),
-                            )
-                            posts.append(post)
-                        except Exception as e:
-                            logger.warning(f"Failed to parse post: {e}")
-                            continue
+                    items = ijson.sendable_list()
+                    parser = ijson.items_coro(items, "data.children.item", use_float=True)
+                    async for chunk in response.aiter_bytes():
+                        parser.send(chunk)
+                        self._collect_posts(items, subreddit, posts)
+                    parser.close()
+                    self._collect_posts(items, subreddit, posts)
                 else:
                     logger.warning(
                         f"Failed to fetch r/{subreddit}: {response.status_code}"
                     )
 
-            except Exception as e:
-                logger.error(f"Error fetching r/{subreddit}: {e}")
+        except Exception as e:
+            logger.error(f"Error fetching r/{subreddit}: {e}")
 
         return posts
 
+    def _collect_posts(self, items: list, subreddit: str, posts: list[RedditPost]):
+        """Build RedditPosts from parsed listing items, then drop the raw dicts"""
+        for item in items:
+            post_data = item.get("data", {})
+            try:
+                post = RedditPost(
+                    id=post_data.get("id", ""),
+                    subreddit=post_data.get("subreddit", subreddit),
+                    title=post_data.get("title", ""),
+                    selftext=post_data.get("selftext", "")[:2000],  # Limit text
+                    score=post_data.get("score", 0),
+                    num_comments=post_data.get("num_comments", 0),
+                    url=post_data.get("url", ""),
+                    created_utc=post_data.get("created_utc", 0),
+                    author=post_data.get("author", "[deleted]"),
+                    permalink=f"https://reddit.com{post_data.get('permalink', '')}",
+                    flair=post_data.get("link_flair_text"),
+                )
+                posts.append(post)
+            except Exception as e:
+                logger.warning(f"Failed to parse post: {e}")
+                continue
+        del items[:]
+
     async def fetch_all_posts(
         self,
         subreddits: Optional[list[str]] = None,
@@ -159,7 +256,70 @@ class RedditAggregator:
         time_filter: str = "day",
     ) -> list[RedditPost]:
         """Fetch posts from all configured subreddits"""
+        all_posts = await self._gather_posts(subreddits, limit_per_sub, time_filter)
+
+        # Sort by engagement score
+        all_posts.sort(key=lambda x: x.engagement_score, reverse=True)
+
+        return all_posts
+
+    async def _gather_posts(
+        self,
+        subreddits: Optional[list[str]],
+        limit_per_sub: int,
+        time_filter: str,
+    ) -> list[RedditPost]:
+        """
+        Fetch posts from all subreddits, unordered.
+
+        Concurrent callers asking for the same fan-out share one in-flight
+        fetch, and the result is reused for POSTS_TTL_SECONDS. If the caller
+        running the shared fetch is cancelled, the callers waiting on it
+        start a fresh one rather than being cancelled too.
+        """
         subreddits = subreddits or self.DEFAULT_SUBREDDITS
+        key = (tuple(subreddits), limit_per_sub, time_filter)
+
+        while True:
+            cached = self._recent_posts.get(key)
+            if cached is not None:
+                return list(cached)
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            # wait() returns once the fetch settles without cancelling it,
+            # and only raises CancelledError if this caller is cancelled
+            await asyncio.wait({inflight})
+            if not inflight.cancelled():
+                return list(inflight.result())
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            all_posts = await self._fetch_posts(subreddits, limit_per_sub, time_filter)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; the error is re-raised below
+            raise
+        else:
+            self._recent_posts.set(key, all_posts, ttl=self.POSTS_TTL_SECONDS)
+            future.set_result(all_posts)
+        finally:
+            self._inflight.pop(key, None)
+
+        return list(all_posts)
+
+    async def _fetch_posts(
+        self,
+        subreddits: list[str],
+        limit_per_sub: int,
+        time_filter: str,
+    ) -> list[RedditPost]:
+        """Fetch posts from all subreddits concurrently"""
         all_posts = []
 
         # Fetch from all subreddits concurrently
@@ -176,9 +336,6 @@ class RedditAggregator:
             elif isinstance(result, Exception):
                 logger.error(f"Subreddit fetch error: {result}")
 
-        # Sort by engagement score
-        all_posts.sort(key=lambda x: x.engagement_score, reverse=True)
-
         return all_posts
 
     async def get_trending_topics(
@@ -186,33 +343,25 @@ class RedditAggregator:
         subreddits: Optional[list[str]] = None
     ) -> list[RedditPost]:
         """Get trending topics with high engagement"""
-        all_posts = await self.fetch_all_posts(subreddits=subreddits)
+        all_posts = await self._gather_posts(subreddits, 25, "day")
 
-        # Filter for high-engagement posts
-        trending = [
+        # Filter for high-engagement posts, keeping only the top `limit`
+        trending = (
             post
             for post in all_posts
             if post.score >= min_score or post.num_comments >= min_comments
-        ]
+        )
 
-        return trending[:limit]
+        return heapq.nlargest(limit, trending, key=lambda x: x.engagement_score)
 
     def categorize_post(self, post: RedditPost) -> list[str]:
         """Categorize a post based on keywords"""
-        categories = []
-        text = f"{post.title} {post.selftext}".lower()
-
-        category_keywords = {
-            "immigration": ["visa", "h1b", "green card", "uscis", "i-140", "i-485", "ead", "gcpriority"],
-            "career": ["job", "layoff", "interview", "salary", "offer", "promotion", "wfh", "rto"],
-            "community": ["temple", "diwali", "wedding", "festival", "racism", "discrimination"],
-            "finance": ["tax", "invest", "401k", "remittance", "mortgage", "credit"],
-            "family": ["parents", "marriage", "arrange", "kids", "school", "elder"],
-            "food": ["restaurant", "recipe", "biryani", "curry", "vegetarian", "grocery"],
-        }
-
-        for category, keywords in category_keywords.items():
-            if any(kw in text for kw in keywords):
-                categories.append(category)
+        text = post.text_lower
+
+        categories = [
+            category
+            for category, pattern in self.CATEGORY_PATTERNS.items()
+            if pattern.search(text)
+        ]
 
         return categories if categories else ["general"]
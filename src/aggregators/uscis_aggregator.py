@@ -3,18 +3,36 @@ USCIS and immigration-specific content aggregator
 """
 
 import asyncio
+import heapq
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 import httpx
 import feedparser
-from pydantic import BaseModel
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+HIGH_PRIORITY_KEYWORDS = (
+    "h-1b", "h1b", "premium processing", "fee increase",
+    "policy change", "rule change", "executive order",
+    "employment authorization", "ead", "i-140", "i-485",
+    "green card", "priority date", "visa bulletin",
+)
 
-class ImmigrationUpdate(BaseModel):
+MEDIUM_PRIORITY_KEYWORDS = (
+    "processing time", "naturalization", "citizenship",
+    "travel document", "advance parole", "asylum",
+)
+
+# One case-insensitive scan per tier instead of a Python loop over keywords
+_HIGH_PRIORITY_RE = re.compile("|".join(map(re.escape, HIGH_PRIORITY_KEYWORDS)), re.IGNORECASE)
+_MEDIUM_PRIORITY_RE = re.compile("|".join(map(re.escape, MEDIUM_PRIORITY_KEYWORDS)), re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class ImmigrationUpdate:
     """Model for immigration-related updates"""
 
     id: str
@@ -53,92 +71,106 @@ class USCISAggregator:
     def __init__(self):
         self.cached_processing_times: Optional[dict] = None
         self.cache_timestamp: Optional[datetime] = None
+        self._bulletin_last_modified: Optional[str] = None
+        self._bulletin_cache: Optional[tuple[str, Optional[ImmigrationUpdate]]] = None
 
     async def fetch_uscis_news(self) -> list[ImmigrationUpdate]:
         """Fetch official USCIS news and alerts"""
         updates = []
 
-        for source_name, feed_url in self.OFFICIAL_FEEDS.items():
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(feed_url, timeout=15.0)
-                    if response.status_code == 200:
-                        feed = feedparser.parse(response.text)
-
-                        for entry in feed.entries[:15]:
-                            try:
-                                published = datetime.now()
-                                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                                    published = datetime(*entry.published_parsed[:6])
-
-                                # Determine priority based on keywords
-                                title_lower = entry.get("title", "").lower()
-                                priority = self._calculate_priority(title_lower)
-
-                                update = ImmigrationUpdate(
-                                    id=entry.get("id", entry.get("link", "")),
-                                    title=entry.get("title", ""),
-                                    summary=entry.get("summary", "")[:500],
-                                    source="USCIS",
-                                    url=entry.get("link", ""),
-                                    published_at=published,
-                                    update_type="policy" if "alert" in source_name else "news",
-                                    priority=priority,
-                                )
-                                updates.append(update)
-                            except Exception as e:
-                                logger.warning(f"Failed to parse USCIS entry: {e}")
+        # Fetch all feeds concurrently
+        tasks = [
+            self._fetch_feed(source_name, feed_url)
+            for source_name, feed_url in self.OFFICIAL_FEEDS.items()
+        ]
 
-            except Exception as e:
-                logger.error(f"Error fetching {source_name}: {e}")
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for source_name, result in zip(self.OFFICIAL_FEEDS, results):
+            if isinstance(result, list):
+                updates.extend(result)
+            elif isinstance(result, Exception):
+                logger.error(f"Error fetching {source_name}: {result}")
 
         return updates
 
-    def _calculate_priority(self, text: str) -> int:
-        """Calculate priority score based on keywords"""
-        high_priority_keywords = [
-            "h-1b", "h1b", "premium processing", "fee increase",
-            "policy change", "rule change", "executive order",
-            "employment authorization", "ead", "i-140", "i-485",
-            "green card", "priority date", "visa bulletin",
-        ]
+    async def _fetch_feed(self, source_name: str, feed_url: str) -> list[ImmigrationUpdate]:
+        """Fetch and parse a single official feed"""
+        updates = []
 
-        medium_priority_keywords = [
-            "processing time", "naturalization", "citizenship",
-            "travel document", "advance parole", "asylum",
-        ]
+        async with httpx.AsyncClient() as client:
+            response = await client.get(feed_url, timeout=15.0)
+            if response.status_code != 200:
+                return updates
+
+        # feedparser is pure Python; keep it off the event loop. Hand it the raw
+        # bytes so it sniffs the encoding itself instead of us decoding to str.
+        feed = await asyncio.to_thread(feedparser.parse, response.content)
+
+        for entry in feed.entries[:15]:
+            try:
+                published = datetime.now()
+                if hasattr(entry, "published_parsed") and entry.published_parsed:
+                    published = datetime(*entry.published_parsed[:6])
+
+                # Determine priority based on keywords
+                priority = self._calculate_priority(entry.get("title", ""))
+
+                update = ImmigrationUpdate(
+                    id=entry.get("id", entry.get("link", "")),
+                    title=entry.get("title", ""),
+                    summary=entry.get("summary", "")[:500],
+                    source="USCIS",
+                    url=entry.get("link", ""),
+                    published_at=published,
+                    update_type="policy" if "alert" in source_name else "news",
+                    priority=priority,
+                )
+                updates.append(update)
+            except Exception as e:
+                logger.warning(f"Failed to parse USCIS entry: {e}")
 
-        text_lower = text.lower()
+        return updates
 
-        if any(kw in text_lower for kw in high_priority_keywords):
+    def _calculate_priority(self, text: str) -> int:
+        """Calculate priority score based on keywords"""
+        if _HIGH_PRIORITY_RE.search(text):
             return 8
-        elif any(kw in text_lower for kw in medium_priority_keywords):
+        elif _MEDIUM_PRIORITY_RE.search(text):
             return 6
         else:
             return 4
 
     async def check_visa_bulletin_update(self) -> Optional[ImmigrationUpdate]:
         """Check for new Visa Bulletin updates"""
+        current_month = datetime.now().strftime("%B")
+        current_year = datetime.now().year
+        bulletin_key = f"{current_month}-{current_year}"
+
         try:
             async with httpx.AsyncClient() as client:
+                # Cheap probe first: the bulletin page changes roughly monthly
+                if self._bulletin_last_modified and self._bulletin_cache:
+                    head = await client.head(
+                        self.VISA_BULLETIN_URL,
+                        headers={"If-Modified-Since": self._bulletin_last_modified},
+                        timeout=15.0,
+                    )
+                    cached_key, cached_update = self._bulletin_cache
+                    if head.status_code == 304 and cached_key == bulletin_key:
+                        return cached_update
+
                 response = await client.get(self.VISA_BULLETIN_URL, timeout=15.0)
                 if response.status_code == 200:
-                    # Parse for the latest bulletin
-                    content = response.text.lower()
-
-                    # Look for current month's bulletin
-                    months = [
-                        "january", "february", "march", "april", "may", "june",
-                        "july", "august", "september", "october", "november", "december"
-                    ]
-                    current_month = datetime.now().strftime("%B").lower()
-                    current_year = datetime.now().year
+                    self._bulletin_last_modified = response.headers.get("Last-Modified")
 
                     # Simple check - in production, use proper HTML parsing
-                    if f"{current_month} {current_year}" in content:
-                        return ImmigrationUpdate(
-                            id=f"visa-bulletin-{current_month}-{current_year}",
-                            title=f"Visa Bulletin for {current_month.title()} {current_year}",
+                    pattern = rf"\b{current_month}\s+{current_year}\b"
+                    update = None
+                    if re.search(pattern, response.text, re.IGNORECASE):
+                        update = ImmigrationUpdate(
+                            id=f"visa-bulletin-{current_month.lower()}-{current_year}",
+                            title=f"Visa Bulletin for {current_month} {current_year}",
                             summary="The latest Visa Bulletin has been released with updated priority dates for employment and family-based categories.",
                             source="State Department",
                             url=self.VISA_BULLETIN_URL,
@@ -147,6 +179,9 @@ class USCISAggregator:
                             priority=9,
                         )
 
+                    self._bulletin_cache = (bulletin_key, update)
+                    return update
+
         except Exception as e:
             logger.error(f"Error checking Visa Bulletin: {e}")
 
@@ -198,8 +233,18 @@ class USCISAggregator:
 
         return processing_summary
 
-    async def get_all_updates(self) -> list[ImmigrationUpdate]:
-        """Get all immigration updates"""
+    async def get_all_updates(self, limit: Optional[int] = None) -> list[ImmigrationUpdate]:
+        """Get all immigration updates, highest priority and newest first"""
+        all_updates = await self._collect_updates()
+        return self._rank_updates(all_updates, limit)
+
+    async def get_urgent_updates(self) -> list[ImmigrationUpdate]:
+        """Get only urgent/high-priority updates"""
+        all_updates = await self._collect_updates()
+        return self._rank_updates([u for u in all_updates if u.is_urgent])
+
+    async def _collect_updates(self) -> list[ImmigrationUpdate]:
+        """Gather updates from every source, unordered"""
         all_updates = []
 
         # Fetch USCIS news
@@ -211,15 +256,18 @@ class USCISAggregator:
         if visa_bulletin:
             all_updates.append(visa_bulletin)
 
-        # Sort by priority and recency
-        all_updates.sort(key=lambda x: (-x.priority, x.published_at), reverse=True)
-
         return all_updates
 
-    async def get_urgent_updates(self) -> list[ImmigrationUpdate]:
-        """Get only urgent/high-priority updates"""
-        all_updates = await self.get_all_updates()
-        return [u for u in all_updates if u.is_urgent]
+    @staticmethod
+    def _rank_updates(
+        updates: list[ImmigrationUpdate], limit: Optional[int] = None
+    ) -> list[ImmigrationUpdate]:
+        """Order updates by priority, then recency; only the top `limit` are kept"""
+        return heapq.nsmallest(
+            limit if limit is not None else len(updates),
+            updates,
+            key=lambda u: (-u.priority, -u.published_at.timestamp()),
+        )
 
     def generate_immigration_segment(self, updates: list[ImmigrationUpdate]) -> str:
         """Generate a summary segment for the podcast"""
@@ -228,7 +276,7 @@ class USCISAggregator:
 
         lines = ["Here's what's happening in the immigration world:"]
 
-        for i, update in enumerate(updates[:5], 1):
+        for i, update in enumerate(self._rank_updates(updates, 5), 1):
             source = f"({update.source})" if update.source != "USCIS" else ""
             lines.append(f"{i}. {update.title} {source}")
 
@@ -8,23 +8,46 @@ Uses Supabase Auth for:
 """
 
 import os
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, EmailStr
 
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 
 load_dotenv(override=True)
 
 logger = logging.getLogger(__name__)
 
+# Service-role client for profile writes, created on first use
+_admin_client: Optional[Client] = None
+
+
+def _get_admin_client() -> Client:
+    """Get or create the service-role Supabase client."""
+    global _admin_client
+
+    if _admin_client is None:
+        _admin_client = create_client(
+            os.getenv("SUPABASE_URL"),
+            os.getenv("SUPABASE_SERVICE_KEY"),
+        )
+    return _admin_client
+
+
+def _client_options() -> ClientOptions:
+    """Options for clients that must not keep a user session between calls."""
+    return ClientOptions(persist_session=False, auto_refresh_token=False)
+
 
 # ============== Models ==============
 
 class SignUpRequest(BaseModel):
     """User signup request."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     email: EmailStr
     password: str
     full_name: Optional[str] = None
@@ -32,6 +55,8 @@ class SignUpRequest(BaseModel):
 
 class LoginRequest(BaseModel):
     """User login request."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     email: EmailStr
     password: str
 
@@ -64,6 +89,12 @@ class AuthService:
     Authentication service using Supabase Auth.
     
     Provides graceful degradation when Supabase is not configured.
+    The supabase-py SDK is synchronous, so its calls run via
+    asyncio.to_thread to keep the event loop free.
+
+    One service (and client) is shared by every request, so that client
+    only makes token-scoped calls. Sign-up, login and refresh store the
+    resulting session on the client they run on, so each gets its own.
     """
     
     _instance = None
@@ -81,6 +112,8 @@ class AuthService:
         """
         url = os.getenv("SUPABASE_URL")
         key = os.getenv("SUPABASE_ANON_KEY")  # Use anon key for auth
+        self._url = url
+        self._key = key
         
         missing = []
         if not url:
@@ -107,7 +140,7 @@ class AuthService:
                 return
         
         try:
-            self.client: Client = create_client(url, key)
+            self.client: Client = create_client(url, key, options=_client_options())
             self._available = True
             self._error_message = None
             logger.info("✅ Auth service initialized successfully")
@@ -131,6 +164,10 @@ class AuthService:
         """Get error message if service is not available."""
         return self._error_message
     
+    def _session_client(self) -> Client:
+        """New client for a call that stores a session on its client."""
+        return create_client(self._url, self._key, options=_client_options())
+
     def _check_available(self) -> bool:
         """Check if service is available, log warning if not."""
         if not self._available:
@@ -156,7 +193,8 @@ class AuthService:
         
         try:
             # Sign up with Supabase Auth
-            response = self.client.auth.sign_up({
+            client = self._session_client()
+            response = await asyncio.to_thread(client.auth.sign_up, {
                 "email": request.email,
                 "password": request.password,
                 "options": {
@@ -208,7 +246,8 @@ class AuthService:
             )
         
         try:
-            response = self.client.auth.sign_in_with_password({
+            client = self._session_client()
+            response = await asyncio.to_thread(client.auth.sign_in_with_password, {
                 "email": request.email,
                 "password": request.password,
             })
@@ -237,7 +276,8 @@ class AuthService:
     async def logout(self, access_token: str) -> bool:
         """Log out user by invalidating their session."""
         try:
-            self.client.auth.sign_out()
+            # Revoke by token: the shared client holds no session of its own
+            await asyncio.to_thread(self.client.auth.admin.sign_out, access_token)
             return True
         except Exception as e:
             logger.error(f"Logout error: {e}")
@@ -255,7 +295,7 @@ class AuthService:
         """
         try:
             # Set the session with the access token
-            response = self.client.auth.get_user(access_token)
+            response = await asyncio.to_thread(self.client.auth.get_user, access_token)
 
             if response.user:
                 return AuthUser(
@@ -281,7 +321,8 @@ class AuthService:
             AuthUser with new tokens or None
         """
         try:
-            response = self.client.auth.refresh_session(refresh_token)
+            client = self._session_client()
+            response = await asyncio.to_thread(client.auth.refresh_session, refresh_token)
 
             if response.user and response.session:
                 return AuthUser(
@@ -307,7 +348,7 @@ class AuthService:
             True if email sent, False otherwise
         """
         try:
-            self.client.auth.reset_password_email(email)
+            await asyncio.to_thread(self.client.auth.reset_password_email, email)
             return True
         except Exception as e:
             logger.error(f"Password reset error: {e}")
@@ -315,27 +356,45 @@ class AuthService:
 
     async def _create_profile(self, user_id: str, email: str, full_name: Optional[str] = None):
         """Create user profile in database."""
+        await self._create_profiles_bulk([{
+            "id": user_id,
+            "email": email,
+            "full_name": full_name,
+        }])
+
+    async def _create_profiles_bulk(self, rows: List[dict]) -> bool:
+        """
+        Create many user profiles in a single round trip.
+
+        Args:
+            rows: Profile rows with at least ``id`` and ``email``
+
+        Returns:
+            True if the upsert succeeded
+        """
+        if not rows:
+            return True
+
         try:
             # Use service key for profile creation
-            service_key = os.getenv("SUPABASE_SERVICE_KEY")
-            url = os.getenv("SUPABASE_URL")
-            admin_client = create_client(url, service_key)
-
-            # Check if profile already exists
-            existing = admin_client.table("profiles").select("id").eq("id", user_id).execute()
-
-            if not existing.data:
-                # Create new profile
-                admin_client.table("profiles").insert({
-                    "id": user_id,
-                    "email": email,
-                    "full_name": full_name,
-                    "created_at": datetime.now().isoformat(),
-                }).execute()
-                logger.info(f"Created profile for user {user_id}")
+            admin_client = _get_admin_client()
+
+            created_at = datetime.now().isoformat()
+            payload = [{"created_at": created_at, **row} for row in rows]
+
+            # Existing profiles are left untouched
+            query = admin_client.table("profiles").upsert(
+                payload,
+                on_conflict="id",
+                ignore_duplicates=True,
+            )
+            await asyncio.to_thread(query.execute)
+            logger.info(f"Ensured {len(payload)} profile(s)")
+            return True
 
         except Exception as e:
             logger.error(f"Create profile error: {e}")
+            return False
 
 
 # ============== FastAPI Dependencies ==============
@@ -360,8 +419,7 @@ async def get_current_user(
     if not credentials:
         return None
 
-    auth_service = AuthService()
-    user = await auth_service.get_user(credentials.credentials)
+    user = await get_auth_service().get_user(credentials.credentials)
     return user
 
 
@@ -377,5 +435,17 @@ async def require_auth(
     return user
 
 
+# Shared service, so the Supabase client is created once per process
+_auth_service: Optional[AuthService] = None
+
+
+def get_auth_service() -> AuthService:
+    """Get or create the process-wide AuthService."""
+    global _auth_service
+    if _auth_service is None:
+        _auth_service = AuthService()
+    return _auth_service
+
+
 # Convenience instance
-auth = AuthService()
+auth = get_auth_service()
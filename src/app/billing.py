@@ -10,34 +10,108 @@ Flow:
 """
 
 import os
+import logging
+import requests
 import stripe
-from typing import Optional
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Mapping, Optional
 from pydantic import BaseModel
 
+from src.utils.cache import InMemoryCache, get_cache
+
+
+logger = logging.getLogger(__name__)
 
 # Initialize Stripe
 stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+# One keep-alive session shared by every Stripe call, so warm requests skip
+# the TCP/TLS handshake
+stripe.default_http_client = stripe.RequestsClient(session=requests.Session())
 
-# Pricing configuration (in cents)
-STRIPE_PRICES = {
-    "newsletter": {
+# Pricing configuration (in cents). Read-only down to each plan: plans are
+# fixed at import and get_plan hands them out shared.
+STRIPE_PRICES = MappingProxyType({
+    "newsletter": MappingProxyType({
         "name": "Newsletter Only",
         "price_cents": 2900,  # $29
         "description": "AI-generated newsletter with research",
-    },
-    "podcast": {
+    }),
+    "podcast": MappingProxyType({
         "name": "Podcast Only",
         "price_cents": 4900,  # $49
         "description": "AI-generated podcast with audio",
-    },
-    "bundle": {
+    }),
+    "bundle": MappingProxyType({
         "name": "Newsletter + Podcast Bundle",
         "price_cents": 6900,  # $69
         "description": "Both newsletter and podcast - save $9",
-    },
+    }),
+})
+
+
+def get_plan(plan: str) -> Optional[Mapping]:
+    """Look up a plan's pricing info, or None for an unknown plan."""
+    return STRIPE_PRICES.get(plan)
+
+
+def format_price(cents: int) -> str:
+    """Format cents as dollars."""
+    return f"${cents / 100:.0f}"
+
+
+# Public plan listing, materialized once for the pricing API
+PUBLIC_PLANS = {
+    plan_id: {
+        "id": plan_id,
+        "name": plan_info["name"],
+        "description": plan_info["description"],
+        "price_cents": plan_info["price_cents"],
+        "price_display": format_price(plan_info["price_cents"]),
+    }
+    for plan_id, plan_info in STRIPE_PRICES.items()
 }
 
 
+def _build_line_items(plan: str, price_info: Mapping) -> list:
+    """Build the Checkout line_items for a plan.
+
+    A pre-created Stripe Price (STRIPE_PRICE_<PLAN> env var) is referenced
+    by ID; otherwise the price is sent inline from STRIPE_PRICES.
+    """
+    price_id = os.getenv(f"STRIPE_PRICE_{plan.upper()}")
+    if price_id:
+        return [{"price": price_id, "quantity": 1}]
+    return [{
+        "price_data": {
+            "currency": "usd",
+            "product_data": {
+                "name": price_info["name"],
+                "description": price_info["description"],
+            },
+            "unit_amount": price_info["price_cents"],
+        },
+        "quantity": 1,
+    }]
+
+
+# Built once at import; create_checkout_session reuses these per plan
+_LINE_ITEMS = {plan: _build_line_items(plan, info) for plan, info in STRIPE_PRICES.items()}
+
+
+# Paid sessions are terminal, so their verification can be reused across
+# success-page refreshes without another Stripe round trip.
+VERIFY_CACHE_TTL = 300
+_verify_cache = InMemoryCache(max_size=4096)
+
+# Handled webhook event IDs are remembered for as long as Stripe keeps
+# retrying a delivery (up to three days)
+WEBHOOK_DEDUP_TTL = 3 * 24 * 3600
+# Per-process fallback, only used when the shared cache can't be written
+WEBHOOK_DEDUP_SIZE = 10_000
+_seen_events: "OrderedDict[str, None]" = OrderedDict()
+
+
 class CheckoutSession(BaseModel):
     """Checkout session data."""
     session_id: str
@@ -72,25 +146,14 @@ def create_checkout_session(
     Returns:
         CheckoutSession with session_id and checkout_url
     """
-    if plan not in STRIPE_PRICES:
+    price_info = get_plan(plan)
+    if price_info is None:
         raise ValueError(f"Invalid plan: {plan}")
 
-    price_info = STRIPE_PRICES[plan]
-
     # Create Stripe Checkout Session
     session = stripe.checkout.Session.create(
         payment_method_types=["card"],
-        line_items=[{
-            "price_data": {
-                "currency": "usd",
-                "product_data": {
-                    "name": price_info["name"],
-                    "description": price_info["description"],
-                },
-                "unit_amount": price_info["price_cents"],
-            },
-            "quantity": 1,
-        }],
+        line_items=_LINE_ITEMS[plan],
         mode="payment",
         success_url=success_url,
         cancel_url=cancel_url,
@@ -115,15 +178,22 @@ def verify_payment(session_id: str) -> PaymentVerification:
     Returns:
         PaymentVerification with payment status
     """
+    cached = _verify_cache.get(session_id)
+    if cached is not None:
+        return cached
+
     try:
         session = stripe.checkout.Session.retrieve(session_id)
 
-        return PaymentVerification(
+        verification = PaymentVerification(
             paid=session.payment_status == "paid",
             plan=session.metadata.get("plan", "unknown"),
             customer_email=session.customer_details.email if session.customer_details else None,
             payment_intent=session.payment_intent,
         )
+        if verification.paid:
+            _verify_cache.set(session_id, verification, ttl=VERIFY_CACHE_TTL)
+        return verification
     except stripe.error.StripeError as e:
         return PaymentVerification(
             paid=False,
@@ -133,17 +203,34 @@ def verify_payment(session_id: str) -> PaymentVerification:
 
 def get_price(plan: str) -> int:
     """Get price in cents for a plan."""
-    if plan not in STRIPE_PRICES:
+    price_info = get_plan(plan)
+    if price_info is None:
         raise ValueError(f"Invalid plan: {plan}")
-    return STRIPE_PRICES[plan]["price_cents"]
+    return price_info["price_cents"]
 
 
-def format_price(cents: int) -> str:
-    """Format cents as dollars."""
-    return f"${cents / 100:.0f}"
+# Webhook handling for production
+def _first_delivery(event_id: str) -> bool:
+    """
+    Record a webhook event ID, returning False if it was already handled.
+
+    The check goes through the shared cache (Redis SET NX when REDIS_URL is
+    set, otherwise an O_EXCL file), so a redelivery that lands on another
+    worker is still caught.
+    """
+    try:
+        return get_cache().add(f"stripe_event:{event_id}", True, ttl=WEBHOOK_DEDUP_TTL)
+    except Exception as e:
+        logger.warning(f"Shared webhook dedup failed, using in-process: {e}")
+
+    if event_id in _seen_events:
+        return False
+    _seen_events[event_id] = None
+    if len(_seen_events) > WEBHOOK_DEDUP_SIZE:
+        _seen_events.popitem(last=False)
+    return True
 
 
-# Webhook handling for production
 def handle_webhook(payload: bytes, sig_header: str, webhook_secret: str) -> dict:
     """
     Handle Stripe webhook events.
@@ -155,6 +242,10 @@ def handle_webhook(payload: bytes, sig_header: str, webhook_secret: str) -> dict
             payload, sig_header, webhook_secret
         )
 
+        event_id = event.get("id")
+        if event_id and not _first_delivery(event_id):
+            return {"event": "duplicate", "event_id": event_id}
+
         if event["type"] == "checkout.session.completed":
             session = event["data"]["object"]
             return {
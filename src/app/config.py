@@ -0,0 +1,41 @@
+"""
+Runtime settings for the PodcastOS web app.
+
+Environment variables (and .env) are read once into a frozen Settings object;
+request handlers read attributes from it instead of calling os.getenv.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class AppSettings(BaseSettings):
+    """Web app settings loaded from environment variables"""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        extra="ignore",
+        frozen=True,
+    )
+
+    # Stripe
+    stripe_secret_key: Optional[str] = None
+    stripe_webhook_secret: Optional[str] = None
+
+    # URLs
+    app_base_url: str = "http://localhost:5000"
+
+    # nginx internal location for large /files downloads (see config/nginx.conf)
+    files_accel_prefix: str = ""
+
+    @property
+    def stripe_configured(self) -> bool:
+        return bool(self.stripe_secret_key)
+
+
+@lru_cache
+def get_settings() -> AppSettings:
+    """Get the process-wide settings snapshot."""
+    return AppSettings()
@@ -8,14 +8,19 @@ Uses Supabase for:
 """
 
 import os
+import asyncio
 import logging
+import threading
 from datetime import datetime
 from typing import Optional, List
+from uuid import UUID
 from pydantic import BaseModel
 
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from src.utils.cache import InMemoryCache
+
 load_dotenv(override=True)
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,16 @@ logger = logging.getLogger(__name__)
 _supabase_client: Optional[Client] = None
 _supabase_available: bool = False
 _supabase_error: Optional[str] = None
+_supabase_lock = threading.Lock()
+
+# Optional direct Postgres pool (asyncpg) for hot reads, used when
+# SUPABASE_DB_URL is set; everything else goes through PostgREST
+_pg_pool = None
+_pg_unavailable: bool = False
+
+# Per-process profile cache; entries are dropped on every profile write
+PROFILE_CACHE_TTL = 60
+_profile_cache = InMemoryCache(max_size=10_000)
 
 
 class SupabaseNotConfiguredError(Exception):
@@ -51,6 +66,17 @@ def get_supabase_error() -> Optional[str]:
 
 def get_supabase() -> Client:
     """Get or create Supabase client with validation."""
+    # Lock-free fast path once the client exists
+    if _supabase_client is not None:
+        return _supabase_client
+
+    # Database methods run in worker threads, so creation must happen once
+    with _supabase_lock:
+        return _create_supabase()
+
+
+def _create_supabase() -> Client:
+    """Create the Supabase client; caller must hold _supabase_lock."""
     global _supabase_client, _supabase_available, _supabase_error
 
     if _supabase_client is not None:
@@ -94,6 +120,46 @@ def get_supabase() -> Client:
         )
 
 
+async def get_pg_pool():
+    """
+    Get the asyncpg pool for direct Postgres reads, or None.
+
+    Returns None (and stays on PostgREST) when SUPABASE_DB_URL is unset,
+    asyncpg is not installed, or the pool cannot be created.
+    """
+    global _pg_pool, _pg_unavailable
+
+    if _pg_pool is not None or _pg_unavailable:
+        return _pg_pool
+
+    dsn = os.getenv("SUPABASE_DB_URL")
+    if not dsn:
+        _pg_unavailable = True
+        return None
+
+    try:
+        import asyncpg
+
+        _pg_pool = await asyncpg.create_pool(dsn=dsn, min_size=2, max_size=10)
+        logger.info("Using direct Postgres pool for hot reads")
+    except ImportError:
+        logger.warning("SUPABASE_DB_URL set but asyncpg not installed; using PostgREST")
+        _pg_unavailable = True
+    except Exception as e:
+        logger.error(f"Failed to create Postgres pool: {e}")
+        _pg_unavailable = True
+    return _pg_pool
+
+
+async def close_pg_pool():
+    """Close the asyncpg pool, if one was created."""
+    global _pg_pool
+
+    if _pg_pool is not None:
+        await _pg_pool.close()
+        _pg_pool = None
+
+
 # ============== Models ==============
 
 class UserProfile(BaseModel):
@@ -143,10 +209,41 @@ class Subscriber(BaseModel):
     subscribed_at: Optional[datetime] = None
 
 
+# Column projections matching each model, so reads skip unused columns.
+# Profile voice_config (JSONB) is fetched separately via get_user_voice_config.
+_PROFILE_COLS = ",".join(f for f in UserProfile.model_fields if f != "voice_config")
+_SHOW_COLS = ",".join(Show.model_fields)
+_EPISODE_COLS = ",".join(Episode.model_fields)
+_SUBSCRIBER_COLS = ",".join(Subscriber.model_fields)
+
+_PROFILE_SQL = f"SELECT {_PROFILE_COLS} FROM profiles WHERE id = $1"
+_SUBSCRIBERS_SQL = f"SELECT {_SUBSCRIBER_COLS} FROM subscribers WHERE user_id = $1"
+
+
+def _stringify_ids(row: dict) -> dict:
+    """asyncpg returns UUID columns as uuid.UUID; the models expect str."""
+    return {k: str(v) if isinstance(v, UUID) else v for k, v in row.items()}
+
+
+def _dump_nonnull(model: BaseModel) -> dict:
+    """
+    Insert payload for a model: its set, non-None fields.
+
+    Equivalent to model_dump(exclude_none=True) for these flat models, but
+    reads __dict__ directly instead of running the serializer.
+    """
+    return {k: v for k, v in model.__dict__.items() if v is not None}
+
+
 # ============== Database Operations ==============
 
 class Database:
-    """Database operations for PodcastOS."""
+    """
+    Database operations for PodcastOS.
+
+    The Supabase client is synchronous, so each query's execute() runs via
+    asyncio.to_thread to keep the event loop free during the HTTP round trip.
+    """
 
     def __init__(self):
         self.client = get_supabase()
@@ -155,18 +252,48 @@ class Database:
 
     async def get_user_profile(self, user_id: str) -> Optional[UserProfile]:
         """Get user profile by ID."""
+        cached = _profile_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         try:
-            result = self.client.table("profiles").select("*").eq("id", user_id).single().execute()
-            if result.data:
-                return UserProfile(**result.data)
+            pool = await get_pg_pool()
+            if pool is not None:
+                row = await pool.fetchrow(_PROFILE_SQL, user_id)
+                data = _stringify_ids(dict(row)) if row else None
+            else:
+                query = (
+                    self.client.table("profiles")
+                    .select(_PROFILE_COLS)
+                    .eq("id", user_id)
+                    .single()
+                )
+                result = await asyncio.to_thread(query.execute)
+                data = result.data
+            if data:
+                profile = UserProfile(**data)
+                _profile_cache.set(user_id, profile, ttl=PROFILE_CACHE_TTL)
+                return profile
         except Exception as e:
             logger.error(f"Error getting user profile: {e}")
         return None
 
+    async def get_user_voice_config(self, user_id: str) -> Optional[dict]:
+        """Get just the voice_config for a user's profile."""
+        try:
+            query = self.client.table("profiles").select("voice_config").eq("id", user_id).single()
+            result = await asyncio.to_thread(query.execute)
+            if result.data:
+                return result.data.get("voice_config")
+        except Exception as e:
+            logger.error(f"Error getting voice config: {e}")
+        return None
+
     async def create_user_profile(self, profile: UserProfile) -> Optional[UserProfile]:
         """Create a new user profile."""
         try:
-            result = self.client.table("profiles").insert(profile.model_dump(exclude_none=True)).execute()
+            query = self.client.table("profiles").insert(_dump_nonnull(profile))
+            result = await asyncio.to_thread(query.execute)
             if result.data:
                 return UserProfile(**result.data[0])
         except Exception as e:
@@ -176,7 +303,9 @@ class Database:
     async def update_user_profile(self, user_id: str, updates: dict) -> bool:
         """Update user profile."""
         try:
-            self.client.table("profiles").update(updates).eq("id", user_id).execute()
+            query = self.client.table("profiles").update(updates).eq("id", user_id)
+            await asyncio.to_thread(query.execute)
+            _profile_cache.delete(user_id)
             return True
         except Exception as e:
             logger.error(f"Error updating user profile: {e}")
@@ -187,7 +316,8 @@ class Database:
     async def create_show(self, show: Show) -> Optional[Show]:
         """Create a new show."""
         try:
-            result = self.client.table("shows").insert(show.model_dump(exclude_none=True)).execute()
+            query = self.client.table("shows").insert(_dump_nonnull(show))
+            result = await asyncio.to_thread(query.execute)
             if result.data:
                 return Show(**result.data[0])
         except Exception as e:
@@ -197,7 +327,8 @@ class Database:
     async def get_user_shows(self, user_id: str) -> List[Show]:
         """Get all shows for a user."""
         try:
-            result = self.client.table("shows").select("*").eq("user_id", user_id).execute()
+            query = self.client.table("shows").select(_SHOW_COLS).eq("user_id", user_id)
+            result = await asyncio.to_thread(query.execute)
             return [Show(**s) for s in result.data]
         except Exception as e:
             logger.error(f"Error getting user shows: {e}")
@@ -206,19 +337,31 @@ class Database:
     async def get_show(self, show_id: str) -> Optional[Show]:
         """Get show by ID."""
         try:
-            result = self.client.table("shows").select("*").eq("id", show_id).single().execute()
+            query = self.client.table("shows").select(_SHOW_COLS).eq("id", show_id).single()
+            result = await asyncio.to_thread(query.execute)
             if result.data:
                 return Show(**result.data)
         except Exception as e:
             logger.error(f"Error getting show: {e}")
         return None
 
+    async def show_exists(self, show_id: str) -> bool:
+        """Check whether a show exists without fetching the full row."""
+        try:
+            query = self.client.table("shows").select("id").eq("id", show_id).limit(1)
+            result = await asyncio.to_thread(query.execute)
+            return bool(result.data)
+        except Exception as e:
+            logger.error(f"Error checking show: {e}")
+        return False
+
     # === Episodes ===
 
     async def create_episode(self, episode: Episode) -> Optional[Episode]:
         """Create a new episode."""
         try:
-            result = self.client.table("episodes").insert(episode.model_dump(exclude_none=True)).execute()
+            query = self.client.table("episodes").insert(_dump_nonnull(episode))
+            result = await asyncio.to_thread(query.execute)
             if result.data:
                 return Episode(**result.data[0])
         except Exception as e:
@@ -228,7 +371,13 @@ class Database:
     async def get_show_episodes(self, show_id: str) -> List[Episode]:
         """Get all episodes for a show."""
         try:
-            result = self.client.table("episodes").select("*").eq("show_id", show_id).order("created_at", desc=True).execute()
+            query = (
+                self.client.table("episodes")
+                .select(_EPISODE_COLS)
+                .eq("show_id", show_id)
+                .order("created_at", desc=True)
+            )
+            result = await asyncio.to_thread(query.execute)
             return [Episode(**e) for e in result.data]
         except Exception as e:
             logger.error(f"Error getting show episodes: {e}")
@@ -237,7 +386,14 @@ class Database:
     async def get_user_episodes(self, user_id: str, limit: int = 20) -> List[Episode]:
         """Get recent episodes for a user."""
         try:
-            result = self.client.table("episodes").select("*").eq("user_id", user_id).order("created_at", desc=True).limit(limit).execute()
+            query = (
+                self.client.table("episodes")
+                .select(_EPISODE_COLS)
+                .eq("user_id", user_id)
+                .order("created_at", desc=True)
+                .limit(limit)
+            )
+            result = await asyncio.to_thread(query.execute)
             return [Episode(**e) for e in result.data]
         except Exception as e:
             logger.error(f"Error getting user episodes: {e}")
@@ -246,7 +402,8 @@ class Database:
     async def update_episode(self, episode_id: str, updates: dict) -> bool:
         """Update an episode."""
         try:
-            self.client.table("episodes").update(updates).eq("id", episode_id).execute()
+            query = self.client.table("episodes").update(updates).eq("id", episode_id)
+            await asyncio.to_thread(query.execute)
             return True
         except Exception as e:
             logger.error(f"Error updating episode: {e}")
@@ -257,26 +414,75 @@ class Database:
     async def add_subscriber(self, subscriber: Subscriber) -> Optional[Subscriber]:
         """Add a newsletter subscriber."""
         try:
-            result = self.client.table("subscribers").insert(subscriber.model_dump(exclude_none=True)).execute()
+            query = self.client.table("subscribers").insert(_dump_nonnull(subscriber))
+            result = await asyncio.to_thread(query.execute)
             if result.data:
                 return Subscriber(**result.data[0])
         except Exception as e:
             logger.error(f"Error adding subscriber: {e}")
         return None
 
+    async def add_subscribers(self, subscribers: List[Subscriber]) -> List[Subscriber]:
+        """Add many newsletter subscribers in a single insert request."""
+        if not subscribers:
+            return []
+        try:
+            rows = [_dump_nonnull(s) for s in subscribers]
+            result = await asyncio.to_thread(self.client.table("subscribers").insert(rows).execute)
+            return [Subscriber(**s) for s in result.data]
+        except Exception as e:
+            logger.error(f"Error adding subscribers: {e}")
+        return []
+
     async def get_user_subscribers(self, user_id: str) -> List[Subscriber]:
         """Get all subscribers for a user."""
         try:
-            result = self.client.table("subscribers").select("*").eq("user_id", user_id).execute()
+            pool = await get_pg_pool()
+            if pool is not None:
+                rows = await pool.fetch(_SUBSCRIBERS_SQL, user_id)
+                return [Subscriber(**_stringify_ids(dict(r))) for r in rows]
+            query = self.client.table("subscribers").select(_SUBSCRIBER_COLS).eq("user_id", user_id)
+            result = await asyncio.to_thread(query.execute)
             return [Subscriber(**s) for s in result.data]
         except Exception as e:
             logger.error(f"Error getting subscribers: {e}")
         return []
 
+    async def get_subscriber_emails(self, user_id: str) -> List[str]:
+        """Get just the subscriber email addresses for a user (send path)."""
+        try:
+            query = self.client.table("subscribers").select("email").eq("user_id", user_id)
+            result = await asyncio.to_thread(query.execute)
+            return [s["email"] for s in result.data]
+        except Exception as e:
+            logger.error(f"Error getting subscriber emails: {e}")
+        return []
+
+    async def count_subscribers(self, user_id: str) -> int:
+        """Count a user's subscribers without transferring any rows."""
+        try:
+            query = (
+                self.client.table("subscribers")
+                .select("id", count="exact")
+                .eq("user_id", user_id)
+                .limit(0)
+            )
+            result = await asyncio.to_thread(query.execute)
+            return result.count or 0
+        except Exception as e:
+            logger.error(f"Error counting subscribers: {e}")
+        return 0
+
     async def remove_subscriber(self, user_id: str, email: str) -> bool:
         """Remove a subscriber."""
         try:
-            self.client.table("subscribers").delete().eq("user_id", user_id).eq("email", email).execute()
+            query = (
+                self.client.table("subscribers")
+                .delete()
+                .eq("user_id", user_id)
+                .eq("email", email)
+            )
+            await asyncio.to_thread(query.execute)
             return True
         except Exception as e:
             logger.error(f"Error removing subscriber: {e}")
@@ -287,11 +493,11 @@ class Database:
     async def increment_episode_count(self, user_id: str) -> bool:
         """Increment user's episode count for the month."""
         try:
-            # Get current count
-            profile = await self.get_user_profile(user_id)
-            if profile:
-                new_count = profile.episodes_this_month + 1
-                return await self.update_user_profile(user_id, {"episodes_this_month": new_count})
+            # Single atomic UPDATE ... RETURNING on the server (see SCHEMA_SQL)
+            query = self.client.rpc("increment_episode_count", {"uid": user_id})
+            result = await asyncio.to_thread(query.execute)
+            _profile_cache.delete(user_id)
+            return result.data is not None
         except Exception as e:
             logger.error(f"Error incrementing episode count: {e}")
         return False
@@ -299,7 +505,9 @@ class Database:
     async def reset_monthly_counts(self) -> bool:
         """Reset all users' monthly episode counts (run on 1st of month)."""
         try:
-            self.client.table("profiles").update({"episodes_this_month": 0}).execute()
+            query = self.client.table("profiles").update({"episodes_this_month": 0})
+            await asyncio.to_thread(query.execute)
+            _profile_cache.clear()
             return True
         except Exception as e:
             logger.error(f"Error resetting monthly counts: {e}")
@@ -372,20 +580,31 @@ ALTER TABLE episodes ENABLE ROW LEVEL SECURITY;
 ALTER TABLE subscribers ENABLE ROW LEVEL SECURITY;
 
 -- RLS Policies
-CREATE POLICY IF NOT EXISTS "Users can view own profile" ON profiles FOR SELECT USING (auth.uid() = id);
-CREATE POLICY IF NOT EXISTS "Users can update own profile" ON profiles FOR UPDATE USING (auth.uid() = id);
-
-CREATE POLICY IF NOT EXISTS "Users can view own shows" ON shows FOR SELECT USING (auth.uid() = user_id);
-CREATE POLICY IF NOT EXISTS "Users can create own shows" ON shows FOR INSERT WITH CHECK (auth.uid() = user_id);
-CREATE POLICY IF NOT EXISTS "Users can update own shows" ON shows FOR UPDATE USING (auth.uid() = user_id);
-CREATE POLICY IF NOT EXISTS "Users can delete own shows" ON shows FOR DELETE USING (auth.uid() = user_id);
-
-CREATE POLICY IF NOT EXISTS "Users can view own episodes" ON episodes FOR SELECT USING (auth.uid() = user_id);
-CREATE POLICY IF NOT EXISTS "Users can create own episodes" ON episodes FOR INSERT WITH CHECK (auth.uid() = user_id);
-CREATE POLICY IF NOT EXISTS "Users can update own episodes" ON episodes FOR UPDATE USING (auth.uid() = user_id);
-
-CREATE POLICY IF NOT EXISTS "Users can view own subscribers" ON subscribers FOR SELECT USING (auth.uid() = user_id);
-CREATE POLICY IF NOT EXISTS "Users can manage own subscribers" ON subscribers FOR ALL USING (auth.uid() = user_id);
+CREATE POLICY IF NOT EXISTS "Users can view own profile" ON profiles
+    FOR SELECT USING (auth.uid() = id);
+CREATE POLICY IF NOT EXISTS "Users can update own profile" ON profiles
+    FOR UPDATE USING (auth.uid() = id);
+
+CREATE POLICY IF NOT EXISTS "Users can view own shows" ON shows
+    FOR SELECT USING (auth.uid() = user_id);
+CREATE POLICY IF NOT EXISTS "Users can create own shows" ON shows
+    FOR INSERT WITH CHECK (auth.uid() = user_id);
+CREATE POLICY IF NOT EXISTS "Users can update own shows" ON shows
+    FOR UPDATE USING (auth.uid() = user_id);
+CREATE POLICY IF NOT EXISTS "Users can delete own shows" ON shows
+    FOR DELETE USING (auth.uid() = user_id);
+
+CREATE POLICY IF NOT EXISTS "Users can view own episodes" ON episodes
+    FOR SELECT USING (auth.uid() = user_id);
+CREATE POLICY IF NOT EXISTS "Users can create own episodes" ON episodes
+    FOR INSERT WITH CHECK (auth.uid() = user_id);
+CREATE POLICY IF NOT EXISTS "Users can update own episodes" ON episodes
+    FOR UPDATE USING (auth.uid() = user_id);
+
+CREATE POLICY IF NOT EXISTS "Users can view own subscribers" ON subscribers
+    FOR SELECT USING (auth.uid() = user_id);
+CREATE POLICY IF NOT EXISTS "Users can manage own subscribers" ON subscribers
+    FOR ALL USING (auth.uid() = user_id);
 
 -- Function to auto-create profile on signup
 CREATE OR REPLACE FUNCTION public.handle_new_user()
@@ -397,6 +616,15 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql SECURITY DEFINER;
 
+-- Atomic monthly episode counter (avoids read-modify-write from the app)
+CREATE OR REPLACE FUNCTION public.increment_episode_count(uid UUID)
+RETURNS INTEGER AS $$
+    UPDATE public.profiles
+    SET episodes_this_month = episodes_this_month + 1
+    WHERE id = uid
+    RETURNING episodes_this_month;
+$$ LANGUAGE sql;
+
 -- Trigger for auto-creating profile
 DROP TRIGGER IF EXISTS on_auth_user_created ON auth.users;
 CREATE TRIGGER on_auth_user_created
@@ -10,20 +10,72 @@ For demo/development, saves emails to local files.
 """
 
 import os
+import gzip
+import string
+import asyncio
 import smtplib
+import sqlite3
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, List
 import logging
 import json
 
+import httpx
 from pydantic import BaseModel, EmailStr
 
 
 logger = logging.getLogger(__name__)
 
+RESEND_BATCH_URL = "https://api.resend.com/emails/batch"
+SENDGRID_API_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Provider limits per API call
+RESEND_BATCH_SIZE = 100
+SENDGRID_PERSONALIZATIONS_MAX = 1000
+
+# Provider responses that mean the message was accepted
+SUCCESS_STATUS_CODES = frozenset({200, 201, 202})
+
+# Cap on provider calls in flight at once per EmailService
+EMAIL_CONCURRENCY = int(os.getenv("EMAIL_CONCURRENCY", "10"))
+
+# Local previews larger than this are stored gzip-compressed (.html.gz)
+PREVIEW_GZIP_THRESHOLD = 64_000
+
+
+# Demo-mode preview page, parsed once at import
+_PREVIEW_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Email Preview: $subject</title>
+    <style>
+        body { font-family: -apple-system, sans-serif; background: #f5f5f5; padding: 20px; }
+        .meta { background: #333; color: white; padding: 20px; border-radius: 10px 10px 0 0; }
+        .meta p { margin: 5px 0; }
+        .content { background: white; padding: 0; border-radius: 0 0 10px 10px; }
+    </style>
+</head>
+<body>
+    <div class="meta">
+        <p><strong>To:</strong> $to_list</p>
+        <p><strong>From:</strong> $from_name &lt;$from_email&gt;</p>
+        <p><strong>Subject:</strong> $subject</p>
+        <p><strong>Sent:</strong> $sent_at</p>
+        <p style="color: #00ff88;"><strong>Mode:</strong> Demo (saved locally)</p>
+    </div>
+    <div class="content">
+        $content
+    </div>
+</body>
+</html>
+""")
+
 
 class EmailRecipient(BaseModel):
     """Email recipient."""
@@ -41,13 +93,42 @@ class EmailMessage(BaseModel):
     from_name: Optional[str] = None
     reply_to: Optional[str] = None
 
+    @cached_property
+    def to_emails(self) -> List[str]:
+        """Recipient addresses, built once and shared by every provider."""
+        return [r.email for r in self.to]
+
 
 class EmailResult(BaseModel):
-    """Result of email send."""
+    """
+    Result of email send.
+
+    A send that reached some recipients still counts as a success;
+    failed_recipients lists the addresses to retry, so a retry doesn't
+    mail everyone else twice.
+    """
     success: bool
     message_id: Optional[str] = None
     error: Optional[str] = None
     recipients_count: int = 0
+    failed_recipients: List[str] = []
+
+
+def _fan_out_result(
+    total: int,
+    failed: List[str],
+    message_id: Optional[str] = None,
+    error: Optional[str] = None,
+) -> EmailResult:
+    """EmailResult for a send split into calls that can fail independently."""
+    delivered = total - len(failed)
+    return EmailResult(
+        success=delivered > 0 or not failed,
+        message_id=message_id,
+        error=error if failed else None,
+        recipients_count=delivered,
+        failed_recipients=failed,
+    )
 
 
 class EmailService:
@@ -67,8 +148,66 @@ class EmailService:
 
         # Determine provider
         self.provider = self._detect_provider()
+        # Default sender, read once rather than on every send
+        self._from_email = os.getenv("FROM_EMAIL")
         logger.info(f"Email service using provider: {self.provider}")
 
+        # Keep-alive pool for the HTTP providers, created on first use
+        self._http: Optional[httpx.AsyncClient] = None
+        # Admission control so large sends don't trip provider rate limits
+        self._send_limit = asyncio.Semaphore(EMAIL_CONCURRENCY)
+        # Logged-in SMTP connection reused across sends (SMTP provider only)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+
+        # Provider setup done once here rather than on every send; the SES
+        # SDK is only imported when SES is the selected provider
+        self._auth_headers: dict = {}
+        self._ses = None
+        if self.provider == "resend":
+            self._auth_headers = {"Authorization": f"Bearer {os.getenv('RESEND_API_KEY')}"}
+        elif self.provider == "sendgrid":
+            self._auth_headers = {"Authorization": f"Bearer {os.getenv('SENDGRID_API_KEY')}"}
+        elif self.provider == "ses":
+            try:
+                import boto3
+
+                self._ses = boto3.client(
+                    "ses",
+                    region_name=os.getenv("AWS_SES_REGION", "us-east-1"),
+                )
+            except Exception as e:
+                logger.error(f"SES client setup failed: {e}")
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client for Resend/SendGrid calls."""
+        if self._http is None:
+            # Sends are often minutes apart; keep the TLS connection to the
+            # provider open well past httpx's 5s default idle expiry
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=90),
+            )
+        return self._http
+
+    async def _post(self, url: str, headers: dict, payload) -> httpx.Response:
+        """POST to a provider API, waiting for a free send slot first."""
+        async with self._send_limit:
+            return await self._get_http().post(url, headers=headers, json=payload)
+
+    async def aclose(self):
+        """Close the shared HTTP client and any open SMTP connection."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except smtplib.SMTPException:
+                    pass
+                self._smtp = None
+
     def _detect_provider(self) -> str:
         """Detect which email provider to use."""
         if os.getenv("RESEND_API_KEY"):
@@ -117,143 +256,251 @@ class EmailService:
             to=[EmailRecipient(email=r) for r in recipients],
             subject=subject,
             html_content=newsletter_html,
-            from_email=from_email or os.getenv("FROM_EMAIL", "newsletter@podcastos.com"),
+            from_email=from_email or self._from_email or "newsletter@podcastos.com",
             from_name=from_name,
         )
 
         return await self.send(message)
 
     async def _send_resend(self, message: EmailMessage) -> EmailResult:
-        """Send via Resend."""
-        try:
-            import resend
-
-            resend.api_key = os.getenv("RESEND_API_KEY")
+        """
+        Send via Resend.
 
+        Each recipient gets their own message (so addresses are not exposed
+        to each other), submitted through the batch endpoint 100 at a time.
+        """
+        try:
             # Resend requires a verified domain, use their test domain for dev
-            from_email = message.from_email or os.getenv("FROM_EMAIL", "onboarding@resend.dev")
+            from_email = message.from_email or self._from_email or "onboarding@resend.dev"
             from_name = message.from_name or "PodcastOS"
-
-            response = resend.Emails.send({
-                "from": f"{from_name} <{from_email}>",
-                "to": [r.email for r in message.to],
-                "subject": message.subject,
-                "html": message.html_content,
-            })
-
-            return EmailResult(
-                success=True,
-                message_id=response.get("id"),
-                recipients_count=len(message.to),
+            sender = f"{from_name} <{from_email}>"
+            headers = self._auth_headers
+
+            chunks = [
+                message.to_emails[start:start + RESEND_BATCH_SIZE]
+                for start in range(0, len(message.to), RESEND_BATCH_SIZE)
+            ]
+            responses = await asyncio.gather(
+                *(
+                    self._post(
+                        RESEND_BATCH_URL,
+                        headers,
+                        [
+                            {
+                                "from": sender,
+                                "to": [email],
+                                "subject": message.subject,
+                                "html": message.html_content,
+                            }
+                            for email in chunk
+                        ],
+                    )
+                    for chunk in chunks
+                ),
+                return_exceptions=True,
             )
 
+            # A failed batch only fails its own recipients
+            failed, error, message_id = [], None, None
+            for chunk, response in zip(chunks, responses):
+                if not isinstance(response, Exception):
+                    try:
+                        response.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        response = e
+                if isinstance(response, Exception):
+                    logger.error(f"Resend batch error: {response}")
+                    failed.extend(chunk)
+                    error = str(response)
+                elif message_id is None:
+                    sent = response.json().get("data")
+                    message_id = sent[0].get("id") if sent else None
+
+            return _fan_out_result(len(message.to), failed, message_id, error)
+
         except Exception as e:
             logger.error(f"Resend error: {e}")
             return EmailResult(success=False, error=str(e))
 
     async def _send_sendgrid(self, message: EmailMessage) -> EmailResult:
-        """Send via SendGrid."""
-        try:
-            import sendgrid
-            from sendgrid.helpers.mail import Mail, Email, To, Content
-
-            sg = sendgrid.SendGridAPIClient(api_key=os.getenv("SENDGRID_API_KEY"))
-
-            from_email = Email(
-                message.from_email or os.getenv("FROM_EMAIL"),
-                message.from_name
-            )
+        """
+        Send via SendGrid.
 
-            to_emails = [To(r.email, r.name) for r in message.to]
+        One personalization per recipient keeps each To header private;
+        up to 1000 personalizations go in a single API call.
+        """
+        try:
+            from_email = {"email": message.from_email or self._from_email}
+            if message.from_name:
+                from_email["name"] = message.from_name
 
-            mail = Mail(
-                from_email=from_email,
-                to_emails=to_emails,
-                subject=message.subject,
-                html_content=Content("text/html", message.html_content),
-            )
+            personalizations = [
+                {"to": [{"email": r.email, "name": r.name} if r.name else {"email": r.email}]}
+                for r in message.to
+            ]
 
+            content = [{"type": "text/html", "value": message.html_content}]
             if message.plain_text:
-                mail.add_content(Content("text/plain", message.plain_text))
-
-            response = sg.send(mail)
-
-            return EmailResult(
-                success=response.status_code in [200, 201, 202],
-                message_id=response.headers.get("X-Message-Id"),
-                recipients_count=len(message.to),
+                # SendGrid requires text/plain to precede text/html
+                content.insert(0, {"type": "text/plain", "value": message.plain_text})
+
+            headers = self._auth_headers
+            starts = range(0, len(personalizations), SENDGRID_PERSONALIZATIONS_MAX)
+            responses = await asyncio.gather(
+                *(
+                    self._post(
+                        SENDGRID_API_URL,
+                        headers,
+                        {
+                            "personalizations": (
+                                personalizations[start:start + SENDGRID_PERSONALIZATIONS_MAX]
+                            ),
+                            "from": from_email,
+                            "subject": message.subject,
+                            "content": content,
+                        },
+                    )
+                    for start in starts
+                ),
+                return_exceptions=True,
             )
 
+            # A failed call only fails the recipients in its own chunk
+            failed, error, message_id = [], None, None
+            for start, response in zip(starts, responses):
+                if isinstance(response, Exception):
+                    error = str(response)
+                elif response.status_code not in SUCCESS_STATUS_CODES:
+                    error = f"SendGrid returned {response.status_code}"
+                else:
+                    message_id = message_id or response.headers.get("X-Message-Id")
+                    continue
+                logger.error(f"SendGrid error: {error}")
+                failed.extend(message.to_emails[start:start + SENDGRID_PERSONALIZATIONS_MAX])
+
+            return _fan_out_result(len(message.to), failed, message_id, error)
+
         except Exception as e:
             logger.error(f"SendGrid error: {e}")
             return EmailResult(success=False, error=str(e))
 
     async def _send_ses(self, message: EmailMessage) -> EmailResult:
-        """Send via AWS SES."""
-        try:
-            import boto3
-
-            ses = boto3.client(
-                "ses",
-                region_name=os.getenv("AWS_SES_REGION", "us-east-1"),
-            )
+        """
+        Send via AWS SES.
 
-            response = ses.send_email(
-                Source=f"{message.from_name} <{message.from_email}>",
-                Destination={
-                    "ToAddresses": [r.email for r in message.to],
-                },
-                Message={
-                    "Subject": {"Data": message.subject},
-                    "Body": {
-                        "Html": {"Data": message.html_content},
-                        "Text": {"Data": message.plain_text or ""},
-                    },
+        One SendEmail call per recipient (SES caps Destination at 50 and
+        subscribers must not see each other), fanned out concurrently.
+        """
+        try:
+            if self._ses is None:
+                raise RuntimeError("SES client is not configured")
+            body = {
+                "Subject": {"Data": message.subject},
+                "Body": {
+                    "Html": {"Data": message.html_content},
+                    "Text": {"Data": message.plain_text or ""},
                 },
+            }
+            source = f"{message.from_name} <{message.from_email}>"
+            results = await asyncio.gather(
+                *(self._send_ses_one(source, email, body) for email in message.to_emails),
+                return_exceptions=True,
             )
 
-            return EmailResult(
-                success=True,
-                message_id=response["MessageId"],
-                recipients_count=len(message.to),
-            )
+            failed, error, message_id = [], None, None
+            for email, result in zip(message.to_emails, results):
+                if isinstance(result, Exception):
+                    logger.error(f"SES error for {email}: {result}")
+                    failed.append(email)
+                    error = str(result)
+                elif message_id is None:
+                    message_id = result["MessageId"]
+
+            return _fan_out_result(len(message.to), failed, message_id, error)
 
         except Exception as e:
             logger.error(f"SES error: {e}")
             return EmailResult(success=False, error=str(e))
 
-    async def _send_smtp(self, message: EmailMessage) -> EmailResult:
-        """Send via SMTP."""
-        try:
-            smtp_host = os.getenv("SMTP_HOST")
-            smtp_port = int(os.getenv("SMTP_PORT", "587"))
-            smtp_user = os.getenv("SMTP_USER")
-            smtp_pass = os.getenv("SMTP_PASS")
+    async def _send_ses_one(self, source: str, to_email: str, body: dict) -> dict:
+        """Send one SES message, waiting for a free send slot first."""
+        async with self._send_limit:
+            return await asyncio.to_thread(
+                self._ses.send_email,
+                Source=source,
+                Destination={"ToAddresses": [to_email]},
+                Message=body,
+            )
 
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = message.subject
-            msg["From"] = f"{message.from_name} <{message.from_email}>"
-            msg["To"] = ", ".join([r.email for r in message.to])
+    async def _send_smtp(self, message: EmailMessage) -> EmailResult:
+        """
+        Send via SMTP.
 
-            if message.plain_text:
-                msg.attach(MIMEText(message.plain_text, "plain"))
-            msg.attach(MIMEText(message.html_content, "html"))
+        SMTP has no batch API, so each recipient gets an individual message,
+        all sent over one reused connection.
+        """
+        try:
+            results = await asyncio.gather(
+                *(self._send_smtp_one(message, email) for email in message.to_emails),
+                return_exceptions=True,
+            )
 
-            with smtplib.SMTP(smtp_host, smtp_port) as server:
-                server.starttls()
-                if smtp_user and smtp_pass:
-                    server.login(smtp_user, smtp_pass)
-                server.send_message(msg)
+            failed, error = [], None
+            for email, result in zip(message.to_emails, results):
+                if isinstance(result, Exception):
+                    logger.error(f"SMTP error for {email}: {result}")
+                    failed.append(email)
+                    error = str(result)
 
-            return EmailResult(
-                success=True,
-                recipients_count=len(message.to),
-            )
+            return _fan_out_result(len(message.to), failed, error=error)
 
         except Exception as e:
             logger.error(f"SMTP error: {e}")
             return EmailResult(success=False, error=str(e))
 
+    async def _send_smtp_one(self, message: EmailMessage, to_email: str):
+        """Deliver one SMTP message, waiting for a free send slot first."""
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = message.subject
+        msg["From"] = f"{message.from_name} <{message.from_email}>"
+        msg["To"] = to_email
+
+        if message.plain_text:
+            msg.attach(MIMEText(message.plain_text, "plain"))
+        msg.attach(MIMEText(message.html_content, "html"))
+
+        async with self._send_limit:
+            await asyncio.to_thread(self._smtp_deliver, msg)
+
+    def _smtp_connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new SMTP connection."""
+        smtp_host = os.getenv("SMTP_HOST")
+        smtp_port = int(os.getenv("SMTP_PORT", "587"))
+        smtp_user = os.getenv("SMTP_USER")
+        smtp_pass = os.getenv("SMTP_PASS")
+
+        server = smtplib.SMTP(smtp_host, smtp_port)
+        server.starttls()
+        if smtp_user and smtp_pass:
+            server.login(smtp_user, smtp_pass)
+        return server
+
+    def _smtp_deliver(self, msg: MIMEMultipart):
+        """
+        Blocking SMTP delivery of a single message.
+
+        Reuses the logged-in connection and only re-dials when the server
+        has dropped it.
+        """
+        with self._smtp_lock:
+            if self._smtp is None:
+                self._smtp = self._smtp_connect()
+            try:
+                self._smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = self._smtp_connect()
+                self._smtp.send_message(msg)
+
     async def _send_local(self, message: EmailMessage) -> EmailResult:
         """Save email locally (demo mode)."""
         try:
@@ -262,35 +509,27 @@ class EmailService:
             filepath = self.output_dir / filename
 
             # Create a preview wrapper
-            preview_html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Email Preview: {message.subject}</title>
-    <style>
-        body {{ font-family: -apple-system, sans-serif; background: #f5f5f5; padding: 20px; }}
-        .meta {{ background: #333; color: white; padding: 20px; border-radius: 10px 10px 0 0; }}
-        .meta p {{ margin: 5px 0; }}
-        .content {{ background: white; padding: 0; border-radius: 0 0 10px 10px; }}
-    </style>
-</head>
-<body>
-    <div class="meta">
-        <p><strong>To:</strong> {', '.join([r.email for r in message.to])}</p>
-        <p><strong>From:</strong> {message.from_name} &lt;{message.from_email}&gt;</p>
-        <p><strong>Subject:</strong> {message.subject}</p>
-        <p><strong>Sent:</strong> {datetime.now().isoformat()}</p>
-        <p style="color: #00ff88;"><strong>Mode:</strong> Demo (saved locally)</p>
-    </div>
-    <div class="content">
-        {message.html_content}
-    </div>
-</body>
-</html>
-"""
+            preview_html = _PREVIEW_TEMPLATE.substitute(
+                subject=message.subject,
+                to_list=", ".join(message.to_emails),
+                from_name=message.from_name,
+                from_email=message.from_email,
+                sent_at=datetime.now().isoformat(),
+                content=message.html_content,
+            )
 
-            with open(filepath, "w") as f:
-                f.write(preview_html)
+            # Write to a temp file and swap it in so a crash never leaves a
+            # half-written preview behind
+            if len(preview_html) > PREVIEW_GZIP_THRESHOLD:
+                filepath = filepath.with_name(filepath.name + ".gz")
+                tmp_path = filepath.with_suffix(".tmp")
+                with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                    f.write(preview_html)
+            else:
+                tmp_path = filepath.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    f.write(preview_html)
+            os.replace(tmp_path, filepath)
 
             logger.info(f"Email saved locally: {filepath}")
 
@@ -305,60 +544,113 @@ class EmailService:
             return EmailResult(success=False, error=str(e))
 
 
-# Subscriber management (simple file-based for demo)
+# Subscriber management (simple SQLite-backed store for demo)
 class SubscriberList:
-    """Simple subscriber list management."""
+    """
+    Simple subscriber list management.
 
-    def __init__(self, file_path: str = "./output/subscribers.json"):
-        self.file_path = Path(file_path)
-        self._ensure_file()
+    One SQLite connection is shared by every caller, including
+    asyncio.to_thread workers, so each use of it holds _lock.
+    """
 
-    def _ensure_file(self):
-        """Ensure subscriber file exists."""
-        if not self.file_path.exists():
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.file_path, "w") as f:
-                json.dump({"subscribers": []}, f)
+    def __init__(self, file_path: str = "./output/subscribers.db"):
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.file_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS subscribers ("
+            "email TEXT PRIMARY KEY, name TEXT, subscribed_at TEXT)"
+        )
+        self._conn.commit()
+        self._import_legacy_json()
+
+    def _import_legacy_json(self):
+        """One-time import of the old subscribers.json list, if present."""
+        legacy = self.file_path.with_suffix(".json")
+        if not legacy.exists():
+            return
+        with open(legacy, "r") as f:
+            data = json.load(f)
+        rows = [
+            (s["email"], s.get("name"), s.get("subscribed_at"))
+            for s in data.get("subscribers", [])
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO subscribers (email, name, subscribed_at) VALUES (?, ?, ?)",
+                rows,
+            )
+        legacy.rename(legacy.with_suffix(".json.imported"))
 
     def add(self, email: str, name: str = None) -> bool:
         """Add a subscriber."""
-        data = self._load()
-        if email not in [s["email"] for s in data["subscribers"]]:
-            data["subscribers"].append({
-                "email": email,
-                "name": name,
-                "subscribed_at": datetime.now().isoformat(),
-            })
-            self._save(data)
-            return True
-        return False
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO subscribers (email, name, subscribed_at) VALUES (?, ?, ?)",
+                (email, name, datetime.now().isoformat()),
+            )
+        return cursor.rowcount > 0
 
     def remove(self, email: str) -> bool:
         """Remove a subscriber."""
-        data = self._load()
-        original_count = len(data["subscribers"])
-        data["subscribers"] = [s for s in data["subscribers"] if s["email"] != email]
-        if len(data["subscribers"]) < original_count:
-            self._save(data)
-            return True
-        return False
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM subscribers WHERE email = ?", (email,))
+        return cursor.rowcount > 0
 
     def list_all(self) -> List[str]:
         """Get all subscriber emails."""
-        data = self._load()
-        return [s["email"] for s in data["subscribers"]]
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT email FROM subscribers ORDER BY subscribed_at"
+            ).fetchall()
+        return [row[0] for row in rows]
 
     def count(self) -> int:
         """Get subscriber count."""
-        return len(self.list_all())
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM subscribers").fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Shared subscriber store, so the SQLite connection is opened once
+_subscriber_list: Optional[SubscriberList] = None
+
+
+def get_subscriber_list() -> SubscriberList:
+    """Get or create the process-wide SubscriberList."""
+    global _subscriber_list
+    if _subscriber_list is None:
+        _subscriber_list = SubscriberList()
+    return _subscriber_list
+
+
+# Shared service, so the provider HTTP/SMTP connections outlive a single send
+_email_service: Optional[EmailService] = None
+
+
+def get_email_service() -> EmailService:
+    """Get or create the process-wide EmailService."""
+    global _email_service
+    if _email_service is None:
+        _email_service = EmailService()
+    return _email_service
 
-    def _load(self) -> dict:
-        with open(self.file_path, "r") as f:
-            return json.load(f)
 
-    def _save(self, data: dict):
-        with open(self.file_path, "w") as f:
-            json.dump(data, f, indent=2)
+async def close_email_service():
+    """Close the shared EmailService and SubscriberList connections."""
+    global _email_service, _subscriber_list
+    if _email_service is not None:
+        await _email_service.aclose()
+        _email_service = None
+    if _subscriber_list is not None:
+        _subscriber_list.close()
+        _subscriber_list = None
 
 
 # Convenience function
@@ -368,7 +660,7 @@ async def send_newsletter_email(
     to_emails: List[str],
 ) -> EmailResult:
     """Quick function to send a newsletter."""
-    service = EmailService()
+    service = get_email_service()
     return await service.send_newsletter(
         newsletter_html=html_content,
         subject=subject,
@@ -0,0 +1,115 @@
+"""
+Content generation jobs for PodcastOS.
+
+POST /api/generate returns a job ID immediately; the generation itself runs
+as an asyncio task off the request path. Job status is written to a store
+every worker shares (Redis when REDIS_URL is set, otherwise a file cache), so
+any worker process can answer status polls. The store is kept apart from the
+research cache, so clearing research results never drops a live job.
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+from typing import Awaitable, Callable, Optional
+
+from src.utils.cache import CacheBackend, FileCache, RedisCache
+
+logger = logging.getLogger(__name__)
+
+# Finished job records are kept this long for status polls
+JOB_TTL = 24 * 3600
+
+# Generations running at once per worker; the rest wait as "queued"
+GENERATION_CONCURRENCY = int(os.getenv("GENERATION_CONCURRENCY", "2"))
+
+_generation_slots: Optional[asyncio.Semaphore] = None
+
+# Strong references so running tasks are not garbage collected
+_tasks: set = set()
+
+# Job status store, created on first use
+_job_store: Optional[CacheBackend] = None
+
+
+def get_job_store() -> CacheBackend:
+    """Get the job status store, separate from the global research cache."""
+    global _job_store
+    if _job_store is None:
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            # Outside the research cache's "podcastos:*" keys, which its
+            # clear() deletes
+            _job_store = RedisCache(redis_url, prefix="jobs")
+        else:
+            _job_store = FileCache(os.getenv("JOBS_CACHE_DIR", "cache/jobs"))
+    return _job_store
+
+
+def _job_key(job_id: str) -> str:
+    return f"generation_job:{job_id}"
+
+
+async def _save_job(job_id: str, status: str, **fields) -> None:
+    # File/Redis I/O, so it runs off the event loop
+    record = {"id": job_id, "status": status, **fields}
+    write = asyncio.ensure_future(
+        asyncio.to_thread(get_job_store().set, _job_key(job_id), record, ttl=JOB_TTL)
+    )
+    try:
+        await asyncio.shield(write)
+    except asyncio.CancelledError:
+        # Let the write land first, so it can't overwrite the "failed"
+        # record the cancelled job saves next
+        await write
+        raise
+
+
+async def get_job(job_id: str) -> Optional[dict]:
+    """Get a job's status record, or None if unknown or expired."""
+    return await asyncio.to_thread(get_job_store().get, _job_key(job_id))
+
+
+async def submit_job(run: Callable[[], Awaitable[dict]]) -> str:
+    """
+    Schedule a generation and return its job ID.
+
+    Args:
+        run: Coroutine function producing the job's result dict
+
+    Returns:
+        Job ID for get_job()
+    """
+    global _generation_slots
+    if _generation_slots is None:
+        _generation_slots = asyncio.Semaphore(GENERATION_CONCURRENCY)
+
+    job_id = secrets.token_urlsafe(12)
+    await _save_job(job_id, "queued")
+
+    task = asyncio.create_task(_run_job(job_id, run))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job_id
+
+
+async def _run_job(job_id: str, run: Callable[[], Awaitable[dict]]) -> None:
+    async with _generation_slots:
+        try:
+            await _save_job(job_id, "running")
+            result = await run()
+            await _save_job(job_id, "completed", result=result)
+        except asyncio.CancelledError:
+            await _save_job(job_id, "failed", error="Server shut down during generation")
+            raise
+        except Exception as e:
+            logger.error(f"Generation job {job_id} failed: {e}")
+            await _save_job(job_id, "failed", error=str(e))
+
+
+async def cancel_jobs() -> None:
+    """Cancel in-flight jobs (on shutdown) and wait for them to record it."""
+    for task in list(_tasks):
+        task.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
@@ -3,31 +3,76 @@ PodcastOS - Public SaaS Application
 Production-Ready v2.0
 """
 
+import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
 
 # Import Routers
+from src.app.config import get_settings
 from src.app.routers import pages, api, auth, billing
+from src.app.email_service import get_email_service, close_email_service
+from src.app.jobs import cancel_jobs
+from src.app.static_files import CachedStaticFiles, PrecompressedStaticFiles
 
 load_dotenv(override=True)
 
+logger = logging.getLogger(__name__)
+
+# Health checks are polled constantly; serve a fixed body
+_HEALTH_BODY = b'{"status":"healthy","mode":"production"}'
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients once per process and close them on shutdown."""
+    # Supabase is optional; the database module connects at import and
+    # raises when it is not configured, so handlers check app.state.db
+    database = None
+    try:
+        from src.app import database
+        await database.get_pg_pool()
+    except Exception as e:
+        logger.warning(f"Database unavailable: {e}")
+    app.state.db = database.db if database else None
+    app.state.email = get_email_service()
+    try:
+        app.state.engine = api.get_engine()
+    except Exception as e:
+        logger.warning(f"Content engine not initialized at startup: {e}")
+        app.state.engine = None
+
+    yield
+
+    await cancel_jobs()
+    await close_email_service()
+    if database:
+        await database.close_pg_pool()
+
+
 def create_app() -> FastAPI:
-    app = FastAPI(title="PodcastOS", version="2.0.0")
+    app = FastAPI(
+        title="PodcastOS",
+        version="2.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+    app.state.settings = get_settings()
 
     # Static Files
     static_dir = Path(__file__).parent / "static"
     if not static_dir.exists():
         static_dir.mkdir(parents=True)
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    app.mount("/static", PrecompressedStaticFiles(directory=str(static_dir)), name="static")
 
     # Output Files (for downloads)
     output_dir = Path("./output")
     if not output_dir.exists():
         output_dir.mkdir(parents=True)
-    app.mount("/files", StaticFiles(directory=str(output_dir)), name="files")
+    app.mount("/files", CachedStaticFiles(directory=str(output_dir)), name="files")
 
     # Include Routers
     app.include_router(pages.router)
@@ -39,7 +84,7 @@ def create_app() -> FastAPI:
 
     @app.get("/health")
     async def health():
-        return {"status": "healthy", "mode": "production"}
+        return Response(content=_HEALTH_BODY, media_type="application/json")
 
     return app
 
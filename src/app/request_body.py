@@ -0,0 +1,48 @@
+"""
+Raw JSON body validation for hot POST endpoints.
+
+FastAPI normally json.loads() the body into a dict and then validates the
+dict; json_body() hands the raw bytes straight to pydantic-core's JSON
+validator instead. Errors keep FastAPI's 422 shape.
+"""
+
+from typing import Type, TypeVar
+
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _body_error(error: dict) -> dict:
+    """Prefix the error location with "body", like FastAPI does."""
+    error = {**error, "loc": ("body", *error["loc"])}
+    # Malformed JSON reports the raw body as its input, which may not even
+    # be UTF-8; FastAPI reports {} there too
+    if isinstance(error.get("input"), bytes):
+        error["input"] = {}
+    return error
+
+
+def json_body(model: Type[ModelT]):
+    """Dependency that validates the request body directly into `model`."""
+
+    async def dependency(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            errors = [_body_error(error) for error in e.errors(include_url=False)]
+            raise RequestValidationError(errors)
+
+    return dependency
+
+
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """openapi_extra documenting `model` as the request body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
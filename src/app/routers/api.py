@@ -1,59 +1,103 @@
-
-from fastapi import APIRouter, BackgroundTasks, HTTPException
-from pydantic import BaseModel
-from typing import Optional
+import os
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict
+from typing import Literal, Optional
+from src.app.jobs import submit_job, get_job
+from src.app.request_body import json_body, json_body_openapi
+from src.utils.duration import format_duration
+from src.utils.validation import is_job_id
 from src.intelligence.synthesis.content_engine import ContentEngine, ContentInput
 
 router = APIRouter()
 
+# Plans that include each output
+NEWSLETTER_PLANS = frozenset({"newsletter", "bundle"})
+PODCAST_PLANS = frozenset({"podcast", "bundle"})
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> ContentEngine:
+    """Shared ContentEngine; its model/TTS clients are reused across jobs."""
+    return ContentEngine(output_dir="./output")
+
+
 class GenerateRequest(BaseModel):
-    plan: str = "bundle"
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    plan: Literal["newsletter", "podcast", "bundle"] = "bundle"
     brand_name: str = "Tech Daily"
     topic: Optional[str] = None
     user_content: Optional[str] = None
 
-@router.post("/generate")
-async def generate_content(request: GenerateRequest):
+@router.post("/generate", status_code=202, openapi_extra=json_body_openapi(GenerateRequest))
+async def generate_content(request: GenerateRequest = Depends(json_body(GenerateRequest))):
     """
-    Generate content (Podcast/Newsletter).
-    This handles the core logic that was previously in main.py
+    Queue content generation (Podcast/Newsletter).
+
+    Generation takes minutes, so this returns a job ID right away; poll
+    GET /api/generate/{job_id} for the result.
     """
-    try:
-        engine = ContentEngine(output_dir="./output")
-
-        generate_newsletter = request.plan in ["newsletter", "bundle"]
-        generate_podcast = request.plan in ["podcast", "bundle"]
-
-        input_data = ContentInput(
-            topic=request.topic or "Today's Tech News",
-            user_content=request.user_content,
-            brand_name=request.brand_name,
-            generate_newsletter=generate_newsletter,
-            generate_podcast=generate_podcast,
-        )
-
-        # In a real async worker queue (Celery/RQ) this would be offloaded
-        # For now we await it as per original design
-        result = await engine.generate(input_data)
-
-        return {
-            "success": result.success,
-            "id": result.id,
-            "topic": result.topic,
-            "word_count": result.word_count,
-            "audio_duration_seconds": result.audio_duration_seconds,
-            "newsletter_html_path": result.newsletter_html_path,
-            "newsletter_markdown_path": result.newsletter_markdown_path,
-            "podcast_audio_path": result.podcast_audio_path,
-            "errors": result.errors,
-        }
-
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-        }
+    job_id = await submit_job(lambda: _run_generation(request))
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": f"/api/generate/{job_id}",
+    }
+
+
+@router.get("/generate/{job_id}")
+async def generation_status(job_id: str):
+    """Get the status (and, once completed, the result) of a generation job."""
+    if not is_job_id(job_id):
+        raise HTTPException(status_code=400, detail="Invalid job ID")
+
+    job = await get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+async def _run_generation(request: GenerateRequest) -> dict:
+    """Run the ContentEngine for one request."""
+    engine = get_engine()
+
+    input_data = ContentInput(
+        topic=request.topic or "Today's Tech News",
+        user_content=request.user_content,
+        brand_name=request.brand_name,
+        generate_newsletter=request.plan in NEWSLETTER_PLANS,
+        generate_podcast=request.plan in PODCAST_PLANS,
+    )
+
+    result = await engine.generate(input_data)
+
+    return {
+        "success": result.success,
+        "id": result.id,
+        "topic": result.topic,
+        "word_count": result.word_count,
+        "audio_duration_seconds": result.audio_duration_seconds,
+        "audio_duration_display": format_duration(result.audio_duration_seconds),
+        "newsletter_html_path": result.newsletter_html_path,
+        "newsletter_markdown_path": result.newsletter_markdown_path,
+        "podcast_audio_path": result.podcast_audio_path,
+        # Names under /files/, so clients don't have to split the paths
+        "newsletter_html_file": _file_name(result.newsletter_html_path),
+        "newsletter_markdown_file": _file_name(result.newsletter_markdown_path),
+        "podcast_audio_file": _file_name(result.podcast_audio_path),
+        "errors": result.errors,
+    }
+
+
+def _file_name(path: Optional[str]) -> Optional[str]:
+    return os.path.basename(path) if path else None
+
+_HEALTH_BODY = b'{"status":"online"}'
+
 
 @router.get("/health")
 async def api_health():
-    return {"status": "online"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -3,7 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from typing import Optional
 
-from src.app.auth import AuthService, SignUpRequest, LoginRequest, AuthUser, get_current_user
+from src.app.auth import get_auth_service, SignUpRequest, LoginRequest, AuthUser, get_current_user
 
 router = APIRouter()
 
@@ -25,8 +25,7 @@ class AuthResponse(BaseModel):
 @router.post("/signup", response_model=AuthResponse)
 async def signup(request: SignUpRequest):
     """Sign up a new user."""
-    auth_service = AuthService()
-    result = await auth_service.sign_up(request)
+    result = await get_auth_service().sign_up(request)
 
     if result.success and result.user:
         return AuthResponse(
@@ -48,8 +47,7 @@ async def signup(request: SignUpRequest):
 @router.post("/login", response_model=AuthResponse)
 async def login(request: LoginRequest):
     """Log in an existing user."""
-    auth_service = AuthService()
-    result = await auth_service.login(request)
+    result = await get_auth_service().login(request)
 
     if result.success and result.user:
         return AuthResponse(
@@ -72,8 +70,7 @@ async def login(request: LoginRequest):
 async def logout(user: AuthUser = Depends(get_current_user)):
     """Log out current user."""
     if user:
-        auth_service = AuthService()
-        await auth_service.logout(user.access_token)
+        await get_auth_service().logout(user.access_token)
     return {"success": True}
 
 @router.get("/me", response_model=AuthResponse)
@@ -7,18 +7,27 @@ Provides API endpoints for:
 - Handling webhooks
 """
 
-from fastapi import APIRouter, HTTPException, Request, Header
-from pydantic import BaseModel, Field
-from typing import Optional
-import os
+from fastapi import APIRouter, Depends, HTTPException, Request, Header
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Callable, Optional
+import asyncio
+import hashlib
 import logging
+import re
+import secrets
 
+import orjson
+
+from src.app.config import get_settings
+from src.app.request_body import json_body, json_body_openapi
 from src.app.billing import (
     create_checkout_session,
     verify_payment,
     handle_webhook,
     STRIPE_PRICES,
-    get_price,
+    PUBLIC_PLANS,
+    get_plan,
     format_price,
 )
 
@@ -26,15 +35,45 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/billing", tags=["billing"])
 
+# Stripe checkout session IDs, or the demo IDs issued by create_checkout
+_SESSION_ID_RE = re.compile(r"cs_(?:test|live)_[A-Za-z0-9]{1,200}|demo_[A-Za-z0-9_-]{16}")
+
+# Error bodies for the Stripe-down paths, encoded once. Exception details
+# go to the log, never to the client.
+_ERR_CHECKOUT_FAILED = orjson.dumps({"detail": "Failed to create payment session"})
+_ERR_VERIFY_UNAVAILABLE = orjson.dumps({"detail": "Stripe not configured. Cannot verify payment."})
+_ERR_VERIFY_FAILED = orjson.dumps({"detail": "Failed to verify payment status"})
+_ERR_WEBHOOK_FAILED = orjson.dumps({"detail": "Webhook processing failed"})
+
+# (body, etag) for the configuration-only GET endpoints, keyed by the
+# settings each response depends on
+_json_payloads: dict = {}
+
 
 class StripeNotConfiguredError(Exception):
     """Raised when Stripe is not properly configured."""
     pass
 
 
+def _gen_id() -> str:
+    """Short URL-safe random ID (96 bits) for demo checkout sessions."""
+    return secrets.token_urlsafe(12)
+
+
+def _require_session_id(session_id: str) -> None:
+    """Reject malformed session IDs before any lookup."""
+    if not _SESSION_ID_RE.fullmatch(session_id):
+        raise HTTPException(status_code=400, detail="Invalid session ID")
+
+
+def _json_error(body: bytes, status_code: int) -> Response:
+    """Error response from a prebuilt body, shaped like HTTPException's."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
 def _check_stripe_configured() -> bool:
     """Check if Stripe API key is configured."""
-    return bool(os.getenv("STRIPE_SECRET_KEY"))
+    return get_settings().stripe_configured
 
 
 def _require_stripe():
@@ -47,6 +86,8 @@ def _require_stripe():
 
 class CheckoutRequest(BaseModel):
     """Request to create a checkout session."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     plan: str = Field(..., description="Plan type: newsletter, podcast, or bundle")
     brand_name: str = Field(..., description="Brand or company name")
     topic: Optional[str] = Field(None, description="Content topic")
@@ -77,8 +118,27 @@ class PlansResponse(BaseModel):
     stripe_configured: bool
 
 
+def _cached_json(key: tuple, build: Callable[[], dict]) -> tuple:
+    """Serialized body and ETag for a JSON response that only varies with `key`."""
+    cached = _json_payloads.get(key)
+    if cached is None:
+        body = orjson.dumps(build())
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = _json_payloads[key] = (body, etag)
+    return cached
+
+
+def _conditional_json(request: Request, payload: tuple, max_age: int) -> Response:
+    """Serve a prebuilt JSON payload, or 304 when If-None-Match matches."""
+    body, etag = payload
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/status")
-async def get_billing_status():
+async def get_billing_status(request: Request):
     """
     Check if billing is properly configured.
 
@@ -86,45 +146,47 @@ async def get_billing_status():
         Configuration status including Stripe availability
     """
     stripe_configured = _check_stripe_configured()
-    webhook_secret_configured = bool(os.getenv("STRIPE_WEBHOOK_SECRET"))
-
-    return {
-        "stripe_configured": stripe_configured,
-        "webhook_configured": webhook_secret_configured,
-        "mode": "live" if stripe_configured else "demo",
-        "message": (
-            "Billing is ready" if stripe_configured
-            else "Set STRIPE_SECRET_KEY to enable payments"
-        ),
-    }
+    webhook_secret_configured = bool(get_settings().stripe_webhook_secret)
+
+    payload = _cached_json(
+        ("status", stripe_configured, webhook_secret_configured),
+        lambda: {
+            "stripe_configured": stripe_configured,
+            "webhook_configured": webhook_secret_configured,
+            "mode": "live" if stripe_configured else "demo",
+            "message": (
+                "Billing is ready" if stripe_configured
+                else "Set STRIPE_SECRET_KEY to enable payments"
+            ),
+        },
+    )
+    return _conditional_json(request, payload, max_age=60)
 
 
-@router.get("/plans", response_model=PlansResponse)
-async def get_available_plans():
+@router.get("/plans", responses={200: {"model": PlansResponse}})
+async def get_available_plans(request: Request):
     """
     Get available pricing plans.
 
     Returns:
         All available plans with pricing information
     """
-    plans = {}
-    for plan_id, plan_info in STRIPE_PRICES.items():
-        plans[plan_id] = {
-            "id": plan_id,
-            "name": plan_info["name"],
-            "description": plan_info["description"],
-            "price_cents": plan_info["price_cents"],
-            "price_display": format_price(plan_info["price_cents"]),
-        }
-
-    return PlansResponse(
-        plans=plans,
-        stripe_configured=_check_stripe_configured(),
+    # Plan data is fixed for the process, so the body is serialized once
+    # and conditional requests are answered with 304
+    stripe_configured = _check_stripe_configured()
+    payload = _cached_json(
+        ("plans", stripe_configured),
+        lambda: {"plans": PUBLIC_PLANS, "stripe_configured": stripe_configured},
     )
+    return _conditional_json(request, payload, max_age=60)
 
 
-@router.post("/create-session", response_model=CheckoutResponse)
-async def create_checkout(request: CheckoutRequest):
+@router.post(
+    "/create-session",
+    response_model=CheckoutResponse,
+    openapi_extra=json_body_openapi(CheckoutRequest),
+)
+async def create_checkout(request: CheckoutRequest = Depends(json_body(CheckoutRequest))):
     """
     Create a Stripe Checkout session.
 
@@ -141,7 +203,8 @@ async def create_checkout(request: CheckoutRequest):
         HTTPException: If Stripe is not configured or plan is invalid
     """
     # Validate plan
-    if request.plan not in STRIPE_PRICES:
+    plan_info = get_plan(request.plan)
+    if plan_info is None:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid plan: {request.plan}. Available: {list(STRIPE_PRICES.keys())}",
@@ -151,25 +214,26 @@ async def create_checkout(request: CheckoutRequest):
     if not _check_stripe_configured():
         logger.warning("Stripe not configured, returning demo mode response")
         # Return demo mode for development
-        import uuid
-        mock_session_id = f"demo_{uuid.uuid4().hex[:12]}"
+        mock_session_id = f"demo_{_gen_id()}"
         return CheckoutResponse(
             session_id=mock_session_id,
             checkout_url=f"/api/billing/demo-success?session_id={mock_session_id}",
             plan=request.plan,
-            amount_cents=get_price(request.plan),
-            amount_display=format_price(get_price(request.plan)),
+            amount_cents=plan_info["price_cents"],
+            amount_display=format_price(plan_info["price_cents"]),
             mode="demo",
         )
 
     try:
         # Build URLs
-        base_url = request.return_url or os.getenv("APP_BASE_URL", "http://localhost:5000")
+        base_url = request.return_url or get_settings().app_base_url
         success_url = f"{base_url}/payment/success?session_id={{CHECKOUT_SESSION_ID}}"
         cancel_url = f"{base_url}/payment/cancel"
 
         # Create checkout session
-        session = create_checkout_session(
+        # stripe-python is blocking; keep the event loop free during the call
+        session = await asyncio.to_thread(
+            create_checkout_session,
             plan=request.plan,
             success_url=success_url,
             cancel_url=cancel_url,
@@ -193,9 +257,9 @@ async def create_checkout(request: CheckoutRequest):
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to create checkout session: {e}")
-        raise HTTPException(status_code=500, detail="Failed to create payment session")
+    except Exception:
+        logger.exception("Failed to create checkout session")
+        return _json_error(_ERR_CHECKOUT_FAILED, 500)
 
 
 @router.get("/verify/{session_id}", response_model=PaymentStatusResponse)
@@ -212,6 +276,8 @@ async def verify_payment_status(session_id: str):
     Returns:
         Payment status including whether content generation can proceed
     """
+    _require_session_id(session_id)
+
     # Handle demo mode
     if session_id.startswith("demo_"):
         logger.info(f"Demo mode payment verification for {session_id}")
@@ -223,13 +289,10 @@ async def verify_payment_status(session_id: str):
         )
 
     if not _check_stripe_configured():
-        raise HTTPException(
-            status_code=503,
-            detail="Stripe not configured. Cannot verify payment.",
-        )
+        return _json_error(_ERR_VERIFY_UNAVAILABLE, 503)
 
     try:
-        verification = verify_payment(session_id)
+        verification = await asyncio.to_thread(verify_payment, session_id)
 
         return PaymentStatusResponse(
             paid=verification.paid,
@@ -238,12 +301,9 @@ async def verify_payment_status(session_id: str):
             ready_for_generation=verification.paid,
         )
 
-    except Exception as e:
-        logger.error(f"Payment verification failed for {session_id}: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to verify payment status",
-        )
+    except Exception:
+        logger.exception(f"Payment verification failed for {session_id}")
+        return _json_error(_ERR_VERIFY_FAILED, 500)
 
 
 @router.post("/webhook")
@@ -259,7 +319,7 @@ async def stripe_webhook(
 
     Required header: Stripe-Signature
     """
-    webhook_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
+    webhook_secret = get_settings().stripe_webhook_secret
 
     if not webhook_secret:
         logger.warning("Webhook received but STRIPE_WEBHOOK_SECRET not configured")
@@ -294,9 +354,9 @@ async def stripe_webhook(
 
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Webhook processing failed: {e}")
-        raise HTTPException(status_code=500, detail="Webhook processing failed")
+    except Exception:
+        logger.exception("Webhook processing failed")
+        return _json_error(_ERR_WEBHOOK_FAILED, 500)
 
 
 @router.get("/demo-success")
@@ -306,6 +366,8 @@ async def demo_success(session_id: str):
 
     Used in demo mode when Stripe is not configured.
     """
+    _require_session_id(session_id)
+
     return {
         "status": "success",
         "session_id": session_id,
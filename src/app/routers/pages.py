@@ -1,35 +1,51 @@
 
 from fastapi import APIRouter, Request, Depends, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
 
+from src.utils.cache import InMemoryCache
+from src.utils.html_page import StaticPage
+
 # Setup Templates
 templates_dir = Path(__file__).parent.parent / "templates"
 templates = Jinja2Templates(directory=str(templates_dir))
 
+# Rendered + precompressed pages, keyed by (template, base URL). The pages
+# carry no per-user data, so each is rendered and compressed once per process.
+_page_cache = InMemoryCache(max_size=64)
+
 router = APIRouter()
 
+
+def _cached_page(request: Request, template_name: str, context: dict) -> Response:
+    """Serve a static template from the render cache."""
+    key = f"{template_name}|{request.base_url}"
+    page = _page_cache.get(key)
+    if page is None:
+        html = templates.get_template(template_name).render({"request": request, **context})
+        page = StaticPage(html)
+        _page_cache.set(key, page, ttl=0)
+    return page.response(request)
+
+
 @router.get("/", response_class=HTMLResponse)
 async def landing_page(request: Request):
     """Render the landing page."""
-    return templates.TemplateResponse("landing.html", {
-        "request": request, 
+    return _cached_page(request, "landing.html", {
         "page_title": "AI Audio content Engine"
     })
 
 @router.get("/app", response_class=HTMLResponse)
 async def app_interface(request: Request):
     """Render the main app interface."""
-    return templates.TemplateResponse("app.html", {
-        "request": request,
+    return _cached_page(request, "app.html", {
         "page_title": "Studio"
     })
 
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
     """Render the login page."""
-    return templates.TemplateResponse("login.html", {
-        "request": request,
+    return _cached_page(request, "login.html", {
         "page_title": "Log In"
     })
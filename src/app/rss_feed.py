@@ -110,7 +110,7 @@ class RSSFeedGenerator:
         self._save_feeds(feeds)
 
         # Generate initial RSS file
-        self._generate_rss_file(feed_id)
+        self._generate_rss_file(feed_id, feeds)
 
         return feed_id
 
@@ -143,15 +143,18 @@ class RSSFeedGenerator:
         if feed_id not in feeds:
             return False
 
+        self._append_episode(feeds, feed_id, episode)
+        return True
+
+    def _append_episode(self, feeds: dict, feed_id: str, episode: PodcastEpisode):
+        """Append to already-loaded feeds, then save and regenerate the RSS once."""
         feeds[feed_id]["episodes"].append(episode.model_dump())
         feeds[feed_id]["updated_at"] = datetime.now().isoformat()
 
         self._save_feeds(feeds)
 
         # Regenerate RSS file
-        self._generate_rss_file(feed_id)
-
-        return True
+        self._generate_rss_file(feed_id, feeds)
 
     def add_episode_from_generation(
         self,
@@ -205,18 +208,24 @@ class RSSFeedGenerator:
             episode_number=episode_num,
         )
 
-        self.add_episode(feed_id, episode)
+        # Reuse the feeds loaded above rather than reading feeds.json again
+        self._append_episode(feeds, feed_id, episode)
 
         return episode
 
-    def _generate_rss_file(self, feed_id: str) -> str:
+    def _generate_rss_file(self, feed_id: str, feeds: Optional[dict] = None) -> str:
         """
         Generate RSS XML file for a feed.
 
+        Args:
+            feed_id: The feed to render
+            feeds: Feeds the caller already loaded, to skip re-reading storage
+
         Returns:
             Path to the generated RSS file
         """
-        feeds = self._load_feeds()
+        if feeds is None:
+            feeds = self._load_feeds()
         feed_data = feeds.get(feed_id)
 
         if not feed_data:
@@ -333,6 +342,18 @@ class RSSFeedGenerator:
         return None
 
 
+# Shared generator for the quick-start functions below
+_feed_generator: Optional[RSSFeedGenerator] = None
+
+
+def get_feed_generator() -> RSSFeedGenerator:
+    """Get or create the process-wide RSSFeedGenerator."""
+    global _feed_generator
+    if _feed_generator is None:
+        _feed_generator = RSSFeedGenerator()
+    return _feed_generator
+
+
 # Quick-start function for common use case
 def create_podcast_feed(
     title: str,
@@ -345,7 +366,7 @@ def create_podcast_feed(
     Returns:
         Feed ID
     """
-    generator = RSSFeedGenerator()
+    generator = get_feed_generator()
     channel = PodcastChannel(
         title=title,
         description=description,
@@ -367,7 +388,7 @@ def add_episode_to_feed(
     Returns:
         The created episode
     """
-    generator = RSSFeedGenerator()
+    generator = get_feed_generator()
     return generator.add_episode_from_generation(
         feed_id=feed_id,
         audio_path=audio_path,
@@ -379,5 +400,5 @@ def add_episode_to_feed(
 
 def get_feed_url(feed_id: str) -> str:
     """Get the RSS URL for a feed."""
-    generator = RSSFeedGenerator()
+    generator = get_feed_generator()
     return generator.get_rss_url(feed_id)
@@ -0,0 +1,133 @@
+"""
+Static file serving for app assets (/static) and generated output (/files).
+
+App assets can ship build-time .br/.gz siblings (scripts/precompress_static.py);
+those are streamed from disk, so every worker shares one copy in the OS page
+cache instead of holding its own compressed bytes.
+
+Small text artifacts (newsletter HTML, RSS XML) are fetched back right after
+generation and on every preview, so they are kept in memory. Large files such
+as audio stream from disk via FileResponse, or, behind nginx with
+FILES_ACCEL_PREFIX set, are handed off to nginx with X-Accel-Redirect so it
+serves them with sendfile (see config/nginx.conf).
+"""
+
+import mimetypes
+import os
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import quote
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from src.app.config import get_settings
+from src.utils.cache import InMemoryCache
+
+# Files at or below this size are served from memory
+SMALL_FILE_MAX_BYTES = 64 * 1024
+
+# Precompressed siblings, in order of preference
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+# Headers nginx regenerates itself when it serves the redirected file
+_ACCEL_DROP_HEADERS = ("content-length", "etag", "last-modified", "accept-ranges")
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a .br/.gz sibling when the client accepts it."""
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        accept = request_headers.get("accept-encoding", "")
+
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            if encoding not in accept:
+                continue
+            compressed_path = f"{full_path}{suffix}"
+            try:
+                compressed_stat = os.stat(compressed_path)
+            except OSError:
+                continue
+
+            media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+            response = FileResponse(
+                compressed_path,
+                status_code=status_code,
+                stat_result=compressed_stat,
+                media_type=media_type,
+                headers={"content-encoding": encoding, "vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+
+        return super().file_response(full_path, stat_result, scope, status_code)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with an LRU memory cache for small files."""
+
+    def __init__(
+        self,
+        *args: Any,
+        cache_entries: int = 256,
+        accel_prefix: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self._small_files = InMemoryCache(max_size=cache_entries)
+        # nginx "internal" location that maps onto this directory
+        prefix = accel_prefix if accel_prefix is not None else get_settings().files_accel_prefix
+        self._accel_prefix = prefix.rstrip("/")
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+
+        # 304s and HEAD requests keep the default behaviour
+        if not isinstance(response, FileResponse) or scope.get("method") != "GET":
+            return response
+
+        if stat_result.st_size > SMALL_FILE_MAX_BYTES:
+            if self._accel_prefix:
+                return self._accel_response(full_path, response, status_code)
+            return response
+
+        key = str(full_path)
+        cached = self._small_files.get(key)
+        if cached is None or cached[0] != stat_result.st_mtime_ns:
+            with open(full_path, "rb") as f:
+                cached = (stat_result.st_mtime_ns, f.read())
+            self._small_files.set(key, cached, ttl=0)
+
+        # Whole body is returned from memory, so range support is dropped
+        headers = {
+            k: v for k, v in response.headers.items()
+            if k not in ("accept-ranges", "content-length")
+        }
+        headers["cache-control"] = "public, max-age=300"
+        return Response(content=cached[1], status_code=status_code, headers=headers)
+
+    def _accel_response(self, full_path, response: Response, status_code: int) -> Response:
+        """Hand the file off to nginx via X-Accel-Redirect."""
+        rel_path = Path(full_path).resolve().relative_to(Path(self.directory).resolve())
+        headers = {
+            k: v for k, v in response.headers.items()
+            if k not in _ACCEL_DROP_HEADERS
+        }
+        headers["x-accel-redirect"] = f"{self._accel_prefix}/{quote(rel_path.as_posix())}"
+        return Response(status_code=status_code, headers=headers)
@@ -110,7 +110,7 @@ class ContentEngine:
         Workflow:
         1. Research the topic (or enhance user content)
         2. Generate newsletter
-        3. Generate podcast script
+        3. Generate podcast script (alongside step 2)
         4. Generate audio
         5. Return all outputs
         """
@@ -123,49 +123,15 @@ class ContentEngine:
             bundle = await self._research_content(input)
             output.topic = bundle.main_theme or input.topic or "Content Update"
 
-            # Step 2: Generate newsletter (if requested)
+            # Steps 2-4: the newsletter and the podcast only share the
+            # research bundle, so their model/TTS calls run concurrently
+            branches = []
             if input.generate_newsletter:
-                logger.info("Step 2: Generating newsletter...")
-                newsletter = await self.newsletter_generator.generate_newsletter(
-                    bundle,
-                    newsletter_name=input.brand_name,
-                )
-                output.newsletter = newsletter
-                output.word_count = newsletter.total_word_count
-
-                # Save newsletter files
-                output.newsletter_html_path = await self._save_newsletter(
-                    newsletter, output_id, "html"
-                )
-                output.newsletter_markdown_path = await self._save_newsletter(
-                    newsletter, output_id, "md"
-                )
-
-            # Step 3: Generate podcast script (if requested)
+                branches.append(self._produce_newsletter(input, bundle, output, output_id))
             if input.generate_podcast:
-                logger.info("Step 3: Generating podcast script...")
-                script = await self.script_generator.generate_script(
-                    bundle,
-                    podcast_name=input.brand_name,
-                )
-                output.podcast_script = script
-
-                # Step 4: Generate audio
-                logger.info("Step 4: Generating audio...")
-                audio_episode = await self.tts_generator.generate_episode_audio(script)
-
-                # Stitch audio
-                audio_path = self.audio_stitcher.stitch_episode(audio_episode)
-                manifest_path = self.audio_stitcher.save_manifest(audio_episode)
-
-                output.podcast_audio = audio_episode
-                output.podcast_audio_path = audio_path
-                output.audio_duration_seconds = audio_episode.total_duration_seconds
-
-                # Generate RSS entry for Spotify
-                output.podcast_rss_entry = self._generate_rss_entry(
-                    script, audio_path, input.brand_name
-                )
+                branches.append(self._produce_podcast(input, bundle, output))
+
+            await self._run_branches(branches)
 
             logger.info(f"Content generation complete: {output_id}")
             return output
@@ -176,6 +142,83 @@ class ContentEngine:
             output.errors.append(str(e))
             return output
 
+    async def _run_branches(self, branches: list):
+        """
+        Run the output branches concurrently, failing fast.
+
+        The first branch to fail cancels the others, so a failed newsletter
+        doesn't leave the podcast branch spending on TTS for a result that
+        will be reported as failed anyway.
+        """
+        if not branches:
+            return
+        tasks = [asyncio.create_task(branch) for branch in branches]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+
+    async def _produce_newsletter(
+        self,
+        input: ContentInput,
+        bundle: EpisodeResearchBundle,
+        output: ContentOutput,
+        output_id: str,
+    ):
+        """Step 2: generate the newsletter and save its files."""
+        logger.info("Step 2: Generating newsletter...")
+        newsletter = await self.newsletter_generator.generate_newsletter(
+            bundle,
+            newsletter_name=input.brand_name,
+        )
+        output.newsletter = newsletter
+        output.word_count = newsletter.total_word_count
+
+        # Save newsletter files
+        output.newsletter_html_path = await self._save_newsletter(
+            newsletter, output_id, "html"
+        )
+        output.newsletter_markdown_path = await self._save_newsletter(
+            newsletter, output_id, "md"
+        )
+
+    async def _produce_podcast(
+        self,
+        input: ContentInput,
+        bundle: EpisodeResearchBundle,
+        output: ContentOutput,
+    ):
+        """Steps 3-4: generate the podcast script, audio and RSS entry."""
+        logger.info("Step 3: Generating podcast script...")
+        script = await self.script_generator.generate_script(
+            bundle,
+            podcast_name=input.brand_name,
+        )
+        output.podcast_script = script
+
+        logger.info("Step 4: Generating audio...")
+        audio_episode = await self.tts_generator.generate_episode_audio(script)
+
+        # Stitching is blocking audio work; keep it off the event loop so the
+        # newsletter branch keeps making progress
+        audio_path = await asyncio.to_thread(self.audio_stitcher.stitch_episode, audio_episode)
+        await asyncio.to_thread(self.audio_stitcher.save_manifest, audio_episode)
+
+        output.podcast_audio = audio_episode
+        output.podcast_audio_path = audio_path
+        output.audio_duration_seconds = audio_episode.total_duration_seconds
+
+        # Generate RSS entry for Spotify
+        output.podcast_rss_entry = self._generate_rss_entry(
+            script, audio_path, input.brand_name
+        )
+
     async def _research_content(self, input: ContentInput) -> EpisodeResearchBundle:
         """Research and create content bundle."""
 
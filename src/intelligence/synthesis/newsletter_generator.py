@@ -1,6 +1,8 @@
 """Newsletter generator - converts research into written newsletter format."""
 
 import os
+import re
+import string
 from datetime import datetime
 from typing import Optional
 import logging
@@ -14,6 +16,53 @@ from ..models.research import VerifiedTopic, EpisodeResearchBundle
 
 logger = logging.getLogger(__name__)
 
+# Email HTML, parsed once at import
+_SECTION_TEMPLATE = string.Template("""
+            <div style="margin-bottom: 30px;">
+                <h2 style="color: #1a1a2e; font-size: 20px; margin-bottom: 10px;">$headline</h2>
+                <div style="color: #333; line-height: 1.6;">$body</div>
+            </div>
+            <hr style="border: none; border-top: 1px solid #eee; margin: 25px 0;">
+            """)
+
+_EMAIL_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; background: #f9f9f9;">
+    <div style="background: white; padding: 30px; border-radius: 10px;">
+        <h1 style="color: #1a1a2e; font-size: 28px; margin-bottom: 5px;">$title</h1>
+        <p style="color: #666; font-size: 16px; margin-bottom: 20px;">$subtitle</p>
+
+        <div style="color: #333; line-height: 1.6; margin-bottom: 25px;">
+            $intro
+        </div>
+
+        <hr style="border: none; border-top: 1px solid #eee; margin: 25px 0;">
+
+        $sections
+
+        <div style="color: #333; line-height: 1.6;">
+            $outro
+        </div>
+
+        <p style="color: #999; font-size: 12px; margin-top: 30px; text-align: center;">
+            $reading_time_minutes min read · $total_word_count words
+        </p>
+    </div>
+</body>
+</html>
+""")
+
+# Markdown patterns for _md_to_html
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+_BULLET_RE = re.compile(r'^- (.+)$', re.MULTILINE)
+_LIST_RE = re.compile(r'(<li>.*</li>\n?)+')
+
 
 class NewsletterSection(BaseModel):
     """A single section of a newsletter."""
@@ -355,69 +404,41 @@ class NewsletterGenerator:
 
     def _to_html(self, newsletter: Newsletter) -> str:
         """Convert newsletter to HTML email."""
-        # Simple HTML template
-        sections_html = ""
-        for section in newsletter.sections:
-            sections_html += f"""
-            <div style="margin-bottom: 30px;">
-                <h2 style="color: #1a1a2e; font-size: 20px; margin-bottom: 10px;">{section.headline}</h2>
-                <div style="color: #333; line-height: 1.6;">{self._md_to_html(section.body)}</div>
-            </div>
-            <hr style="border: none; border-top: 1px solid #eee; margin: 25px 0;">
-            """
-
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px; background: #f9f9f9;">
-    <div style="background: white; padding: 30px; border-radius: 10px;">
-        <h1 style="color: #1a1a2e; font-size: 28px; margin-bottom: 5px;">{newsletter.title}</h1>
-        <p style="color: #666; font-size: 16px; margin-bottom: 20px;">{newsletter.subtitle}</p>
-
-        <div style="color: #333; line-height: 1.6; margin-bottom: 25px;">
-            {self._md_to_html(newsletter.intro)}
-        </div>
-
-        <hr style="border: none; border-top: 1px solid #eee; margin: 25px 0;">
-
-        {sections_html}
-
-        <div style="color: #333; line-height: 1.6;">
-            {self._md_to_html(newsletter.outro)}
-        </div>
+        sections_html = "".join(
+            _SECTION_TEMPLATE.substitute(
+                headline=section.headline,
+                body=self._md_to_html(section.body),
+            )
+            for section in newsletter.sections
+        )
 
-        <p style="color: #999; font-size: 12px; margin-top: 30px; text-align: center;">
-            {newsletter.reading_time_minutes} min read · {newsletter.total_word_count} words
-        </p>
-    </div>
-</body>
-</html>
-"""
+        return _EMAIL_TEMPLATE.substitute(
+            title=newsletter.title,
+            subtitle=newsletter.subtitle,
+            intro=self._md_to_html(newsletter.intro),
+            sections=sections_html,
+            outro=self._md_to_html(newsletter.outro),
+            reading_time_minutes=newsletter.reading_time_minutes,
+            total_word_count=newsletter.total_word_count,
+        )
 
     def _md_to_html(self, md: str) -> str:
         """Simple markdown to HTML conversion."""
-        import re
         html = md
         # Bold
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
+        html = _BOLD_RE.sub(r'<strong>\1</strong>', html)
         # Italic
-        html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
+        html = _ITALIC_RE.sub(r'<em>\1</em>', html)
         # Bullet points
-        html = re.sub(r'^- (.+)$', r'<li>\1</li>', html, flags=re.MULTILINE)
-        html = re.sub(r'(<li>.*</li>\n?)+', r'<ul>\g<0></ul>', html)
+        html = _BULLET_RE.sub(r'<li>\1</li>', html)
+        html = _LIST_RE.sub(r'<ul>\g<0></ul>', html)
         # Paragraphs
-        html = re.sub(r'\n\n', '</p><p>', html)
+        html = html.replace('\n\n', '</p><p>')
         html = f'<p>{html}</p>'
         return html
 
     def _to_plain_text(self, newsletter: Newsletter) -> str:
         """Convert newsletter to plain text."""
-        import re
-
         lines = [
             newsletter.title.upper(),
             newsletter.subtitle,
@@ -7,7 +7,9 @@ from typing import Optional
 from datetime import datetime
 import logging
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+from ..utils.duration import format_duration
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,11 @@ class SegmentInfo(BaseModel):
     can_skip: bool = True
     can_deep_dive: bool = False
 
+    @computed_field
+    @property
+    def duration_display(self) -> str:
+        return format_duration(self.duration_seconds)
+
 
 class EpisodeInfo(BaseModel):
     """Episode metadata for the player."""
@@ -37,6 +44,11 @@ class EpisodeInfo(BaseModel):
     combined_file_path: Optional[str] = None
     combined_file_url: Optional[str] = None
 
+    @computed_field
+    @property
+    def total_duration_display(self) -> str:
+        return format_duration(self.total_duration_seconds)
+
 
 class PlaybackState(BaseModel):
     """Current playback state."""
@@ -50,6 +62,8 @@ class PlaybackState(BaseModel):
 
 class DeepDiveRequest(BaseModel):
     """Request for deep dive on a topic."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     episode_id: str
     segment_id: str
     question: Optional[str] = None
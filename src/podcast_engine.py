@@ -614,6 +614,10 @@ class PodcastEngine:
             ],
         }
 
+    async def aclose(self):
+        """Release HTTP clients held by the content sources"""
+        await self.content_ranker.aclose()
+
     def list_episodes(self) -> list[EpisodeMetadata]:
         """List all generated episodes"""
         episodes = []
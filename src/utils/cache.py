@@ -10,6 +10,7 @@ import json
 import time
 import hashlib
 import logging
+from collections import OrderedDict
 from typing import Optional, Any, Callable
 from functools import wraps
 from pathlib import Path
@@ -27,6 +28,10 @@ class CacheBackend:
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         raise NotImplementedError
     
+    def add(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """Set key only if it is absent; return False if it already existed."""
+        raise NotImplementedError
+
     def delete(self, key: str) -> bool:
         raise NotImplementedError
     
@@ -38,11 +43,12 @@ class InMemoryCache(CacheBackend):
     """
     Thread-safe in-memory cache with TTL support.
     
-    Good for single-process deployments.
+    Good for single-process deployments. Entries are kept in LRU order, so
+    reads, writes and eviction are all O(1).
     """
     
     def __init__(self, max_size: int = 1000):
-        self._cache = {}
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
         self._lock = Lock()
         self._max_size = max_size
     
@@ -53,15 +59,15 @@ class InMemoryCache(CacheBackend):
         return time.time() > entry['expires_at']
     
     def _evict_if_needed(self):
-        """Evict oldest entries if cache is full."""
-        if len(self._cache) >= self._max_size:
-            # Remove 10% of oldest entries
-            entries = sorted(
-                self._cache.items(),
-                key=lambda x: x[1].get('created_at', 0)
-            )
-            for key, _ in entries[:self._max_size // 10]:
-                del self._cache[key]
+        """Evict least recently used entries until there is room for one more."""
+        while len(self._cache) >= self._max_size:
+            self._cache.popitem(last=False)
+        # Drop expired entries sitting at the cold end while we're here
+        while self._cache:
+            oldest = next(iter(self._cache.values()))
+            if not self._is_expired(oldest):
+                break
+            self._cache.popitem(last=False)
     
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
@@ -73,10 +79,12 @@ class InMemoryCache(CacheBackend):
                 del self._cache[key]
                 return None
             
+            self._cache.move_to_end(key)
             return entry.get('value')
     
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         with self._lock:
+            self._cache.pop(key, None)
             self._evict_if_needed()
             
             self._cache[key] = {
@@ -86,6 +94,21 @@ class InMemoryCache(CacheBackend):
             }
             return True
     
+    def add(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and not self._is_expired(entry):
+                return False
+            self._cache.pop(key, None)
+            self._evict_if_needed()
+
+            self._cache[key] = {
+                'value': value,
+                'created_at': time.time(),
+                'expires_at': time.time() + ttl if ttl > 0 else None
+            }
+            return True
+
     def delete(self, key: str) -> bool:
         with self._lock:
             if key in self._cache:
@@ -167,6 +190,41 @@ class FileCache(CacheBackend):
                 logger.warning(f"Failed to write cache file {path}: {e}")
                 return False
     
+    def add(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """
+        Set key only if it is absent.
+
+        The file is created with O_EXCL, so this is atomic across every
+        process sharing the cache directory, not just within this one.
+        """
+        path = self._get_path(key)
+        entry = {
+            'key': key,
+            'value': value,
+            'created_at': time.time(),
+            'expires_at': time.time() + ttl if ttl > 0 else None
+        }
+
+        with self._lock:
+            for _ in range(2):
+                try:
+                    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL)
+                except FileExistsError:
+                    # An expired entry doesn't count; clear it and retry once
+                    try:
+                        with open(path, 'r') as f:
+                            expires_at = json.load(f).get('expires_at')
+                    except (json.JSONDecodeError, IOError):
+                        return False
+                    if not expires_at or time.time() <= expires_at:
+                        return False
+                    path.unlink(missing_ok=True)
+                    continue
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entry, f)
+                return True
+            return False
+
     def delete(self, key: str) -> bool:
         path = self._get_path(key)
         
@@ -242,6 +300,22 @@ class RedisCache(CacheBackend):
             logger.warning(f"Redis set failed: {e}")
             return self._fallback.set(key, value, ttl)
     
+    def add(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        if self._client is None:
+            return self._fallback.add(key, value, ttl)
+
+        try:
+            # SET NX EX: one atomic check-and-set shared by every worker
+            return bool(self._client.set(
+                self._key(key),
+                json.dumps(value),
+                nx=True,
+                ex=ttl if ttl > 0 else None,
+            ))
+        except Exception as e:
+            logger.warning(f"Redis add failed: {e}")
+            return self._fallback.add(key, value, ttl)
+
     def delete(self, key: str) -> bool:
         if self._client is None:
             return self._fallback.delete(key)
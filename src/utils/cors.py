@@ -0,0 +1,33 @@
+"""
+Shared CORS configuration for the FastAPI apps.
+
+Origins come from the comma-separated CORS_ORIGINS env var; browsers cache
+preflight responses for a day so repeat OPTIONS requests never reach the app.
+"""
+
+import os
+from typing import Tuple
+
+DEFAULT_CORS_ORIGINS = (
+    "https://podcastos.com",
+    "http://localhost:8000",
+)
+CORS_PREFLIGHT_MAX_AGE = 86400  # 24h
+
+
+def cors_origins() -> Tuple[str, ...]:
+    """Allowed origins from CORS_ORIGINS, or the defaults."""
+    raw = os.getenv("CORS_ORIGINS", "")
+    origins = tuple(o.strip() for o in raw.split(",") if o.strip())
+    return origins or DEFAULT_CORS_ORIGINS
+
+
+def cors_options() -> dict:
+    """Keyword arguments for app.add_middleware(CORSMiddleware, ...)."""
+    return {
+        "allow_origins": cors_origins(),
+        "allow_credentials": False,
+        "allow_methods": ("GET", "POST"),
+        "allow_headers": ("Content-Type", "Authorization"),
+        "max_age": CORS_PREFLIGHT_MAX_AGE,
+    }
@@ -0,0 +1,11 @@
+"""
+Duration formatting shared by the API responses.
+
+Durations are formatted once on the server so pages can show them as-is.
+"""
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration in seconds as M:SS (negative values show as 0:00)."""
+    total = max(0, int(seconds or 0))
+    return f"{total // 60}:{total % 60:02d}"
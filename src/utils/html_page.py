@@ -0,0 +1,106 @@
+"""
+Precompressed HTML page responses.
+
+Pages that carry no per-request data are minified, encoded and compressed
+once; each request then only picks the brotli/gzip/identity body (and its
+prebuilt headers) from Accept-Encoding, or answers If-None-Match with 304.
+Their stylesheets are served the same way, under a versioned URL that can
+be cached as immutable.
+"""
+
+import gzip
+import hashlib
+import re
+from typing import Callable
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # Optional: fall back to gzip-only
+    brotli = None
+
+
+# Whitespace-sensitive blocks are left untouched by minify_html
+_PRESERVE_RE = re.compile(r"(<(pre|textarea|script)\b.*?</\2>)", re.S | re.I)
+_STYLE_RE = re.compile(r"(<style\b[^>]*>)(.*?)(</style>)", re.S | re.I)
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_HTML_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.S)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# Cache policy for assets whose URL changes with their content
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a stylesheet."""
+    return _WHITESPACE_RE.sub(" ", _CSS_COMMENT_RE.sub("", css)).strip()
+
+
+def _minify_style_block(match: re.Match) -> str:
+    return match.group(1) + minify_css(match.group(2)) + match.group(3)
+
+
+def minify_html(html: str) -> str:
+    """Strip comments and collapse whitespace outside <pre>/<textarea>/<script>."""
+    parts = _PRESERVE_RE.split(html)
+    out = []
+    # split() yields [text, block, tag-name, text, block, tag-name, ...]
+    for i in range(0, len(parts), 3):
+        text = _HTML_COMMENT_RE.sub("", parts[i])
+        text = _STYLE_RE.sub(_minify_style_block, text)
+        text = _WHITESPACE_RE.sub(" ", text)
+        out.append(text)
+        if i + 1 < len(parts):
+            out.append(parts[i + 1])
+    return "".join(out).strip()
+
+
+class StaticPage:
+    """An HTML page encoded and precompressed once, served per Accept-Encoding."""
+
+    __slots__ = ("version", "etag", "headers", "media_type", "_raw", "_gzip", "_br")
+
+    def __init__(
+        self,
+        html: str,
+        cache_control: str = "public, max-age=3600",
+        media_type: str = "text/html; charset=utf-8",
+        minify: Callable[[str], str] = minify_html,
+    ):
+        raw = minify(html).encode("utf-8")
+        # Content hash: the ETag, and the ?v= for versioned asset URLs
+        self.version = hashlib.blake2b(raw, digest_size=8).hexdigest()
+        self.etag = f'"{self.version}"'
+        self.media_type = media_type
+        self.headers = {
+            "ETag": self.etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": cache_control,
+        }
+        self._raw = (raw, self.headers)
+        self._gzip = (
+            gzip.compress(raw, compresslevel=9),
+            {**self.headers, "Content-Encoding": "gzip"},
+        )
+        self._br = (
+            (brotli.compress(raw, quality=11), {**self.headers, "Content-Encoding": "br"})
+            if brotli else None
+        )
+
+    def response(self, request: Request) -> Response:
+        """Build the response for a request; only selects prebuilt parts."""
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=self.headers)
+
+        accept = request.headers.get("accept-encoding", "")
+        if self._br is not None and "br" in accept:
+            body, headers = self._br
+        elif "gzip" in accept:
+            body, headers = self._gzip
+        else:
+            body, headers = self._raw
+
+        return Response(content=body, media_type=self.media_type, headers=headers)
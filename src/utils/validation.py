@@ -269,6 +269,15 @@ def validate_email(email: str) -> bool:
     return bool(re.match(pattern, email))
 
 
+# Shape of generation job IDs (secrets.token_urlsafe(12))
+_JOB_ID_RE = re.compile(r"[A-Za-z0-9_-]{16}")
+
+
+def is_job_id(job_id: str) -> bool:
+    """Check that job_id has the shape of a generation job ID."""
+    return _JOB_ID_RE.fullmatch(job_id) is not None
+
+
 def validate_job_id(job_id: str) -> str:
     """
     Validate a job ID format.
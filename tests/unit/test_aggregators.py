@@ -22,7 +22,7 @@ class TestRedditPost:
             score=150,
             num_comments=45,
             url="https://reddit.com/r/immigration/abc123",
-            created_utc=datetime.now(),
+            created_utc=datetime.now().timestamp(),
             author="user123",
             permalink="/r/immigration/comments/abc123",
             flair="Discussion",
@@ -44,7 +44,7 @@ class TestRedditPost:
             score=100,
             num_comments=50,
             url="https://reddit.com/test",
-            created_utc=datetime.now(),
+            created_utc=datetime.now().timestamp(),
             author="user",
             permalink="/r/test",
         )
@@ -53,6 +53,27 @@ class TestRedditPost:
         expected = 100 + (50 * 2)
         assert post.engagement_score == expected
 
+    def test_created_dt_is_utc(self):
+        """Test the raw timestamp converts lazily to an aware UTC datetime."""
+        from datetime import timezone
+
+        from src.aggregators.reddit_aggregator import RedditPost
+
+        post = RedditPost(
+            id="ts",
+            subreddit="test",
+            title="Test",
+            selftext="",
+            score=0,
+            num_comments=0,
+            url="https://reddit.com/test",
+            created_utc=0.0,
+            author="user",
+            permalink="/r/test",
+        )
+
+        assert post.created_dt == datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 class TestRedditAggregator:
     """Tests for RedditAggregator."""
@@ -112,6 +133,128 @@ class TestRedditAggregator:
 
         assert token == "cached_token"
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_posts_coalesces_concurrent_calls(self):
+        """Test concurrent and repeat callers share a single subreddit fan-out."""
+        import asyncio
+
+        from src.aggregators.reddit_aggregator import RedditAggregator
+
+        agg = RedditAggregator()
+
+        async def fake_fetch(subreddit, limit=25, time_filter="day", sort="hot"):
+            await asyncio.sleep(0.01)
+            return []
+
+        agg.fetch_subreddit_posts = AsyncMock(side_effect=fake_fetch)
+
+        await asyncio.gather(*[agg.fetch_all_posts(subreddits=["h1b"]) for _ in range(3)])
+        await agg.fetch_all_posts(subreddits=["h1b"])
+
+        assert agg.fetch_subreddit_posts.await_count == 1
+        assert agg._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_posts_survives_cancelled_leader(self):
+        """Test waiters re-issue the fetch when the caller running it is cancelled."""
+        import asyncio
+
+        from src.aggregators.reddit_aggregator import RedditAggregator
+
+        agg = RedditAggregator()
+        started = asyncio.Event()
+
+        async def fake_fetch(subreddit, limit=25, time_filter="day", sort="hot"):
+            started.set()
+            await asyncio.sleep(0.01)
+            return []
+
+        agg.fetch_subreddit_posts = AsyncMock(side_effect=fake_fetch)
+
+        leader = asyncio.create_task(agg.fetch_all_posts(subreddits=["h1b"]))
+        await started.wait()
+        waiter = asyncio.create_task(agg.fetch_all_posts(subreddits=["h1b"]))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == []
+        assert leader.cancelled()
+        assert agg.fetch_subreddit_posts.await_count == 2
+        assert agg._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_recent_posts_are_bounded(self):
+        """Test only the most recent POSTS_CACHE_SIZE fan-outs are remembered."""
+        from src.aggregators.reddit_aggregator import RedditAggregator
+
+        agg = RedditAggregator()
+        agg.fetch_subreddit_posts = AsyncMock(return_value=[])
+
+        for i in range(agg.POSTS_CACHE_SIZE + 5):
+            await agg.fetch_all_posts(subreddits=[f"sub{i}"])
+
+        assert agg._recent_posts.stats()["size"] == agg.POSTS_CACHE_SIZE
+
+    def test_categorize_post(self):
+        """Test keyword categorization uses the post's lowercased text."""
+        from src.aggregators.reddit_aggregator import RedditAggregator, RedditPost
+
+        post = RedditPost(
+            id="cat",
+            subreddit="h1b",
+            title="H1B Layoff Advice",
+            selftext="Got laid off, what happens to my VISA?",
+            score=10,
+            num_comments=3,
+            url="https://reddit.com/cat",
+            created_utc=datetime.now().timestamp(),
+            author="user",
+            permalink="/r/h1b/cat",
+        )
+
+        categories = RedditAggregator().categorize_post(post)
+
+        assert categories == ["immigration", "career"]
+        assert post.text_lower == "h1b layoff advice got laid off, what happens to my visa?"
+
+    def test_categorize_post_phrase_and_general(self):
+        """Test multi-word phrases match and unmatched posts fall back to general."""
+        from src.aggregators.reddit_aggregator import RedditAggregator, RedditPost
+
+        def make(title):
+            return RedditPost(
+                id="p", subreddit="s", title=title, selftext="", score=0,
+                num_comments=0, url="", created_utc=datetime.now().timestamp(),
+                author="a", permalink="/r/s/p",
+            )
+
+        agg = RedditAggregator()
+
+        categories = agg.categorize_post(make("Green Card interview tomorrow"))
+
+        assert categories == ["immigration", "career"]
+        assert agg.categorize_post(make("Cricket highlights")) == ["general"]
+
+    def test_categorize_post_matches_inflected_and_joined_words(self):
+        """Test keywords match inside inflected, hyphenated and run-together words."""
+        from src.aggregators.reddit_aggregator import RedditAggregator, RedditPost
+
+        def make(title):
+            return RedditPost(
+                id="p", subreddit="s", title=title, selftext="", score=0,
+                num_comments=0, url="", created_utc=datetime.now().timestamp(),
+                author="a", permalink="/r/s/p",
+            )
+
+        agg = RedditAggregator()
+
+        assert agg.categorize_post(make("I invested in index funds")) == ["finance"]
+        assert agg.categorize_post(make("Credits on my card statement")) == ["finance"]
+        assert agg.categorize_post(make("Promotions this cycle")) == ["career"]
+        assert agg.categorize_post(make("Best schools near Edison")) == ["family"]
+        assert agg.categorize_post(make("h1b-transfer timeline")) == ["immigration"]
+        assert agg.categorize_post(make("f1visa stamping slots")) == ["immigration"]
+
 
 class TestPodcastTopic:
     """Tests for PodcastTopic model."""
@@ -179,6 +322,18 @@ class TestContentRanker:
         assert ranker.news is not None
         # Note: uscis aggregator was removed from ContentRanker
 
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_reddit_client(self):
+        """Test leaving the ranker's context closes the Reddit HTTP client."""
+        from src.aggregators.content_ranker import ContentRanker
+
+        async with ContentRanker() as ranker:
+            client = ranker.reddit._get_client()
+            assert not client.is_closed
+
+        assert client.is_closed
+        assert ranker.reddit._client is None
+
     @pytest.mark.asyncio
     async def test_gather_all_content_returns_dict(self):
         """Test gather_all_content returns a dict with expected keys."""
@@ -216,3 +371,39 @@ class TestUSCISAggregator:
         from src.aggregators.uscis_aggregator import USCISAggregator
 
         assert USCISAggregator is not None
+
+    def test_calculate_priority_tiers(self):
+        """Test keyword tiers match case-insensitively."""
+        from src.aggregators.uscis_aggregator import USCISAggregator
+
+        agg = USCISAggregator()
+
+        assert agg._calculate_priority("New H-1B Registration Rules") == 8
+        assert agg._calculate_priority("Naturalization ceremony schedule") == 6
+        assert agg._calculate_priority("Office closure notice") == 4
+
+    def test_rank_updates_priority_then_newest(self):
+        """Test updates are ordered by priority, newest first within a priority."""
+        from src.aggregators.uscis_aggregator import ImmigrationUpdate, USCISAggregator
+
+        now = datetime.now()
+
+        def make(update_id, priority, hours_ago):
+            return ImmigrationUpdate(
+                id=update_id,
+                title=update_id,
+                summary="",
+                source="USCIS",
+                url="https://uscis.gov",
+                published_at=now - timedelta(hours=hours_ago),
+                update_type="news",
+                priority=priority,
+            )
+
+        updates = [make("old-high", 8, 10), make("low", 4, 0), make("new-high", 8, 1)]
+
+        ranked = USCISAggregator._rank_updates(updates)
+        assert [u.id for u in ranked] == ["new-high", "old-high", "low"]
+
+        top = USCISAggregator._rank_updates(updates, 1)
+        assert [u.id for u in top] == ["new-high"]
@@ -0,0 +1,75 @@
+"""
+Unit tests for the SaaS generation API router.
+"""
+
+import pytest
+
+
+class StubEngine:
+    """ContentEngine stand-in that returns a canned result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.inputs = []
+
+    async def generate(self, input_data):
+        self.inputs.append(input_data)
+        return self.result
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """api router module with a stubbed ContentEngine."""
+    from src.app.routers import api as api_module
+    from src.intelligence.synthesis.content_engine import ContentOutput
+
+    engine = StubEngine(ContentOutput(
+        id="abc123",
+        topic="AI Agents",
+        word_count=812,
+        audio_duration_seconds=125.0,
+        newsletter_html_path="./output/abc123_newsletter.html",
+        newsletter_markdown_path="./output/abc123_newsletter.md",
+        podcast_audio_path="./output/audio/abc123_podcast.mp3",
+    ))
+    monkeypatch.setattr(api_module, "get_engine", lambda: engine)
+    monkeypatch.setattr(api_module, "engine", engine, raising=False)
+    return api_module
+
+
+class TestRunGeneration:
+    """Tests for _run_generation."""
+
+    async def test_result_includes_file_names(self, api):
+        """Test output paths are also returned as names under /files/."""
+        request = api.GenerateRequest(plan="bundle", topic="AI Agents")
+
+        result = await api._run_generation(request)
+
+        assert result["success"] is True
+        assert result["newsletter_html_file"] == "abc123_newsletter.html"
+        assert result["newsletter_markdown_file"] == "abc123_newsletter.md"
+        assert result["podcast_audio_file"] == "abc123_podcast.mp3"
+        assert result["audio_duration_display"] == "2:05"
+
+    async def test_missing_outputs_have_no_file_name(self, api):
+        """Test outputs that weren't produced come back as None."""
+        api.engine.result = api.engine.result.model_copy(update={
+            "newsletter_html_path": None,
+            "newsletter_markdown_path": None,
+            "podcast_audio_path": None,
+        })
+
+        result = await api._run_generation(api.GenerateRequest(plan="podcast"))
+
+        assert result["newsletter_html_file"] is None
+        assert result["newsletter_markdown_file"] is None
+        assert result["podcast_audio_file"] is None
+
+    async def test_plan_selects_outputs(self, api):
+        """Test the plan decides which outputs the engine is asked for."""
+        await api._run_generation(api.GenerateRequest(plan="newsletter"))
+
+        input_data = api.engine.inputs[-1]
+        assert input_data.generate_newsletter is True
+        assert input_data.generate_podcast is False
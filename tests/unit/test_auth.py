@@ -0,0 +1,91 @@
+"""
+Unit tests for the Supabase auth service.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeAdminAPI:
+    def __init__(self, signed_out: list):
+        self.signed_out = signed_out
+
+    def sign_out(self, jwt, scope="global"):
+        self.signed_out.append(jwt)
+
+
+class FakeAuthAPI:
+    """Stands in for client.auth; remembers the session it was given."""
+
+    def __init__(self, signed_out: list):
+        self.session = None
+        self.admin = FakeAdminAPI(signed_out)
+
+    def sign_in_with_password(self, credentials):
+        email = credentials["email"]
+        self.session = SimpleNamespace(
+            access_token=f"access-{email}",
+            refresh_token=f"refresh-{email}",
+        )
+        user = SimpleNamespace(id=email, email=email, user_metadata={})
+        return SimpleNamespace(user=user, session=self.session)
+
+    def sign_out(self):
+        raise AssertionError("session sign-out on a shared client")
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """AuthService backed by fake Supabase clients."""
+    from src.app import auth as auth_module
+
+    clients = []
+    signed_out = []
+
+    def fake_create_client(url, key, options=None):
+        assert options.persist_session is False
+        assert options.auto_refresh_token is False
+        client = SimpleNamespace(auth=FakeAuthAPI(signed_out))
+        clients.append(client)
+        return client
+
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_ANON_KEY", "anon-key")
+    monkeypatch.setattr(auth_module, "create_client", fake_create_client)
+
+    service = auth_module.AuthService()
+    service.clients = clients
+    service.signed_out = signed_out
+    return service
+
+
+class TestAuthSessions:
+    """Tests that users sharing one AuthService stay isolated."""
+
+    async def test_two_users_login_and_logout_independently(self, service):
+        """Test each login gets its own client and logout revokes only the caller."""
+        from src.app.auth import LoginRequest
+
+        alice = await service.login(LoginRequest(email="alice@example.com", password="pw"))
+        bob = await service.login(LoginRequest(email="bob@example.com", password="pw"))
+
+        assert alice.user.access_token == "access-alice@example.com"
+        assert bob.user.access_token == "access-bob@example.com"
+
+        # The shared client never holds either user's session
+        assert service.client.auth.session is None
+        assert len({id(c) for c in service.clients}) == 3
+
+        assert await service.logout(alice.user.access_token) is True
+
+        assert service.signed_out == ["access-alice@example.com"]
+
+    async def test_logout_without_service_fails_cleanly(self, monkeypatch):
+        """Test logout reports failure when Supabase isn't configured."""
+        from src.app.auth import AuthService
+
+        monkeypatch.delenv("SUPABASE_URL", raising=False)
+        monkeypatch.delenv("SUPABASE_ANON_KEY", raising=False)
+
+        assert await AuthService().logout("token") is False
@@ -7,6 +7,19 @@ import os
 from unittest.mock import patch, MagicMock
 
 
+class FakeRedis:
+    """Minimal in-memory Redis supporting SET NX EX."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, name, value, nx=False, ex=None):
+        if nx and name in self.data:
+            return None
+        self.data[name] = value
+        return True
+
+
 class TestBillingPricing:
     """Tests for billing pricing configuration."""
 
@@ -43,6 +56,32 @@ class TestBillingPricing:
         with pytest.raises(ValueError, match="Invalid plan"):
             get_price("nonexistent_plan")
 
+    def test_get_plan(self):
+        """Test get_plan returns plan info or None."""
+        from src.app.billing import STRIPE_PRICES, get_plan
+
+        assert get_plan("bundle") is STRIPE_PRICES["bundle"]
+        assert get_plan("nonexistent_plan") is None
+
+    def test_prices_read_only(self):
+        """Test the pricing table cannot be modified at runtime."""
+        from src.app.billing import STRIPE_PRICES
+
+        with pytest.raises(TypeError):
+            STRIPE_PRICES["free"] = {"price_cents": 0}
+
+    def test_plans_read_only(self):
+        """Test individual plans cannot be modified at runtime."""
+        from src.app.billing import STRIPE_PRICES, get_plan
+
+        for plan_id in STRIPE_PRICES:
+            with pytest.raises(TypeError):
+                get_plan(plan_id)["price_cents"] = 0
+            with pytest.raises(TypeError):
+                del get_plan(plan_id)["name"]
+
+        assert get_plan("bundle")["price_cents"] == 6900
+
     def test_format_price(self):
         """Test price formatting."""
         from src.app.billing import format_price
@@ -112,6 +151,15 @@ class TestCheckoutSession:
 class TestPaymentVerification:
     """Tests for payment verification."""
 
+    @pytest.fixture(autouse=True)
+    def clear_verify_cache(self):
+        """Reset the paid-session cache between tests."""
+        from src.app.billing import _verify_cache
+
+        _verify_cache.clear()
+        yield
+        _verify_cache.clear()
+
     def test_verify_paid_session(self):
         """Test verifying a paid session."""
         from src.app.billing import verify_payment
@@ -146,6 +194,41 @@ class TestPaymentVerification:
 
             assert result.paid is False
 
+    def test_verify_paid_session_is_cached(self):
+        """Test a paid session is only retrieved from Stripe once."""
+        from src.app.billing import verify_payment
+
+        with patch("stripe.checkout.Session.retrieve") as mock_retrieve:
+            mock_session = MagicMock()
+            mock_session.payment_status = "paid"
+            mock_session.metadata = {"plan": "bundle"}
+            mock_session.customer_details = None
+            mock_session.payment_intent = "pi_456"
+            mock_retrieve.return_value = mock_session
+
+            first = verify_payment("cs_test_cached")
+            second = verify_payment("cs_test_cached")
+
+            assert first == second
+            assert mock_retrieve.call_count == 1
+
+    def test_verify_unpaid_session_not_cached(self):
+        """Test unpaid sessions are re-checked on every call."""
+        from src.app.billing import verify_payment
+
+        with patch("stripe.checkout.Session.retrieve") as mock_retrieve:
+            mock_session = MagicMock()
+            mock_session.payment_status = "unpaid"
+            mock_session.metadata = {"plan": "podcast"}
+            mock_session.customer_details = None
+            mock_session.payment_intent = None
+            mock_retrieve.return_value = mock_session
+
+            verify_payment("cs_test_pending")
+            verify_payment("cs_test_pending")
+
+            assert mock_retrieve.call_count == 2
+
     def test_verify_stripe_error(self):
         """Test verification handles Stripe errors."""
         from src.app.billing import verify_payment
@@ -208,6 +291,87 @@ class TestWebhookHandling:
             assert "error" in result
             assert result["error"] == "Invalid signature"
 
+    @pytest.fixture
+    def dedup_store(self, monkeypatch):
+        """Point webhook dedup at a fresh store; returns a setter for it."""
+        from src.app import billing
+        from src.utils.cache import InMemoryCache
+
+        stores = [InMemoryCache()]
+        monkeypatch.setattr(billing, "get_cache", lambda: stores[0])
+        return lambda store: stores.__setitem__(0, store)
+
+    def redeliver(self, event_id):
+        """Handle a checkout.session.completed event with the given ID."""
+        from src.app.billing import handle_webhook
+
+        with patch("stripe.Webhook.construct_event") as mock_construct:
+            mock_construct.return_value = {
+                "id": event_id,
+                "type": "checkout.session.completed",
+                "data": {"object": {"id": "cs_test_dup", "metadata": {}}},
+            }
+            return handle_webhook(b"{}", "test_sig", "whsec_test")
+
+    def test_handle_duplicate_event(self, dedup_store):
+        """Test a redelivered event ID is short-circuited."""
+        from src.app.billing import handle_webhook
+
+        with patch("stripe.Webhook.construct_event") as mock_construct:
+            mock_construct.return_value = {
+                "id": "evt_dup_1",
+                "type": "checkout.session.completed",
+                "data": {"object": {"id": "cs_test_dup", "metadata": {}}},
+            }
+
+            first = handle_webhook(b"{}", "test_sig", "whsec_test")
+            second = handle_webhook(b"{}", "test_sig", "whsec_test")
+
+            assert first["event"] == "payment_completed"
+            assert second["event"] == "duplicate"
+
+    def test_duplicate_across_workers_redis(self, dedup_store):
+        """Test two workers' RedisCache instances sharing one Redis dedupe an event."""
+        from src.utils.cache import RedisCache
+
+        server = FakeRedis()
+        worker_a, worker_b = RedisCache(), RedisCache()
+        worker_a._client = worker_b._client = server
+
+        dedup_store(worker_a)
+        first = self.redeliver("evt_shared_redis")
+        dedup_store(worker_b)
+        second = self.redeliver("evt_shared_redis")
+
+        assert first["event"] == "payment_completed"
+        assert second["event"] == "duplicate"
+
+    def test_duplicate_across_workers_file(self, dedup_store, tmp_path):
+        """Test two workers' FileCache instances on one directory dedupe an event."""
+        from src.utils.cache import FileCache
+
+        dedup_store(FileCache(str(tmp_path)))
+        first = self.redeliver("evt_shared_file")
+        dedup_store(FileCache(str(tmp_path)))
+        second = self.redeliver("evt_shared_file")
+
+        assert first["event"] == "payment_completed"
+        assert second["event"] == "duplicate"
+
+    def test_dedup_falls_back_in_process(self, dedup_store):
+        """Test dedup still works in-process when the shared store fails."""
+        from src.app.billing import _seen_events
+
+        class BrokenStore:
+            def add(self, key, value, ttl=3600):
+                raise OSError("read-only file system")
+
+        _seen_events.pop("evt_fallback", None)
+        dedup_store(BrokenStore())
+
+        assert self.redeliver("evt_fallback")["event"] == "payment_completed"
+        assert self.redeliver("evt_fallback")["event"] == "duplicate"
+
     def test_handle_other_events(self):
         """Test handling non-checkout events."""
         from src.app.billing import handle_webhook
@@ -80,6 +80,23 @@ class TestInMemoryCache:
         stats = cache.stats()
         assert stats['size'] <= 10
 
+    def test_eviction_keeps_recently_used(self):
+        """Test eviction drops the least recently used entry first."""
+        from src.utils.cache import InMemoryCache
+
+        cache = InMemoryCache(max_size=3)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.set("c", 3, ttl=60)
+
+        # Touch "a" so "b" becomes the least recently used
+        assert cache.get("a") == 1
+        cache.set("d", 4, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("d") == 4
+
     def test_stats(self):
         """Test cache statistics."""
         from src.utils.cache import InMemoryCache
@@ -94,6 +111,25 @@ class TestInMemoryCache:
         assert stats['max_size'] == 100
 
 
+class TestCacheAdd:
+    """Tests for InMemoryCache.add."""
+
+    def test_add_only_if_absent(self):
+        """Test add refuses a live key but replaces an expired one."""
+        from src.utils.cache import InMemoryCache
+
+        cache = InMemoryCache(max_size=10)
+
+        assert cache.add("event", 1, ttl=60) is True
+        assert cache.add("event", 2, ttl=60) is False
+        assert cache.get("event") == 1
+
+        cache.set("stale", 1, ttl=1)
+        time.sleep(1.1)
+        assert cache.add("stale", 2, ttl=60) is True
+        assert cache.get("stale") == 2
+
+
 class TestFileCache:
     """Tests for FileCache."""
 
@@ -158,6 +194,22 @@ class TestFileCache:
             assert cache.get("key1") is None
             assert cache.get("key2") is None
 
+    def test_add_only_if_absent(self):
+        """Test add is shared by instances on one directory and skips expired entries."""
+        from src.utils.cache import FileCache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            worker_a = FileCache(cache_dir=tmpdir)
+            worker_b = FileCache(cache_dir=tmpdir)
+
+            assert worker_a.add("event", True, ttl=60) is True
+            assert worker_b.add("event", True, ttl=60) is False
+
+            worker_a.set("stale", True, ttl=1)
+            time.sleep(1.1)
+            assert worker_b.add("stale", "fresh", ttl=60) is True
+            assert worker_a.get("stale") == "fresh"
+
 
 class TestCacheDecorator:
     """Tests for cached decorator."""
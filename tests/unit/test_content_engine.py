@@ -0,0 +1,63 @@
+"""
+Unit tests for the unified content engine.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """ContentEngine with research stubbed out and no real generators."""
+    from src.intelligence.synthesis.content_engine import ContentEngine
+
+    engine = ContentEngine.__new__(ContentEngine)
+    engine.podcast_cancelled = False
+
+    async def research(input):
+        return SimpleNamespace(main_theme="AI Agents")
+
+    async def produce_newsletter(input, bundle, output, output_id):
+        await asyncio.sleep(0)
+        raise RuntimeError("newsletter model unavailable")
+
+    async def produce_podcast(input, bundle, output):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            engine.podcast_cancelled = True
+            raise
+
+    monkeypatch.setattr(engine, "_research_content", research, raising=False)
+    monkeypatch.setattr(engine, "_produce_newsletter", produce_newsletter, raising=False)
+    monkeypatch.setattr(engine, "_produce_podcast", produce_podcast, raising=False)
+    return engine
+
+
+class TestGenerate:
+    """Tests for ContentEngine.generate."""
+
+    async def test_failed_branch_cancels_the_other(self, engine):
+        """Test a newsletter failure stops the podcast branch instead of waiting for it."""
+        from src.intelligence.synthesis.content_engine import ContentInput
+
+        output = await asyncio.wait_for(engine.generate(ContentInput(topic="AI Agents")), 5)
+
+        assert output.success is False
+        assert output.errors == ["newsletter model unavailable"]
+        assert engine.podcast_cancelled is True
+
+    async def test_no_branches_requested(self, engine):
+        """Test generation with both outputs off still succeeds."""
+        from src.intelligence.synthesis.content_engine import ContentInput
+
+        output = await engine.generate(ContentInput(
+            topic="AI Agents",
+            generate_newsletter=False,
+            generate_podcast=False,
+        ))
+
+        assert output.success is True
+        assert output.topic == "AI Agents"
@@ -91,7 +91,7 @@ class TestEngagementScoring:
             score=100,
             num_comments=50,
             url="https://reddit.com/test",
-            created_utc=datetime.now(),
+            created_utc=datetime.now().timestamp(),
             author="user",
             permalink="/r/test",
         )
@@ -111,7 +111,7 @@ class TestEngagementScoring:
             score=0,
             num_comments=0,
             url="https://reddit.com/test",
-            created_utc=datetime.now(),
+            created_utc=datetime.now().timestamp(),
             author="user",
             permalink="/r/test",
         )
@@ -130,7 +130,7 @@ class TestEngagementScoring:
             score=-10,
             num_comments=5,
             url="https://reddit.com/test",
-            created_utc=datetime.now(),
+            created_utc=datetime.now().timestamp(),
             author="user",
             permalink="/r/test",
         )
@@ -158,7 +158,7 @@ class TestTopicClustering:
                 score=100,
                 num_comments=20,
                 url="https://reddit.com/p1",
-                created_utc=datetime.now(),
+                created_utc=datetime.now().timestamp(),
                 author="user1",
                 permalink="/r/immigration/p1",
             )
@@ -188,7 +188,7 @@ class TestTopicClustering:
                 score=100,
                 num_comments=50,
                 url="https://reddit.com/p1",
-                created_utc=datetime.now(),
+                created_utc=datetime.now().timestamp(),
                 author="user1",
                 permalink="/r/immigration/p1",
             )
@@ -282,7 +282,7 @@ class TestBreakingNewsDetection:
         ranker = ContentRanker()
 
         # Post from 2 hours ago with high engagement
-        recent_time = datetime.now() - timedelta(hours=2)
+        recent_time = (datetime.now() - timedelta(hours=2)).timestamp()
         posts = [
             RedditPost(
                 id="p1",
@@ -317,7 +317,7 @@ class TestBreakingNewsDetection:
         ranker = ContentRanker()
 
         # Post from 12 hours ago
-        old_time = datetime.now() - timedelta(hours=12)
+        old_time = (datetime.now() - timedelta(hours=12)).timestamp()
         posts = [
             RedditPost(
                 id="p1",
@@ -361,7 +361,7 @@ class TestTrendingDetection:
                 score=400,
                 num_comments=100,
                 url="https://reddit.com/p1",
-                created_utc=datetime.now(),
+                created_utc=datetime.now().timestamp(),
                 author="user",
                 permalink="/r/immigration/p1",
             )
@@ -390,7 +390,7 @@ class TestTrendingDetection:
                 score=50,
                 num_comments=20,
                 url="https://reddit.com/p1",
-                created_utc=datetime.now(),
+                created_utc=datetime.now().timestamp(),
                 author="user",
                 permalink="/r/immigration/p1",
             )
@@ -0,0 +1,27 @@
+"""
+Unit tests for shared CORS configuration.
+"""
+
+
+class TestCorsOptions:
+    """Tests for cors_options."""
+
+    def test_defaults_without_env(self, monkeypatch):
+        """Test default origins are used when CORS_ORIGINS is unset."""
+        from src.utils.cors import cors_options, DEFAULT_CORS_ORIGINS
+
+        monkeypatch.delenv("CORS_ORIGINS", raising=False)
+        options = cors_options()
+
+        assert options["allow_origins"] == DEFAULT_CORS_ORIGINS
+        assert "*" not in options["allow_origins"]
+        assert options["allow_credentials"] is False
+        assert options["max_age"] == 86400
+
+    def test_origins_from_env(self, monkeypatch):
+        """Test CORS_ORIGINS is split and trimmed."""
+        from src.utils.cors import cors_origins
+
+        monkeypatch.setenv("CORS_ORIGINS", "https://a.example, https://b.example,")
+
+        assert cors_origins() == ("https://a.example", "https://b.example")
@@ -0,0 +1,21 @@
+"""
+Unit tests for duration formatting.
+"""
+
+from src.utils.duration import format_duration
+
+
+class TestFormatDuration:
+    """Tests for format_duration."""
+
+    def test_formats_minutes_and_padded_seconds(self):
+        """Test seconds are zero-padded and fractions dropped."""
+        assert format_duration(0) == "0:00"
+        assert format_duration(5.9) == "0:05"
+        assert format_duration(65) == "1:05"
+        assert format_duration(3600) == "60:00"
+
+    def test_negative_and_missing_durations_show_zero(self):
+        """Test bad durations never render as negative times."""
+        assert format_duration(-5) == "0:00"
+        assert format_duration(None) == "0:00"
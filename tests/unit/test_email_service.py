@@ -0,0 +1,127 @@
+"""
+Unit tests for the email delivery service.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+
+class FakeSES:
+    """SES client stand-in that rejects some addresses."""
+
+    def __init__(self, rejected: set):
+        self.rejected = rejected
+        self.sent = []
+
+    def send_email(self, **kwargs):
+        to_email = kwargs["Destination"]["ToAddresses"][0]
+        if to_email in self.rejected:
+            raise RuntimeError(f"rejected {to_email}")
+        self.sent.append(to_email)
+        return {"MessageId": f"id-{to_email}"}
+
+
+@pytest.fixture
+def service(tmp_path):
+    """EmailService in demo mode, ready to have a provider patched in."""
+    from src.app.email_service import EmailService
+
+    return EmailService(output_dir=str(tmp_path))
+
+
+def newsletter(*emails):
+    """EmailMessage addressed to `emails`."""
+    from src.app.email_service import EmailMessage, EmailRecipient
+
+    return EmailMessage(
+        to=[EmailRecipient(email=email) for email in emails],
+        subject="Weekly digest",
+        html_content="<p>Hello</p>",
+        from_email="news@example.com",
+        from_name="PodcastOS",
+    )
+
+
+class TestPartialSends:
+    """Tests that one failed recipient doesn't fail the whole send."""
+
+    async def test_ses_reports_failed_recipients(self, service):
+        """Test SES keeps delivered recipients and lists the failed ones."""
+        service._ses = FakeSES(rejected={"b@example.com"})
+
+        result = await service._send_ses(
+            newsletter("a@example.com", "b@example.com", "c@example.com")
+        )
+
+        assert result.success is True
+        assert result.recipients_count == 2
+        assert result.failed_recipients == ["b@example.com"]
+        assert "rejected b@example.com" in result.error
+        assert service._ses.sent == ["a@example.com", "c@example.com"]
+
+    async def test_ses_all_failed(self, service):
+        """Test a send where no recipient got mail is a failure."""
+        service._ses = FakeSES(rejected={"a@example.com"})
+
+        result = await service._send_ses(newsletter("a@example.com"))
+
+        assert result.success is False
+        assert result.recipients_count == 0
+        assert result.failed_recipients == ["a@example.com"]
+
+    async def test_ses_full_success(self, service):
+        """Test a clean send has no failures or error."""
+        service._ses = FakeSES(rejected=set())
+
+        result = await service._send_ses(newsletter("a@example.com", "b@example.com"))
+
+        assert result.success is True
+        assert result.recipients_count == 2
+        assert result.failed_recipients == []
+        assert result.error is None
+        assert result.message_id == "id-a@example.com"
+
+    async def test_resend_failed_batch_only_fails_its_recipients(self, service, monkeypatch):
+        """Test a rejected Resend batch doesn't fail the batches that went out."""
+        from src.app import email_service
+
+        monkeypatch.setattr(email_service, "RESEND_BATCH_SIZE", 2)
+        request = httpx.Request("POST", email_service.RESEND_BATCH_URL)
+
+        async def fake_post(url, headers, batch):
+            if batch[0]["to"] == ["c@example.com"]:
+                return httpx.Response(500, request=request)
+            return httpx.Response(200, json={"data": [{"id": "msg-1"}]}, request=request)
+
+        monkeypatch.setattr(service, "_post", fake_post)
+
+        result = await service._send_resend(
+            newsletter("a@example.com", "b@example.com", "c@example.com", "d@example.com")
+        )
+
+        assert result.success is True
+        assert result.message_id == "msg-1"
+        assert result.recipients_count == 2
+        assert result.failed_recipients == ["c@example.com", "d@example.com"]
+
+
+class TestSubscriberList:
+    """Tests for the SQLite-backed subscriber list."""
+
+    async def test_concurrent_thread_access(self, tmp_path):
+        """Test the shared connection survives use from many worker threads."""
+        from src.app.email_service import SubscriberList
+
+        subscribers = SubscriberList(file_path=str(tmp_path / "subscribers.db"))
+        emails = [f"user{i}@example.com" for i in range(50)]
+
+        added = await asyncio.gather(
+            *(asyncio.to_thread(subscribers.add, email) for email in emails),
+            *(asyncio.to_thread(subscribers.count) for _ in emails),
+        )
+
+        assert all(added[:len(emails)])
+        assert sorted(subscribers.list_all()) == sorted(emails)
+        subscribers.close()
@@ -0,0 +1,98 @@
+"""
+Unit tests for precompressed HTML pages.
+"""
+
+import gzip
+
+from starlette.requests import Request
+
+
+def make_request(headers: dict) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+class TestMinifyHtml:
+    """Tests for minify_html."""
+
+    def test_collapses_whitespace_and_comments(self):
+        """Test comments are dropped and whitespace collapsed."""
+        from src.utils.html_page import minify_html
+
+        html = (
+            "<html>\n  <!-- note -->\n"
+            "  <style> /* c */ body {  color: red; } </style>\n"
+            "  <p>Hi   there</p>\n</html>"
+        )
+
+        assert minify_html(html) == (
+            "<html> <style>body { color: red; }</style> <p>Hi there</p> </html>"
+        )
+
+    def test_preserves_pre_and_script(self):
+        """Test whitespace-sensitive blocks are untouched."""
+        from src.utils.html_page import minify_html
+
+        html = "<pre>  a\n   b </pre>\n\n<script>\n  var x = 1; // keep\n</script>"
+
+        assert minify_html(html) == html.replace("</pre>\n\n<script>", "</pre> <script>")
+
+    def test_minify_css(self):
+        """Test stylesheet comments are dropped and whitespace collapsed."""
+        from src.utils.html_page import minify_css
+
+        assert minify_css("/* theme */\nbody {\n    color: red;\n}\n") == "body { color: red; }"
+
+
+class TestStaticPage:
+    """Tests for StaticPage responses."""
+
+    def test_gzip_when_accepted(self):
+        """Test gzip body is served to gzip clients."""
+        from src.utils.html_page import StaticPage
+
+        page = StaticPage("<p>hello</p>")
+        response = page.response(make_request({"Accept-Encoding": "gzip"}))
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(response.body) == b"<p>hello</p>"
+
+    def test_identity_without_accept_encoding(self):
+        """Test raw body is served when no encoding is accepted."""
+        from src.utils.html_page import StaticPage
+
+        page = StaticPage("<p>hello</p>")
+        response = page.response(make_request({}))
+
+        assert "content-encoding" not in response.headers
+        assert response.body == b"<p>hello</p>"
+
+    def test_not_modified(self):
+        """Test matching If-None-Match returns 304."""
+        from src.utils.html_page import StaticPage
+
+        page = StaticPage("<p>hello</p>")
+        response = page.response(make_request({"If-None-Match": page.etag}))
+
+        assert response.status_code == 304
+
+    def test_stylesheet_asset(self):
+        """Test a stylesheet is served with its media type and cache policy."""
+        from src.utils.html_page import IMMUTABLE, StaticPage, minify_css
+
+        page = StaticPage(
+            "a {  color: red; }",
+            cache_control=IMMUTABLE,
+            media_type="text/css; charset=utf-8",
+            minify=minify_css,
+        )
+        response = page.response(make_request({}))
+
+        assert response.body == b"a { color: red; }"
+        assert response.headers["content-type"] == "text/css; charset=utf-8"
+        assert response.headers["cache-control"] == IMMUTABLE
+        assert page.etag == f'"{page.version}"'
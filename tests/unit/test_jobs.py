@@ -0,0 +1,81 @@
+"""
+Unit tests for background generation jobs.
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def jobs(monkeypatch):
+    """jobs module backed by a private in-memory store."""
+    from src.app import jobs as jobs_module
+    from src.utils.cache import InMemoryCache
+
+    store = InMemoryCache()
+    monkeypatch.setattr(jobs_module, "get_job_store", lambda: store)
+    monkeypatch.setattr(jobs_module, "_generation_slots", None)
+    return jobs_module
+
+
+class TestGenerationJobs:
+    """Tests for submit_job / get_job."""
+
+    async def test_job_completes_with_result(self, jobs):
+        """Test a job goes from queued to completed with its result."""
+        job_id = await jobs.submit_job(lambda: asyncio.sleep(0, result={"success": True}))
+
+        assert (await jobs.get_job(job_id))["status"] == "queued"
+        await asyncio.gather(*jobs._tasks)
+
+        job = await jobs.get_job(job_id)
+        assert job["status"] == "completed"
+        assert job["result"] == {"success": True}
+
+    async def test_job_failure_is_recorded(self, jobs):
+        """Test an exception marks the job failed."""
+        async def boom():
+            raise RuntimeError("engine exploded")
+
+        job_id = await jobs.submit_job(boom)
+        await asyncio.gather(*jobs._tasks)
+
+        job = await jobs.get_job(job_id)
+        assert job["status"] == "failed"
+        assert "engine exploded" in job["error"]
+
+    async def test_cancel_jobs_marks_running_failed(self, jobs):
+        """Test shutdown cancels in-flight jobs and records it."""
+        job_id = await jobs.submit_job(lambda: asyncio.sleep(60))
+        await asyncio.sleep(0)
+
+        await jobs.cancel_jobs()
+
+        assert (await jobs.get_job(job_id))["status"] == "failed"
+
+    async def test_unknown_job(self, jobs):
+        """Test get_job returns None for unknown IDs."""
+        assert await jobs.get_job("missing") is None
+
+
+class TestJobStore:
+    """Tests for the job status store."""
+
+    async def test_clearing_research_cache_keeps_jobs(self, monkeypatch, tmp_path):
+        """Test invalidate_research_cache() doesn't drop job records."""
+        from src.app import jobs
+        from src.utils import cache
+
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        monkeypatch.setenv("JOBS_CACHE_DIR", str(tmp_path / "jobs"))
+        monkeypatch.setattr(cache, "_cache", cache.FileCache(str(tmp_path / "research")))
+        monkeypatch.setattr(jobs, "_job_store", None)
+        monkeypatch.setattr(jobs, "_generation_slots", None)
+
+        job_id = await jobs.submit_job(lambda: asyncio.sleep(60))
+        cache.invalidate_research_cache()
+
+        assert (await jobs.get_job(job_id))["status"] in ("queued", "running")
+        await jobs.cancel_jobs()
+        assert (await jobs.get_job(job_id))["status"] == "failed"
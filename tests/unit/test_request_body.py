@@ -0,0 +1,66 @@
+"""
+Unit tests for the raw JSON body dependency.
+"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, ConfigDict
+
+
+class Item(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    name: str
+    count: int = 1
+
+
+@pytest.fixture
+def client():
+    """App with one endpoint that takes an Item via json_body."""
+    from src.app.request_body import json_body
+
+    app = FastAPI()
+
+    @app.post("/items")
+    async def create_item(item: Item = Depends(json_body(Item))):
+        return {"name": item.name, "count": item.count}
+
+    return TestClient(app)
+
+
+class TestJsonBody:
+    """Tests for json_body."""
+
+    def test_valid_body(self, client):
+        """Test a valid body is parsed into the model."""
+        response = client.post("/items", content=b'{"name": "mic", "count": 2}')
+
+        assert response.status_code == 200
+        assert response.json() == {"name": "mic", "count": 2}
+
+    def test_malformed_json(self, client):
+        """Test malformed JSON is a 422 in FastAPI's error shape."""
+        response = client.post("/items", content=b'{"name": ')
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["type"] == "json_invalid"
+        assert error["loc"][0] == "body"
+        assert error["input"] == {}
+
+    def test_extra_fields_are_rejected(self, client):
+        """Test fields the model doesn't declare are rejected."""
+        response = client.post("/items", content=b'{"name": "mic", "admin": true}')
+
+        assert response.status_code == 422
+        error = response.json()["detail"][0]
+        assert error["type"] == "extra_forbidden"
+        assert error["loc"] == ["body", "admin"]
+
+    def test_non_utf8_body(self, client):
+        """Test a body that isn't UTF-8 is a 422, not a server error."""
+        response = client.post("/items", content=b"\xff\xfe\x00bad")
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
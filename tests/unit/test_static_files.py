@@ -0,0 +1,148 @@
+"""
+Unit tests for the static file mounts.
+"""
+
+import os
+
+import pytest
+
+
+def make_client(static_files):
+    """TestClient for an app serving `static_files` at /files."""
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    from starlette.testclient import TestClient
+
+    return TestClient(Starlette(routes=[Mount("/files", static_files)]))
+
+
+@pytest.fixture
+def files_dir(tmp_path):
+    """Directory with a small text artifact and a large audio file."""
+    (tmp_path / "newsletter.html").write_text("<p>first</p>")
+    (tmp_path / "episode.mp3").write_bytes(b"\x00" * (128 * 1024))
+    return tmp_path
+
+
+class TestCachedStaticFiles:
+    """Tests for CachedStaticFiles."""
+
+    def test_small_file_served_from_cache(self, files_dir):
+        """Test a small file is read once and then served from memory."""
+        from src.app.static_files import CachedStaticFiles
+
+        static = CachedStaticFiles(directory=str(files_dir), accel_prefix="")
+        client = make_client(static)
+        path = files_dir / "newsletter.html"
+
+        first = client.get("/files/newsletter.html")
+
+        # Same mtime, new bytes: only a cached copy still has the old body
+        stat = path.stat()
+        path.write_text("<p>other</p>")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        second = client.get("/files/newsletter.html")
+
+        assert first.text == "<p>first</p>"
+        assert second.text == "<p>first</p>"
+        assert second.headers["cache-control"] == "public, max-age=300"
+        assert "accept-ranges" not in second.headers
+
+    def test_mtime_change_busts_cache(self, files_dir):
+        """Test a rewritten file is re-read once its mtime changes."""
+        from src.app.static_files import CachedStaticFiles
+
+        client = make_client(CachedStaticFiles(directory=str(files_dir), accel_prefix=""))
+        path = files_dir / "newsletter.html"
+
+        client.get("/files/newsletter.html")
+        stat = path.stat()
+        path.write_text("<p>second</p>")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert client.get("/files/newsletter.html").text == "<p>second</p>"
+
+    def test_large_file_streams_from_disk(self, files_dir):
+        """Test files over SMALL_FILE_MAX_BYTES are not cached."""
+        from src.app.static_files import CachedStaticFiles
+
+        static = CachedStaticFiles(directory=str(files_dir), accel_prefix="")
+        response = make_client(static).get("/files/episode.mp3")
+
+        assert response.status_code == 200
+        assert len(response.content) == 128 * 1024
+        assert response.headers["accept-ranges"] == "bytes"
+        assert static._small_files.get(str(files_dir / "episode.mp3")) is None
+
+    def test_large_file_handed_to_nginx(self, files_dir):
+        """Test accel_prefix turns large files into an empty X-Accel-Redirect response."""
+        from src.app.static_files import CachedStaticFiles
+
+        static = CachedStaticFiles(directory=str(files_dir), accel_prefix="/_protected/files/")
+        response = make_client(static).get("/files/episode.mp3")
+
+        assert response.status_code == 200
+        assert response.headers["x-accel-redirect"] == "/_protected/files/episode.mp3"
+        assert response.content == b""
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert "etag" not in response.headers
+
+    def test_small_file_ignores_accel_prefix(self, files_dir):
+        """Test small files are still served from memory behind nginx."""
+        from src.app.static_files import CachedStaticFiles
+
+        static = CachedStaticFiles(directory=str(files_dir), accel_prefix="/_protected/files")
+        response = make_client(static).get("/files/newsletter.html")
+
+        assert "x-accel-redirect" not in response.headers
+        assert response.text == "<p>first</p>"
+
+
+@pytest.fixture
+def assets_dir(tmp_path):
+    """App asset with .br and .gz siblings, plus one with no siblings."""
+    (tmp_path / "app.js").write_text("console.log('plain');")
+    (tmp_path / "app.js.br").write_bytes(b"brotli-bytes")
+    (tmp_path / "app.js.gz").write_bytes(b"gzip-bytes")
+    (tmp_path / "plain.css").write_text("body{}")
+    return tmp_path
+
+
+class TestPrecompressedStaticFiles:
+    """Tests for PrecompressedStaticFiles."""
+
+    def get(self, assets_dir, path, accept_encoding):
+        """GET `path` and return the response with its undecoded body."""
+        from src.app.static_files import PrecompressedStaticFiles
+
+        client = make_client(PrecompressedStaticFiles(directory=str(assets_dir)))
+        # Raw stream, so the test client doesn't decode the fake payloads
+        with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as r:
+            return r, b"".join(r.iter_raw())
+
+    def test_prefers_brotli(self, assets_dir):
+        """Test the .br sibling wins when the client accepts both encodings."""
+        response, body = self.get(assets_dir, "/files/app.js", "gzip, deflate, br")
+
+        assert body == b"brotli-bytes"
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert "javascript" in response.headers["content-type"]
+
+    def test_gzip_when_brotli_not_accepted(self, assets_dir):
+        """Test the .gz sibling is served to gzip-only clients."""
+        response, body = self.get(assets_dir, "/files/app.js", "gzip")
+
+        assert body == b"gzip-bytes"
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_plain_file_fallback(self, assets_dir):
+        """Test the plain file is served without an accepted encoding or sibling."""
+        response, body = self.get(assets_dir, "/files/app.js", "identity")
+        assert body == b"console.log('plain');"
+        assert "content-encoding" not in response.headers
+
+        response, body = self.get(assets_dir, "/files/plain.css", "gzip, br")
+        assert body == b"body{}"
+        assert "content-encoding" not in response.headers
@@ -221,6 +221,16 @@ class TestValidateEmail:
 class TestJobIdValidation:
     """Tests for validate_job_id function."""
 
+    def test_is_job_id(self):
+        """Test generation job IDs are recognised by shape."""
+        import secrets
+
+        from src.utils.validation import is_job_id
+
+        assert is_job_id(secrets.token_urlsafe(12))
+        assert not is_job_id("short")
+        assert not is_job_id("../../etc/passwd")
+
     def test_valid_job_ids(self):
         """Test valid job IDs pass validation."""
         from src.utils.validation import validate_job_id
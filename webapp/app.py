@@ -5,6 +5,7 @@ A comprehensive webapp for managing podcast generation workflows.
 
 import os
 import sys
+import hashlib
 from pathlib import Path
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, send_file
@@ -21,6 +22,7 @@ from webapp.models import (
     Newsletter, init_db
 )
 from webapp.services.generation_service import GenerationService
+from src.utils.html_page import IMMUTABLE
 from src.intelligence.synthesis.content_engine import ContentEngine, ContentInput
 import asyncio
 from flask import send_from_directory
@@ -42,6 +44,30 @@ def after_request_rate_limit(response):
     """Add rate limit headers to all responses."""
     return add_rate_limit_headers(response)
 
+# Shared page script (static/js/app.js), linked with its content hash so
+# browsers fetch and compile it once for every page
+APP_JS_VERSION = hashlib.blake2b(
+    (Path(app.static_folder) / 'js' / 'app.js').read_bytes(), digest_size=8
+).hexdigest()
+
+
+@app.context_processor
+def inject_asset_versions():
+    """Expose static asset versions to templates."""
+    return {'app_js_version': APP_JS_VERSION}
+
+
+@app.after_request
+def cache_versioned_static(response):
+    """Versioned static URLs never change content, so cache them for good."""
+    if (
+        response.status_code == 200
+        and request.path.startswith('/static/')
+        and request.args.get('v')
+    ):
+        response.headers['Cache-Control'] = IMMUTABLE
+    return response
+
 # Register blueprints
 app.register_blueprint(wizard_api)
 
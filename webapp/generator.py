@@ -303,11 +303,11 @@ async def run_generation_pipeline(job_id: str, profile_id: int, options: dict =
         integration.update_job_status(job_id, current_stage='content_gathering', progress=10)
 
         from src.aggregators import ContentRanker
-        ranker = ContentRanker(
+        async with ContentRanker(
             supabase_url=os.getenv("SUPABASE_URL"),
             supabase_key=os.getenv("SUPABASE_SERVICE_KEY"),
-        )
-        topics = await ranker.get_ranked_topics(limit=context['profile']['topic_count'])
+        ) as ranker:
+            topics = await ranker.get_ranked_topics(limit=context['profile']['topic_count'])
 
         integration.update_job_status(job_id, stage_completed='content_gathering', progress=20)
 
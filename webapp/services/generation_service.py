@@ -195,6 +195,7 @@ class GenerationService:
                 db.commit()
                 logger.info(f"[{job_id}] {message}")
 
+        engine = None
         try:
             # START
             update_job(status='running', current_stage='initializing', progress_percent=5, started_at=datetime.utcnow())
@@ -497,6 +498,8 @@ Category: {topic.category}
             db.rollback()
             logger.error(f"[{job_id}] Generation failed: {e}\n{error_trace}")
         finally:
+            if engine is not None:
+                await engine.aclose()
             db.close()
 
     async def _finish_audio_generation(self, job_id, profile_id, options, engine, episode_id, log_activity=None):
@@ -0,0 +1,682 @@
+// Mobile Menu Toggle
+const mobileMenuBtn = document.getElementById('mobile-menu-btn');
+const sidebar = document.getElementById('sidebar');
+const sidebarOverlay = document.getElementById('sidebar-overlay');
+
+function openMobileMenu() {
+    sidebar.classList.add('open');
+    sidebarOverlay.classList.add('active');
+    mobileMenuBtn.setAttribute('aria-expanded', 'true');
+    mobileMenuBtn.innerHTML = '<i class="fas fa-times"></i>';
+    document.body.style.overflow = 'hidden';
+}
+
+function closeMobileMenu() {
+    sidebar.classList.remove('open');
+    sidebarOverlay.classList.remove('active');
+    mobileMenuBtn.setAttribute('aria-expanded', 'false');
+    mobileMenuBtn.innerHTML = '<i class="fas fa-bars"></i>';
+    document.body.style.overflow = '';
+}
+
+mobileMenuBtn.addEventListener('click', () => {
+    if (sidebar.classList.contains('open')) {
+        closeMobileMenu();
+    } else {
+        openMobileMenu();
+    }
+});
+
+sidebarOverlay.addEventListener('click', closeMobileMenu);
+
+// Close menu on escape key
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape' && sidebar.classList.contains('open')) {
+        closeMobileMenu();
+    }
+});
+
+// Toast Notification System
+const toastContainer = document.getElementById('toast-container');
+
+function showToast(type, title, message, duration = 5000) {
+    const toast = document.createElement('div');
+    toast.className = `toast ${type}`;
+
+    const icons = {
+        success: 'fa-check-circle',
+        error: 'fa-exclamation-circle',
+        warning: 'fa-exclamation-triangle',
+        info: 'fa-info-circle'
+    };
+
+    toast.innerHTML = `
+        <i class="fas ${icons[type]} toast-icon"></i>
+        <div class="toast-content">
+            <div class="toast-title">${title}</div>
+            ${message ? `<div class="toast-message">${message}</div>` : ''}
+        </div>
+        <button class="toast-close" aria-label="Close notification">&times;</button>
+    `;
+
+    toastContainer.appendChild(toast);
+
+    // Announce to screen readers
+    const announcer = document.getElementById('status-announcer');
+    announcer.textContent = `${type}: ${title}. ${message || ''}`;
+
+    // Close button
+    toast.querySelector('.toast-close').addEventListener('click', () => {
+        removeToast(toast);
+    });
+
+    // Auto remove
+    if (duration > 0) {
+        setTimeout(() => removeToast(toast), duration);
+    }
+
+    return toast;
+}
+
+function removeToast(toast) {
+    toast.style.animation = 'slideIn 0.3s ease reverse';
+    setTimeout(() => toast.remove(), 300);
+}
+
+// Expose globally
+window.showToast = showToast;
+
+// Form Validation Helpers
+function validateField(input, rules) {
+    const value = input.value.trim();
+    let isValid = true;
+    let errorMessage = '';
+
+    if (rules.required && !value) {
+        isValid = false;
+        errorMessage = 'This field is required';
+    } else if (rules.minLength && value.length < rules.minLength) {
+        isValid = false;
+        errorMessage = `Minimum ${rules.minLength} characters required`;
+    } else if (rules.maxLength && value.length > rules.maxLength) {
+        isValid = false;
+        errorMessage = `Maximum ${rules.maxLength} characters allowed`;
+    } else if (rules.pattern && !rules.pattern.test(value)) {
+        isValid = false;
+        errorMessage = rules.patternMessage || 'Invalid format';
+    }
+
+    // Update UI
+    input.classList.toggle('error', !isValid);
+    input.classList.toggle('success', isValid && value);
+
+    // Update error message
+    let errorEl = input.parentElement.querySelector('.form-error');
+    if (!isValid) {
+        if (!errorEl) {
+            errorEl = document.createElement('div');
+            errorEl.className = 'form-error';
+            input.parentElement.appendChild(errorEl);
+        }
+        errorEl.innerHTML = `<i class="fas fa-exclamation-circle"></i> ${errorMessage}`;
+    } else if (errorEl) {
+        errorEl.remove();
+    }
+
+    return isValid;
+}
+
+// Character Counter
+function initCharCounter(input, maxLength) {
+    const counter = document.createElement('div');
+    counter.className = 'char-counter';
+    input.parentElement.appendChild(counter);
+
+    function updateCounter() {
+        const remaining = maxLength - input.value.length;
+        counter.textContent = `${input.value.length}/${maxLength}`;
+        counter.classList.toggle('warning', remaining < maxLength * 0.2 && remaining > 0);
+        counter.classList.toggle('error', remaining <= 0);
+    }
+
+    input.addEventListener('input', updateCounter);
+    updateCounter();
+}
+
+// Expose helpers globally
+window.validateField = validateField;
+window.initCharCounter = initCharCounter;
+
+// Confirmation Dialog
+function showConfirm(options) {
+    return new Promise((resolve) => {
+        const overlay = document.createElement('div');
+        overlay.className = 'modal-overlay active';
+        overlay.innerHTML = `
+            <div class="modal" role="dialog" aria-modal="true" aria-labelledby="confirm-title">
+                <div class="modal-body">
+                    <div class="confirm-dialog">
+                        <div class="confirm-icon ${options.type || 'warning'}">
+                            <i class="fas ${options.type === 'error' ? 'fa-trash' : 'fa-exclamation-triangle'}"></i>
+                        </div>
+                        <h3 id="confirm-title" style="margin-bottom: var(--space-sm);">${options.title}</h3>
+                        <p class="text-secondary">${options.message}</p>
+                    </div>
+                </div>
+                <div class="modal-footer" style="justify-content: center;">
+                    <button class="btn btn-secondary" data-action="cancel">${options.cancelText || 'Cancel'}</button>
+                    <button class="btn ${options.type === 'error' ? 'btn-error' : 'btn-primary'}" data-action="confirm">${options.confirmText || 'Confirm'}</button>
+                </div>
+            </div>
+        `;
+
+        document.body.appendChild(overlay);
+
+        overlay.querySelector('[data-action="cancel"]').addEventListener('click', () => {
+            overlay.remove();
+            resolve(false);
+        });
+
+        overlay.querySelector('[data-action="confirm"]').addEventListener('click', () => {
+            overlay.remove();
+            resolve(true);
+        });
+
+        overlay.addEventListener('click', (e) => {
+            if (e.target === overlay) {
+                overlay.remove();
+                resolve(false);
+            }
+        });
+
+        // Focus trap
+        overlay.querySelector('[data-action="cancel"]').focus();
+    });
+}
+
+window.showConfirm = showConfirm;
+
+// Auto-convert flash messages to toasts
+document.querySelectorAll('.flash').forEach(flash => {
+    const category = flash.classList.contains('success') ? 'success' :
+                    flash.classList.contains('error') ? 'error' :
+                    flash.classList.contains('warning') ? 'warning' : 'info';
+    const message = flash.textContent.trim();
+    showToast(category, category.charAt(0).toUpperCase() + category.slice(1), message);
+});
+
+// ============================================================
+// GLOBAL KEYBOARD SHORTCUTS & COMMAND PALETTE
+// ============================================================
+
+// Command palette actions
+const commandPaletteActions = [
+    { id: 'home', label: 'Go to Dashboard', icon: 'fa-home', shortcut: 'G D', action: () => window.location.href = '/' },
+    { id: 'podcasts', label: 'Go to Podcasts', icon: 'fa-podcast', shortcut: 'G P', action: () => window.location.href = '/profiles' },
+    { id: 'episodes', label: 'Go to Episodes', icon: 'fa-microphone', shortcut: 'G E', action: () => window.location.href = '/episodes' },
+    { id: 'newsletters', label: 'Go to Newsletters', icon: 'fa-newspaper', shortcut: 'G N', action: () => window.location.href = '/newsletters' },
+    { id: 'jobs', label: 'Go to Jobs', icon: 'fa-tasks', shortcut: 'G J', action: () => window.location.href = '/jobs' },
+    { id: 'settings', label: 'Open Settings', icon: 'fa-cog', shortcut: '⌘ ,', action: () => window.location.href = '/settings' },
+    { id: 'new-podcast', label: 'Create New Podcast', icon: 'fa-plus', shortcut: 'N P', action: () => window.location.href = '/profiles/new' },
+    { id: 'help', label: 'Show Keyboard Shortcuts', icon: 'fa-keyboard', shortcut: '?', action: () => showKeyboardHelp() },
+];
+
+// Create Command Palette HTML
+function createCommandPalette() {
+    const palette = document.createElement('div');
+    palette.id = 'command-palette';
+    palette.className = 'command-palette';
+    palette.innerHTML = `
+        <div class="command-palette-backdrop"></div>
+        <div class="command-palette-dialog">
+            <div class="command-palette-header">
+                <i class="fas fa-search"></i>
+                <input type="text" id="command-search" placeholder="Search commands..." autocomplete="off">
+                <span class="command-palette-hint">ESC to close</span>
+            </div>
+            <div class="command-palette-results" id="command-results"></div>
+        </div>
+    `;
+    document.body.appendChild(palette);
+
+    // Add styles
+    const style = document.createElement('style');
+    style.textContent = `
+        .command-palette {
+            display: none;
+            position: fixed;
+            inset: 0;
+            z-index: 1000;
+            align-items: flex-start;
+            justify-content: center;
+            padding-top: 15vh;
+        }
+        .command-palette.active { display: flex; }
+        .command-palette-backdrop {
+            position: absolute;
+            inset: 0;
+            background: rgba(0,0,0,0.5);
+            backdrop-filter: blur(4px);
+        }
+        .command-palette-dialog {
+            position: relative;
+            width: 100%;
+            max-width: 560px;
+            background: var(--bg-primary);
+            border-radius: var(--radius-lg);
+            box-shadow: var(--shadow-xl);
+            overflow: hidden;
+            margin: 0 var(--space-md);
+        }
+        .command-palette-header {
+            display: flex;
+            align-items: center;
+            gap: var(--space-md);
+            padding: var(--space-md) var(--space-lg);
+            border-bottom: 1px solid var(--border-color);
+        }
+        .command-palette-header i { color: var(--text-secondary); }
+        .command-palette-header input {
+            flex: 1;
+            border: none;
+            background: none;
+            font-size: 1rem;
+            outline: none;
+        }
+        .command-palette-hint {
+            font-size: 0.75rem;
+            color: var(--text-tertiary);
+            padding: var(--space-xs) var(--space-sm);
+            background: var(--bg-tertiary);
+            border-radius: var(--radius-sm);
+        }
+        .command-palette-results {
+            max-height: 400px;
+            overflow-y: auto;
+        }
+        .command-item {
+            display: flex;
+            align-items: center;
+            gap: var(--space-md);
+            padding: var(--space-md) var(--space-lg);
+            cursor: pointer;
+            transition: background var(--transition-fast);
+        }
+        .command-item:hover, .command-item.selected {
+            background: var(--bg-secondary);
+        }
+        .command-icon {
+            width: 32px;
+            height: 32px;
+            border-radius: var(--radius-sm);
+            background: var(--bg-tertiary);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: var(--text-secondary);
+        }
+        .command-item.selected .command-icon {
+            background: var(--accent);
+            color: white;
+        }
+        .command-label { flex: 1; font-weight: 500; }
+        .command-shortcut {
+            font-size: 0.75rem;
+            color: var(--text-tertiary);
+            display: flex;
+            gap: var(--space-xs);
+        }
+        .command-shortcut span {
+            padding: 2px 6px;
+            background: var(--bg-tertiary);
+            border-radius: var(--radius-sm);
+            font-family: monospace;
+        }
+        .keyboard-help-grid {
+            display: grid;
+            grid-template-columns: repeat(2, 1fr);
+            gap: var(--space-md);
+            padding: var(--space-lg);
+        }
+        @media (max-width: 640px) {
+            .keyboard-help-grid { grid-template-columns: 1fr; }
+        }
+        .shortcut-category {
+            font-weight: 600;
+            margin-bottom: var(--space-sm);
+            color: var(--text-secondary);
+            font-size: 0.85rem;
+        }
+        .shortcut-row {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: var(--space-sm) 0;
+        }
+        .shortcut-keys span {
+            padding: 2px 6px;
+            background: var(--bg-tertiary);
+            border: 1px solid var(--border-color);
+            border-radius: var(--radius-sm);
+            font-size: 0.75rem;
+            font-family: monospace;
+            margin-left: 2px;
+        }
+    `;
+    document.head.appendChild(style);
+
+    return palette;
+}
+
+// Initialize command palette
+const commandPalette = createCommandPalette();
+const commandSearch = document.getElementById('command-search');
+const commandResults = document.getElementById('command-results');
+let selectedIndex = 0;
+let filteredActions = [...commandPaletteActions];
+
+function renderCommands(actions) {
+    filteredActions = actions;
+    selectedIndex = 0;
+    commandResults.innerHTML = actions.map((action, index) => `
+        <div class="command-item ${index === 0 ? 'selected' : ''}" data-index="${index}">
+            <div class="command-icon"><i class="fas ${action.icon}"></i></div>
+            <span class="command-label">${action.label}</span>
+            <div class="command-shortcut">
+                ${action.shortcut.split(' ').map(k => `<span>${k}</span>`).join('')}
+            </div>
+        </div>
+    `).join('');
+
+    // Click handlers
+    commandResults.querySelectorAll('.command-item').forEach((item, idx) => {
+        item.addEventListener('click', () => executeCommand(idx));
+    });
+}
+
+function filterCommands(query) {
+    const q = query.toLowerCase();
+    const filtered = commandPaletteActions.filter(action =>
+        action.label.toLowerCase().includes(q) ||
+        action.shortcut.toLowerCase().includes(q)
+    );
+    renderCommands(filtered);
+}
+
+// Keystrokes re-render the results at most once per frame; keyboard
+// navigation flushes a pending render so it never acts on a stale list
+let filterFrame = 0;
+
+function scheduleFilter() {
+    if (!filterFrame) filterFrame = requestAnimationFrame(flushFilter);
+}
+
+function flushFilter() {
+    cancelAnimationFrame(filterFrame);
+    filterFrame = 0;
+    filterCommands(commandSearch.value);
+}
+
+function executeCommand(index) {
+    if (filteredActions[index]) {
+        closeCommandPalette();
+        filteredActions[index].action();
+    }
+}
+
+function openCommandPalette() {
+    commandPalette.classList.add('active');
+    commandSearch.value = '';
+    cancelAnimationFrame(filterFrame);
+    filterFrame = 0;
+    renderCommands(commandPaletteActions);
+    commandSearch.focus();
+}
+
+function closeCommandPalette() {
+    commandPalette.classList.remove('active');
+}
+
+// Command palette event listeners
+commandSearch.addEventListener('input', scheduleFilter);
+
+commandSearch.addEventListener('keydown', (e) => {
+    if (filterFrame && ['ArrowDown', 'ArrowUp', 'Enter'].includes(e.key)) flushFilter();
+
+    if (e.key === 'ArrowDown') {
+        e.preventDefault();
+        selectedIndex = Math.min(selectedIndex + 1, filteredActions.length - 1);
+        updateSelection();
+    } else if (e.key === 'ArrowUp') {
+        e.preventDefault();
+        selectedIndex = Math.max(selectedIndex - 1, 0);
+        updateSelection();
+    } else if (e.key === 'Enter') {
+        e.preventDefault();
+        executeCommand(selectedIndex);
+    }
+});
+
+function updateSelection() {
+    commandResults.querySelectorAll('.command-item').forEach((item, idx) => {
+        item.classList.toggle('selected', idx === selectedIndex);
+        if (idx === selectedIndex) item.scrollIntoView({ block: 'nearest' });
+    });
+}
+
+commandPalette.querySelector('.command-palette-backdrop').addEventListener('click', closeCommandPalette);
+
+// Keyboard Help Modal
+function showKeyboardHelp() {
+    const overlay = document.createElement('div');
+    overlay.className = 'modal-overlay active';
+    overlay.innerHTML = `
+        <div class="modal" style="max-width: 600px;">
+            <div class="modal-header">
+                <h3 class="modal-title"><i class="fas fa-keyboard"></i> Keyboard Shortcuts</h3>
+                <button class="btn btn-ghost btn-sm" onclick="this.closest('.modal-overlay').remove()">
+                    <i class="fas fa-times"></i>
+                </button>
+            </div>
+            <div class="keyboard-help-grid">
+                <div>
+                    <div class="shortcut-category">Navigation</div>
+                    <div class="shortcut-row">
+                        <span>Go to Dashboard</span>
+                        <div class="shortcut-keys"><span>G</span><span>D</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>Go to Podcasts</span>
+                        <div class="shortcut-keys"><span>G</span><span>P</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>Go to Episodes</span>
+                        <div class="shortcut-keys"><span>G</span><span>E</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>Go to Jobs</span>
+                        <div class="shortcut-keys"><span>G</span><span>J</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>Go to Settings</span>
+                        <div class="shortcut-keys"><span>⌘</span><span>,</span></div>
+                    </div>
+                </div>
+                <div>
+                    <div class="shortcut-category">Actions</div>
+                    <div class="shortcut-row">
+                        <span>Command Palette</span>
+                        <div class="shortcut-keys"><span>⌘</span><span>K</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>New Podcast</span>
+                        <div class="shortcut-keys"><span>N</span><span>P</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>Show Help</span>
+                        <div class="shortcut-keys"><span>?</span></div>
+                    </div>
+                    <div class="shortcut-category" style="margin-top: var(--space-md);">Audio Player</div>
+                    <div class="shortcut-row">
+                        <span>Play/Pause</span>
+                        <div class="shortcut-keys"><span>Space</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>Skip 15s</span>
+                        <div class="shortcut-keys"><span>←</span><span>→</span></div>
+                    </div>
+                    <div class="shortcut-row">
+                        <span>Mute</span>
+                        <div class="shortcut-keys"><span>M</span></div>
+                    </div>
+                </div>
+            </div>
+            <div class="modal-footer">
+                <button class="btn btn-primary" onclick="this.closest('.modal-overlay').remove()">Got it</button>
+            </div>
+        </div>
+    `;
+    document.body.appendChild(overlay);
+}
+
+// Global keyboard shortcuts
+let lastKey = '';
+let lastKeyTime = 0;
+
+document.addEventListener('keydown', (e) => {
+    // Ignore if typing in input
+    if (e.target.matches('input, textarea, select')) return;
+
+    const now = Date.now();
+    const key = e.key.toLowerCase();
+
+    // Command palette (Cmd+K or Ctrl+K)
+    if ((e.metaKey || e.ctrlKey) && key === 'k') {
+        e.preventDefault();
+        openCommandPalette();
+        return;
+    }
+
+    // Settings (Cmd+,)
+    if ((e.metaKey || e.ctrlKey) && key === ',') {
+        e.preventDefault();
+        window.location.href = '/settings';
+        return;
+    }
+
+    // Escape - close command palette
+    if (key === 'escape') {
+        closeCommandPalette();
+        return;
+    }
+
+    // Help
+    if (key === '?' && e.shiftKey) {
+        showKeyboardHelp();
+        return;
+    }
+
+    // Two-key shortcuts (within 500ms)
+    if (now - lastKeyTime < 500) {
+        const combo = lastKey + key;
+
+        switch (combo) {
+            case 'gd': window.location.href = '/'; break;
+            case 'gp': window.location.href = '/profiles'; break;
+            case 'ge': window.location.href = '/episodes'; break;
+            case 'gn': window.location.href = '/newsletters'; break;
+            case 'gj': window.location.href = '/jobs'; break;
+            case 'np': window.location.href = '/profiles/new'; break;
+        }
+
+        lastKey = '';
+        lastKeyTime = 0;
+    } else {
+        lastKey = key;
+        lastKeyTime = now;
+    }
+});
+
+// Expose keyboard help globally
+window.showKeyboardHelp = showKeyboardHelp;
+
+// ============================================================
+// FORM VALIDATION FEEDBACK
+// ============================================================
+
+// Enhanced validation with toast notifications
+document.querySelectorAll('form').forEach(form => {
+    form.addEventListener('invalid', function(e) {
+        e.preventDefault();
+        const field = e.target;
+        const fieldName = field.labels?.[0]?.textContent?.replace('*', '').trim() ||
+                          field.name || field.placeholder || 'Field';
+
+        // Build validation message
+        let message = '';
+        if (field.validity.valueMissing) {
+            message = `${fieldName} is required`;
+        } else if (field.validity.typeMismatch) {
+            message = `Please enter a valid ${field.type}`;
+        } else if (field.validity.tooShort) {
+            message = `${fieldName} must be at least ${field.minLength} characters`;
+        } else if (field.validity.tooLong) {
+            message = `${fieldName} must be no more than ${field.maxLength} characters`;
+        } else if (field.validity.patternMismatch) {
+            message = field.title || `${fieldName} format is invalid`;
+        } else {
+            message = field.validationMessage || `${fieldName} is invalid`;
+        }
+
+        // Show toast (only once per form submission)
+        if (!form.dataset.validationToastShown) {
+            showToast('warning', 'Validation Error', message);
+            form.dataset.validationToastShown = 'true';
+            setTimeout(() => delete form.dataset.validationToastShown, 100);
+        }
+
+        // Focus and highlight the invalid field
+        field.focus();
+        field.classList.add('shake');
+        setTimeout(() => field.classList.remove('shake'), 500);
+    }, true);
+});
+
+// ============================================================
+// GLOBAL FORM LOADING STATES
+// ============================================================
+
+// Add loading state to forms on submit
+document.querySelectorAll('form:not(.no-loading)').forEach(form => {
+    form.addEventListener('submit', function(e) {
+        // Skip if already loading or if form has prevent-loading class
+        if (form.classList.contains('loading')) return;
+
+        const submitBtn = form.querySelector('button[type="submit"], input[type="submit"]');
+        if (submitBtn && !submitBtn.classList.contains('no-loading')) {
+            submitBtn.classList.add('loading');
+            submitBtn.disabled = true;
+
+            // Store original text
+            if (!submitBtn.dataset.originalText) {
+                submitBtn.dataset.originalText = submitBtn.innerHTML;
+            }
+        }
+
+        form.classList.add('loading');
+    });
+});
+
+// Add required field indicators
+document.querySelectorAll('input[required], select[required], textarea[required]').forEach(field => {
+    const label = field.closest('.form-group')?.querySelector('label') ||
+                  document.querySelector(`label[for="${field.id}"]`);
+    if (label && !label.querySelector('.required-indicator')) {
+        const indicator = document.createElement('span');
+        indicator.className = 'required-indicator';
+        indicator.textContent = ' *';
+        indicator.style.color = 'var(--error)';
+        indicator.setAttribute('aria-hidden', 'true');
+        label.appendChild(indicator);
+    }
+});